@@ -1,11 +1,39 @@
 """A python library to connect and interact with KE-chain."""
+import importlib
 import sys
+from typing import TYPE_CHECKING
 
 from .__about__ import version
-from .client import Client
-from .helpers import get_project
 
-__all__ = ("Client", "get_project", "version")
+if TYPE_CHECKING:
+    from .async_client import AsyncClient
+    from .client import Client
+    from .helpers import get_project
+
+__all__ = ("AsyncClient", "Client", "get_project", "version")
+
+# The clients are imported on first access (PEP 562), so `import pykechain` stays fast and eg.
+# `from pykechain import Client` does not import `asyncio` for the `AsyncClient`.
+_LAZY_IMPORTS = {
+    "AsyncClient": ".async_client",
+    "Client": ".client",
+    "get_project": ".helpers",
+}
+
+
+def __getattr__(name):
+    try:
+        module = _LAZY_IMPORTS[name]
+    except KeyError:
+        raise AttributeError(f"module '{__name__}' has no attribute '{name}'") from None
+    value = getattr(importlib.import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
+
 
 if sys.version_info.major == 2 or (
     sys.version_info.major == 3 and sys.version_info.minor < 7
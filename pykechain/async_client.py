@@ -0,0 +1,202 @@
+import asyncio
+import functools
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Optional
+
+from pykechain.client import Client
+from pykechain.defaults import ASYNC_CLIENT_MAX_WORKERS
+
+
+def _awaitable(method_name: str) -> Callable:
+    """Create an awaitable counterpart of the `Client` method with the name `method_name`."""
+    sync_method = getattr(Client, method_name)
+
+    @functools.wraps(sync_method)
+    async def method(self: "AsyncClient", *args, **kwargs):
+        return await self.run(getattr(self.client, method_name), *args, **kwargs)
+
+    return method
+
+
+class AsyncClient:
+    """The asyncio counterpart of the KE-chain python :class:`pykechain.Client`.
+
+    The `AsyncClient` mirrors the retrieval and creation API of the :class:`pykechain.Client` with
+    awaitable methods, so calls to KE-chain can overlap, for instance using `asyncio.gather`. It
+    returns the very same pykechain models (eg. :class:`pykechain.models.Part`) as the `Client`.
+
+    Every call is performed by an underlying :class:`pykechain.Client` in a pool of worker threads
+    that share a single HTTP session. The connection pooling and the retry strategy (including the
+    fast bailout on SSL errors) of the `Client` are thereby reused as is.
+
+    The models that are returned are bound to the underlying :attr:`AsyncClient.client`, hence
+    their methods (eg. `part.children()`) are blocking. Use :func:`AsyncClient.run` to await them.
+
+    .. versionadded:: 4.13
+
+    :ivar client: the underlying :class:`pykechain.Client` performing the requests.
+
+    Example
+    -------
+    >>> async with AsyncClient(url="https://default.localhost:9443") as client:
+    ...     client.login(token="<some-super-long-secret-token>")
+    ...     bikes, wheels = await asyncio.gather(
+    ...         client.parts(name="Bike"), client.parts(name="Wheel")
+    ...     )
+    ...     children = await client.run(bikes[0].children)
+
+    """
+
+    def __init__(
+        self,
+        url: str = "http://localhost:8000/",
+        check_certificates: Optional[bool] = None,
+        max_workers: int = ASYNC_CLIENT_MAX_WORKERS,
+        client: Optional[Client] = None,
+    ) -> None:
+        """Create an asyncio KE-chain client with given settings.
+
+        :param url: the url of the KE-chain instance to connect to (defaults to http://localhost:8000)
+        :type url: basestring
+        :param check_certificates: if to check TLS/SSL Certificates. Defaults to True
+        :type check_certificates: bool
+        :param max_workers: (optional) maximum number of requests in flight at the same time.
+        :type max_workers: int
+        :param client: (optional) an existing `Client` to use, instead of creating a new one.
+        :type client: Client or None
+        """
+        self.client: Client = client or Client(
+            url=url, check_certificates=check_certificates, pool_maxsize=max_workers
+        )
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="pykechain"
+        )
+
+    def __repr__(self):  # pragma: no cover
+        return f"<pyke AsyncClient '{self.client.api_root}'>"
+
+    async def __aenter__(self) -> "AsyncClient":
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        # waiting for the calls in flight must not block the event loop
+        await asyncio.get_running_loop().run_in_executor(None, self.close)
+
+    @classmethod
+    def from_env(
+        cls,
+        env_filename: Optional[str] = None,
+        check_certificates: Optional[bool] = None,
+        max_workers: int = ASYNC_CLIENT_MAX_WORKERS,
+    ) -> "AsyncClient":
+        """Create an asyncio client from environment variable settings.
+
+        See :func:`pykechain.Client.from_env` for the environment variables that are used.
+
+        :param env_filename: filename of the environment file, defaults to '.env' in the local dir
+                                        (or parent dir)
+        :type env_filename: basestring
+        :param check_certificates: if to check TLS/SSL Certificates. Defaults to True
+        :type check_certificates: bool
+        :param max_workers: (optional) maximum number of requests in flight at the same time.
+        :type max_workers: int
+        :return: :class:`pykechain.AsyncClient`
+        """
+        client = Client.from_env(
+            env_filename=env_filename, check_certificates=check_certificates
+        )
+        return cls(client=client, max_workers=max_workers)
+
+    @property
+    def api_root(self) -> str:
+        """Url of the KE-chain instance."""
+        return self.client.api_root
+
+    def login(
+        self,
+        username: Optional[str] = None,
+        password: Optional[str] = None,
+        token: Optional[str] = None,
+    ) -> None:
+        """Login into KE-chain with either username/password or token.
+
+        See :func:`pykechain.Client.login`. No request is made, hence this method is not awaitable.
+        """
+        self.client.login(username=username, password=password, token=token)
+
+    def close(self) -> None:
+        """Shutdown the worker threads and close the HTTP session."""
+        self._executor.shutdown(wait=True)
+        self.client.session.close()
+
+    async def run(self, func: Callable, *args, **kwargs) -> Any:
+        """Run a blocking pykechain call in the worker pool and await its result.
+
+        :param func: any callable, eg. a method of a pykechain model such as `part.children`
+        :param args: positional arguments for the callable
+        :param kwargs: keyword arguments for the callable
+        :return: the return value of the callable
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self._executor, functools.partial(func, *args, **kwargs)
+        )
+
+    #
+    # Retrieval
+    #
+
+    reload = _awaitable("reload")
+    scopes = _awaitable("scopes")
+    scope = _awaitable("scope")
+    activities = _awaitable("activities")
+    activity = _awaitable("activity")
+    parts = _awaitable("parts")
+    part = _awaitable("part")
+    model = _awaitable("model")
+    properties = _awaitable("properties")
+    property = _awaitable("property")
+    services = _awaitable("services")
+    service = _awaitable("service")
+    service_executions = _awaitable("service_executions")
+    service_execution = _awaitable("service_execution")
+    users = _awaitable("users")
+    user = _awaitable("user")
+    current_user = _awaitable("current_user")
+    teams = _awaitable("teams")
+    team = _awaitable("team")
+    widgets = _awaitable("widgets")
+    widget = _awaitable("widget")
+    associations = _awaitable("associations")
+    notifications = _awaitable("notifications")
+    notification = _awaitable("notification")
+    contexts = _awaitable("contexts")
+    context = _awaitable("context")
+    forms = _awaitable("forms")
+    form = _awaitable("form")
+    workflows = _awaitable("workflows")
+    workflow = _awaitable("workflow")
+    stored_files = _awaitable("stored_files")
+    stored_file = _awaitable("stored_file")
+
+    #
+    # Creators and updaters
+    #
+
+    create_activity = _awaitable("create_activity")
+    update_activities = _awaitable("update_activities")
+    create_part = _awaitable("create_part")
+    create_model = _awaitable("create_model")
+    create_model_with_properties = _awaitable("create_model_with_properties")
+    create_proxy_model = _awaitable("create_proxy_model")
+    _create_parts_bulk = _awaitable("_create_parts_bulk")
+    _delete_parts_bulk = _awaitable("_delete_parts_bulk")
+    create_property = _awaitable("create_property")
+    update_properties = _awaitable("update_properties")
+    create_widget = _awaitable("create_widget")
+    create_widgets = _awaitable("create_widgets")
+    update_widgets = _awaitable("update_widgets")
+    delete_widget = _awaitable("delete_widget")
+    delete_widgets = _awaitable("delete_widgets")
+    create_notification = _awaitable("create_notification")
+    create_context = _awaitable("create_context")
@@ -1,6 +1,23 @@
+from __future__ import annotations
+
 import datetime
+import threading
+import time
 import warnings
-from typing import Any, Callable, Dict, List, Optional, Tuple, Union
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from email.utils import format_datetime
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    Union,
+)
 from urllib.parse import urljoin, urlparse
 
 import requests
@@ -9,13 +26,28 @@ from requests.adapters import HTTPAdapter  # type: ignore
 
 from pykechain.defaults import (
     API_EXTRA_PARAMS,
+    API_FIELDS_PROFILES,
     API_PATH,
+    BATCH_LOADER_CHUNK_SIZE,
+    CACHE_MAXSIZE,
+    CACHE_TTL,
     PARTS_BATCH_LIMIT,
+    POOL_BLOCK,
+    POOL_CONNECTIONS,
+    POOL_MAXSIZE,
+    PROPERTY_UPDATES_CHUNK_SIZE,
+    PROPERTY_UPDATES_FLUSH_SIZE,
+    RATE_LIMITER_DECREASE_FACTOR,
+    RATE_LIMITER_INITIAL_CONCURRENCY,
+    RATE_LIMITER_MAX_CONCURRENCY,
     RETRY_BACKOFF_FACTOR,
     RETRY_ON_CONNECTION_ERRORS,
     RETRY_ON_READ_ERRORS,
     RETRY_ON_REDIRECT_ERRORS,
+    RETRY_ON_STATUS_CODES,
+    RETRY_ON_STATUS_ERRORS,
     RETRY_TOTAL,
+    UNIT_OF_WORK_CHUNK_SIZE,
 )
 from pykechain.enums import (
     ActivityClassification,
@@ -49,23 +81,9 @@ from pykechain.exceptions import (
     IllegalArgumentError,
     MultipleFoundError,
     NotFoundError,
+    PropertiesUpdateError,
 )
-from pykechain.models import (
-    Activity,
-    AnyProperty,
-    Base,
-    Part,
-    PartSet,
-    Property,
-    Scope,
-    Service,
-    ServiceExecution,
-)
-from pykechain.models.association import Association
-from pykechain.models.notification import Notification
-from pykechain.models.team import Team
-from pykechain.models.user import User
-from pykechain.models.widgets.widget import Widget
+from pykechain.models.base import Base
 from pykechain.utils import (
     clean_empty_values,
     find,
@@ -75,11 +93,18 @@ from pykechain.utils import (
     slugify_ref,
 )
 from .__about__ import version as pykechain_version
-from .client_utils import PykeRetry
-from .models.banner import Banner
-from .models.context import Context
-from .models.expiring_download import ExpiringDownload
-from .models.form import Form
+from .client_utils import (
+    AdaptiveRateLimiter,
+    BatchLoader,
+    IdentityMap,
+    JsonCodec,
+    PropertyUpdateBuffer,
+    PykeRetry,
+    ResponseCache,
+    UnitOfWork,
+    parse_retry_after,
+)
+from .metrics import PostRequestHook, PreRequestHook, RequestMetrics
 from .models.input_checks import (
     check_base,
     check_date,
@@ -95,10 +120,30 @@ from .models.input_checks import (
     check_user,
     check_uuid,
 )
-from .models.stored_file import StoredFile
-from .models.workflow import Workflow
 from .typing import ObjectID
 
+if TYPE_CHECKING:
+    from pykechain.models import (
+        Activity,
+        AnyProperty,
+        Association,
+        Notification,
+        Part,
+        PartSet,
+        Scope,
+        Service,
+        ServiceExecution,
+        Team,
+        User,
+    )
+    from pykechain.models.banner import Banner
+    from pykechain.models.context import Context
+    from pykechain.models.expiring_download import ExpiringDownload
+    from pykechain.models.form import Form
+    from pykechain.models.stored_file import StoredFile
+    from pykechain.models.widgets.widget import Widget
+    from pykechain.models.workflow import Workflow
+
 
 class Client:
     """The KE-chain python client to connect to a KE-chain instance.
@@ -106,6 +151,21 @@ class Client:
     :ivar last_request: last executed request. Which is of type `requests.Request`_
     :ivar last_response: last executed response. Which is of type `requests.Response`_
     :ivar last_url: last called api url
+    :ivar cache: the :class:`pykechain.client_utils.ResponseCache` when enabled, see :func:`enable_cache`.
+    :ivar identity_map: the :class:`pykechain.client_utils.IdentityMap` when enabled, see
+        :func:`enable_identity_map`.
+    :ivar metrics: the :class:`pykechain.metrics.RequestMetrics` of all requests of the client, see :func:`stats`.
+    :ivar rate_limiter: the :class:`pykechain.client_utils.AdaptiveRateLimiter` when enabled, see
+        :func:`enable_rate_limiter`.
+    :ivar hooks: callables called before (`pre_request`) and after (`post_request`) every request, see
+        :func:`add_request_hook`.
+    :ivar json_codec: the :class:`pykechain.client_utils.JsonCodec` encoding and decoding the json bodies of the
+        requests and responses.
+
+    The client is thread-safe: a single client may be used by multiple threads at the same time, eg. from a
+    `concurrent.futures.ThreadPoolExecutor`. The `last_request`, `last_response` and `last_url` are kept per
+    thread, so they always refer to the last request of the current thread. Size the connection pool of the
+    client to the number of threads using `pool_maxsize`, to reuse the connections to KE-chain.
 
     .. _requests.Request: http://docs.python-requests.org/en/master/api/#requests.Request
     .. _requests.Response: http://docs.python-requests.org/en/master/api/#requests.Response
@@ -115,6 +175,10 @@ class Client:
         self,
         url: str = "http://localhost:8000/",
         check_certificates: Optional[bool] = None,
+        pool_connections: int = POOL_CONNECTIONS,
+        pool_maxsize: int = POOL_MAXSIZE,
+        pool_block: bool = POOL_BLOCK,
+        json_codec: Optional[JsonCodec] = None,
     ) -> None:
         """Create a KE-chain client with given settings.
 
@@ -122,6 +186,17 @@ class Client:
         :type url: basestring
         :param check_certificates: if to check TLS/SSL Certificates. Defaults to True
         :type check_certificates: bool
+        :param pool_connections: (optional) number of connection pools to cache. Defaults to 10
+        :type pool_connections: int
+        :param pool_maxsize: (optional) maximum number of connections to keep open, set this to the number of
+            threads using the client. Defaults to 10
+        :type pool_maxsize: int
+        :param pool_block: (optional) whether to wait for a free connection when all connections are in use.
+            Defaults to False
+        :type pool_block: bool
+        :param json_codec: (optional) codec for the json bodies of the requests and responses. Defaults to a
+            :class:`pykechain.client_utils.JsonCodec` with the fastest json library that is installed.
+        :type json_codec: JsonCodec or None
 
         Examples
         --------
@@ -131,6 +206,12 @@ class Client:
         >>> from pykechain import Client
         >>> client = Client(url='https://default-tst.localhost:9443', check_certificates=False)
 
+        Use a single client from 32 worker threads
+
+        >>> client = Client(url='https://default-tst.localhost:9443', pool_maxsize=32, pool_block=True)
+        >>> with ThreadPoolExecutor(max_workers=32) as executor:
+        ...     parts = list(executor.map(lambda pk: client.part(pk=pk), part_ids))
+
         """
         self.auth: Optional[Tuple[str, str]] = None
         self.headers: Dict[str, str] = {
@@ -149,9 +230,18 @@ class Client:
             "PyKechain-Version": pykechain_version,
         }
         self.auth: Optional[Tuple[str, str]] = None
-        self.last_request: Optional[requests.PreparedRequest] = None
-        self.last_response: Optional[requests.Response] = None
-        self.last_url: Optional[str] = None
+        self._local = threading.local()
+        self.last_request = None
+        self.last_response = None
+        self.last_url = None
+        self.cache: Optional[ResponseCache] = None
+        self.identity_map: Optional[IdentityMap] = None
+        self.rate_limiter: Optional[AdaptiveRateLimiter] = None
+        self._property_updates = PropertyUpdateBuffer(client=self)
+        self.metrics = RequestMetrics()
+        self._measurements: List[RequestMetrics] = list()
+        self.hooks: Dict[str, List[Callable]] = dict(pre_request=[], post_request=[])
+        self.json_codec: JsonCodec = JsonCodec() if json_codec is None else json_codec
         self._app_versions: Optional[List[Dict]] = None
         self._widget_schemas: Optional[List[Dict]] = None
 
@@ -165,13 +255,20 @@ class Client:
 
         # Retry implementation
         adapter = HTTPAdapter(
+            pool_connections=pool_connections,
+            pool_maxsize=pool_maxsize,
+            pool_block=pool_block,
             max_retries=PykeRetry(
                 total=RETRY_TOTAL,
                 connect=RETRY_ON_CONNECTION_ERRORS,
                 read=RETRY_ON_READ_ERRORS,
                 redirect=RETRY_ON_REDIRECT_ERRORS,
+                status=RETRY_ON_STATUS_ERRORS,
+                status_forcelist=RETRY_ON_STATUS_CODES,
+                raise_on_status=False,
                 backoff_factor=RETRY_BACKOFF_FACTOR,
-            )
+                on_retry=self._on_retry,
+            ),
         )
         self.session.mount("https://", adapter=adapter)
         self.session.mount("http://", adapter=adapter)
@@ -186,6 +283,42 @@ class Client:
     def __repr__(self):  # pragma: no cover
         return f"<pyke Client '{self.api_root}'>"
 
+    def __getstate__(self) -> Dict:
+        state = self.__dict__.copy()
+        del state["_local"]  # the bookkeeping of the requests per thread is not copied
+        return state
+
+    def __setstate__(self, state: Dict) -> None:
+        self.__dict__.update(state)
+        self._local = threading.local()
+
+    @property
+    def last_request(self) -> Optional[requests.PreparedRequest]:
+        """Last executed request of the current thread."""
+        return getattr(self._local, "last_request", None)
+
+    @last_request.setter
+    def last_request(self, value: Optional[requests.PreparedRequest]) -> None:
+        self._local.last_request = value
+
+    @property
+    def last_response(self) -> Optional[requests.Response]:
+        """Last executed response of the current thread."""
+        return getattr(self._local, "last_response", None)
+
+    @last_response.setter
+    def last_response(self, value: Optional[requests.Response]) -> None:
+        self._local.last_response = value
+
+    @property
+    def last_url(self) -> Optional[str]:
+        """Last called api url of the current thread."""
+        return getattr(self._local, "last_url", None)
+
+    @last_url.setter
+    def last_url(self, value: Optional[str]) -> None:
+        self._local.last_url = value
+
     @classmethod
     def from_env(
         cls,
@@ -287,6 +420,378 @@ class Client:
             self.headers.pop("Authorization", None)
             self.auth = (username, password)
 
+        if self.cache is not None:
+            self.cache.clear()
+
+    def enable_cache(
+        self, maxsize: int = CACHE_MAXSIZE, ttl: float = CACHE_TTL
+    ) -> ResponseCache:
+        """Enable the cache of the responses to GET requests of this client.
+
+        Retrieving the same object from KE-chain repeatedly (eg. `client.part(pk=...)`, `part.model()` or
+        `property.part`) is served from the cache for `ttl` seconds. Any PUT, POST, PATCH or DELETE request
+        by this client invalidates the cached responses of the affected objects, eg. updating a property
+        invalidates the cached parts and properties. Changes in KE-chain by others are only noticed after
+        the `ttl` expired.
+
+        .. versionadded:: 4.13
+
+        :param maxsize: (optional) maximum number of responses to cache, defaults to 1000
+        :type maxsize: int
+        :param ttl: (optional) number of seconds a cached response remains valid, defaults to 60
+        :type ttl: float
+        :return: the :class:`pykechain.client_utils.ResponseCache` with the `hits` and `misses` counters
+
+        Example
+        -------
+        >>> cache = client.enable_cache(maxsize=5000, ttl=300)
+        >>> bike = client.part(pk=bike_id)
+        >>> bike = client.part(pk=bike_id)  # served from the cache
+        >>> cache.stats()
+        {'hits': 1, 'misses': 1, 'size': 1, 'maxsize': 5000, 'ttl': 300}
+
+        """
+        self.cache = ResponseCache(maxsize=maxsize, ttl=ttl)
+        return self.cache
+
+    def disable_cache(self) -> None:
+        """Disable the cache of the responses of this client and discard the cached responses.
+
+        .. versionadded:: 4.13
+        """
+        self.cache = None
+
+    def enable_identity_map(self) -> IdentityMap:
+        """Enable the identity map of the models of this client.
+
+        With the identity map enabled, every object in KE-chain is represented by a single live pykechain model
+        per class. Retrieving an object again (eg. `client.part(pk=...)`, `part.parent()`, `part.children()` or
+        the value of a reference property) returns the same model, updated with the retrieved data, instead of
+        creating a duplicate. The map only holds weak references, so models that are no longer used are
+        released.
+
+        .. versionadded:: 4.13
+
+        :return: the :class:`pykechain.client_utils.IdentityMap`
+
+        Example
+        -------
+        >>> client.enable_identity_map()
+        >>> wheel = client.part(name="Front Wheel")
+        >>> wheel.parent().children()[0] is wheel
+        True
+
+        """
+        if self.identity_map is None:
+            self.identity_map = IdentityMap()
+        return self.identity_map
+
+    def disable_identity_map(self) -> None:
+        """Disable the identity map of the models of this client.
+
+        .. versionadded:: 4.13
+        """
+        self.identity_map = None
+
+    def enable_rate_limiter(
+        self,
+        initial_concurrency: int = RATE_LIMITER_INITIAL_CONCURRENCY,
+        max_concurrency: int = RATE_LIMITER_MAX_CONCURRENCY,
+        decrease_factor: float = RATE_LIMITER_DECREASE_FACTOR,
+    ) -> AdaptiveRateLimiter:
+        """Enable the adaptive limiter of the number of requests of this client in flight at the same time.
+
+        The limiter is shared by all threads (and tasks of the :class:`pykechain.AsyncClient`) using the client.
+        It allows more requests in flight as long as KE-chain keeps up and backs off when KE-chain throttles
+        the requests (`429 Too Many Requests` or `503 Service Unavailable`), honoring the `Retry-After` of
+        KE-chain. Throttled requests are retried regardless of the limiter.
+
+        .. versionadded:: 4.13
+
+        :param initial_concurrency: (optional) number of requests allowed in flight initially, defaults to 4
+        :type initial_concurrency: int
+        :param max_concurrency: (optional) maximum number of requests allowed in flight, defaults to 32
+        :type max_concurrency: int
+        :param decrease_factor: (optional) factor to reduce the number of requests in flight when throttled,
+            defaults to 0.5
+        :type decrease_factor: float
+        :return: the :class:`pykechain.client_utils.AdaptiveRateLimiter`
+
+        Example
+        -------
+        >>> client = Client(url="https://default.localhost:9443", pool_maxsize=32)
+        >>> client.enable_rate_limiter(max_concurrency=32)
+        >>> with ThreadPoolExecutor(max_workers=32) as executor:
+        ...     parts = list(executor.map(lambda pk: client.part(pk=pk), part_ids))
+
+        """
+        self.rate_limiter = AdaptiveRateLimiter(
+            initial_concurrency=initial_concurrency,
+            max_concurrency=max_concurrency,
+            decrease_factor=decrease_factor,
+        )
+        return self.rate_limiter
+
+    def disable_rate_limiter(self) -> None:
+        """Disable the adaptive limiter of the number of requests in flight.
+
+        .. versionadded:: 4.13
+        """
+        self.rate_limiter = None
+
+    def stats(self) -> Dict[str, Dict]:
+        """Return a snapshot of the statistics of the requests of this client, per endpoint of the KE-chain API.
+
+        The endpoints are named after the keys of the `API_PATH` in :mod:`pykechain.defaults`, eg. `parts`. The
+        statistics of an endpoint consist of the `count` of requests, the `errors` (requests without response),
+        the `retries`, the `bytes_sent` and `bytes_received`, the number of responses per `status_codes` and the
+        `latency` in seconds (`mean`, `p50`, `p90`, `p99` and `max`).
+
+        .. versionadded:: 4.13
+
+        :return: dictionary with the statistics per endpoint
+
+        Example
+        -------
+        >>> client.parts(scope_id=project.id)
+        >>> client.stats()["parts"]["latency"]["p90"]
+        0.213
+
+        """
+        return self.metrics.snapshot()
+
+    @contextmanager
+    def measure(self) -> Iterator[RequestMetrics]:
+        """Measure the requests of this client within a block of code.
+
+        All requests of the client during the block are included, also the requests of other threads.
+
+        .. versionadded:: 4.13
+
+        :return: a :class:`pykechain.metrics.RequestMetrics` with the statistics of the requests of the block
+
+        Example
+        -------
+        >>> with client.measure() as metrics:
+        ...     bike.children()
+        >>> metrics.snapshot()["parts"]["count"]
+        1
+
+        """
+        metrics = RequestMetrics()
+        self._measurements = self._measurements + [metrics]
+        try:
+            yield metrics
+        finally:
+            self._measurements = [m for m in self._measurements if m is not metrics]
+
+    def add_request_hook(
+        self,
+        pre_request: Optional[PreRequestHook] = None,
+        post_request: Optional[PostRequestHook] = None,
+    ) -> None:
+        """Add callables to be called before and/or after every request of this client.
+
+        The `pre_request` hook is called with the `method`, the `url` and the keyword arguments of the request,
+        which it may alter (eg. to add `headers`). The `post_request` hook is called with the `method`, the `url`,
+        the `requests.Response` (None in case of a connection error) and the duration of the request in seconds.
+
+        .. versionadded:: 4.13
+
+        :param pre_request: (optional) callable `(method, url, kwargs)`
+        :param post_request: (optional) callable `(method, url, response, elapsed)`
+
+        Example
+        -------
+        >>> def log_slow_requests(method, url, response, elapsed):
+        ...     if elapsed > 1:
+        ...         print(f"{method} {url} took {elapsed:.1f}s")
+        >>> client.add_request_hook(post_request=log_slow_requests)
+
+        """
+        if pre_request is not None:
+            self.hooks["pre_request"].append(pre_request)
+        if post_request is not None:
+            self.hooks["post_request"].append(post_request)
+
+    def _on_retry(self, method: str, url: str, response, error) -> None:
+        """Count a retry of a request in the metrics and slow down when the request is throttled."""
+        endpoint = RequestMetrics.endpoint(url)
+        for metrics in [self.metrics] + self._measurements:
+            metrics.record_retry(endpoint)
+
+        limiter = self.rate_limiter
+        if (
+            limiter is not None
+            and response is not None
+            and response.status in RETRY_ON_STATUS_CODES
+        ):
+            limiter.throttle(parse_retry_after(response.headers.get("Retry-After")))
+            self._local.throttled = True
+
+    def _record_request(
+        self,
+        url: str,
+        elapsed: float,
+        response: Optional[requests.Response],
+        stream: bool = False,
+    ) -> None:
+        """Record a request in the metrics."""
+        status_code, bytes_sent, bytes_received = None, 0, 0
+        if response is not None:
+            status_code = response.status_code
+            bytes_sent = len(response.request.body or b"")
+            if stream:  # do not consume a streamed response
+                bytes_received = int(response.headers.get("Content-Length") or 0)
+            else:
+                bytes_received = len(response.content or b"")
+
+        endpoint = RequestMetrics.endpoint(url)
+        for metrics in [self.metrics] + self._measurements:
+            metrics.record(
+                endpoint,
+                elapsed,
+                status_code=status_code,
+                bytes_sent=bytes_sent,
+                bytes_received=bytes_received,
+            )
+
+    def batch(self, chunk_size: int = BATCH_LOADER_CHUNK_SIZE) -> BatchLoader:
+        """Collect lookups of single objects, to retrieve them with a single request per batch of objects.
+
+        Inside the `with` block, the lookups of parts, properties, activities, users and scopes by id return a
+        :class:`pykechain.client_utils.BatchResult`. At the end of the block (or as soon as a result is needed)
+        the objects are retrieved per kind using `id__in` requests, turning a request per object into a request
+        per `chunk_size` objects.
+
+        Only the lookups made through the loader are collected: the existing singular lookups, such as
+        `client.part(pk=...)` or `prop.part`, return the model itself and therefore still retrieve it right away,
+        also inside the `with` block. Replace these by the lookups of the loader to batch them.
+
+        .. versionadded:: 4.13
+
+        :param chunk_size: (optional) maximum number of objects to retrieve per request, defaults to 100
+        :type chunk_size: int
+        :return: a :class:`pykechain.client_utils.BatchLoader`
+
+        Example
+        -------
+        >>> with client.batch() as batch:
+        ...     lookups = [batch.part(pk) for pk in part_ids]
+        ...     owner = batch.user(owner_id)
+        >>> parts = [lookup.result() for lookup in lookups]
+
+        """
+        return BatchLoader(client=self, chunk_size=chunk_size)
+
+    def unit_of_work(
+        self,
+        chunk_size: int = UNIT_OF_WORK_CHUNK_SIZE,
+        raise_on_failure: bool = True,
+    ) -> UnitOfWork:
+        """Record writes, to send them to KE-chain with a request per batch of objects.
+
+        Inside the `with` block, setting the value of a property and editing a widget or an activity are
+        recorded instead of sent right away. Parts and widgets are created using the unit of work itself. At the
+        end of the block the writes are merged per object and sent through the bulk endpoints of KE-chain,
+        creating objects before updating objects, in requests of (at most) `chunk_size` objects.
+
+        When KE-chain refuses a request, its objects are written one by one to single out the writes that fail.
+        These are collected in the `failures` of the :class:`pykechain.client_utils.UnitOfWork` and reported
+        in a single `APIError`.
+
+        .. versionadded:: 4.13
+
+        :param chunk_size: (optional) maximum number of objects to write per request, defaults to 100
+        :type chunk_size: int
+        :param raise_on_failure: (optional) raise an `APIError` if any write failed, defaults to True
+        :type raise_on_failure: bool
+        :return: a :class:`pykechain.client_utils.UnitOfWork`
+        :raises APIError: at the end of the block, if any write failed and `raise_on_failure` is set
+
+        Example
+        -------
+        >>> with client.unit_of_work() as uow:
+        ...     for prop in part.properties:
+        ...         prop.value = values[prop.name]
+        ...     wheel = uow.add_part(parent=bike, model=wheel_model, update_dict={"Diameter": 60})
+        >>> wheel.result()
+        <pyke Part 'Wheel' id ...>
+
+        """
+        return UnitOfWork(
+            client=self, chunk_size=chunk_size, raise_on_failure=raise_on_failure
+        )
+
+    def _active_unit_of_work(self) -> Optional[UnitOfWork]:
+        """Return the unit of work recording the writes of the current thread, if any."""
+        return getattr(self._local, "unit_of_work", None)
+
+    def bulk_update_properties(
+        self,
+        flush_size: Optional[int] = PROPERTY_UPDATES_FLUSH_SIZE,
+        chunk_size: int = PROPERTY_UPDATES_CHUNK_SIZE,
+    ) -> PropertyUpdateBuffer:
+        """Collect the updates of property values, to send them to KE-chain in bulk.
+
+        Inside the `with` block, setting the value of a property is collected in a
+        :class:`pykechain.client_utils.PropertyUpdateBuffer` instead of sent right away. The updates are sent
+        with a request per `chunk_size` properties as soon as `flush_size` properties are updated and at the end
+        of the block.
+
+        The buffer is scoped to the thread entering the `with` block, hence bulk updates can run in parallel
+        worker threads sharing the client. As opposed to `Property.set_bulk_update()`, which applies to every
+        client and thread in the process.
+
+        .. versionadded:: 4.13
+
+        :param flush_size: (optional) number of properties at which the updates are sent, defaults to 1000.
+            None to only send the updates at the end of the block.
+        :type flush_size: int or None
+        :param chunk_size: (optional) maximum number of properties to update per request, defaults to 100
+        :type chunk_size: int
+        :return: a :class:`pykechain.client_utils.PropertyUpdateBuffer`
+        :raises APIError: if the updates could not be sent
+
+        Example
+        -------
+        >>> with client.bulk_update_properties():
+        ...     for part in parts:
+        ...         part.property("Mass").value = masses[part.name]
+
+        """
+        return PropertyUpdateBuffer(
+            client=self, flush_size=flush_size, chunk_size=chunk_size
+        )
+
+    def _pending_property_updates(self) -> Optional[PropertyUpdateBuffer]:
+        """Return the buffer collecting the updates of property values of the current thread, if any."""
+        from pykechain.models import Property
+        buffer = getattr(self._local, "property_updates", None)
+        if buffer is None and Property._USE_BULK_UPDATE:
+            buffer = self._property_updates
+        return buffer
+
+    @staticmethod
+    def _retrieve_in_chunks(
+        method: Callable, pks: List[str], chunk_size: int, **kwargs
+    ) -> Dict[str, Base]:
+        """
+        Retrieve objects by their ids, using a request with `id__in` per chunk of ids.
+
+        :param method: `Client` method to retrieve multiple objects, eg. `client.parts`
+        :param pks: ids of the objects to retrieve
+        :param chunk_size: maximum number of ids per request
+        :param kwargs: additional arguments for the method
+        :return: dictionary of the objects per id, as `id__in` does not guarantee the order
+        """
+        objects_per_id = dict()
+        for pks_chunk in get_in_chunks(lst=pks, chunk_size=chunk_size):
+            objects_per_id.update(
+                {obj.id: obj for obj in method(id__in=",".join(pks_chunk), **kwargs)}
+            )
+        return objects_per_id
+
     def _build_url(self, resource: str, **kwargs) -> str:
         """Build the correct API url.
 
@@ -308,19 +813,20 @@ class Client:
         """
         users_url = self._build_url("users")
         response = self._request("GET", users_url)
-        users = response.json()
+        users = self.json_codec.decode(response)
         return users
 
     def _request(self, method: str, url: str, **kwargs) -> requests.Response:
         """Perform the request on the API.
 
         It includes a default ForbiddenError check if the response came back as a 403.
-        It stores the `last_response`, `last_request` and `last_url` on the Client object for
-        debugging reasons.
+        It stores the `last_response`, `last_request` and `last_url` of the current thread on the Client object
+        for debugging reasons.
 
         :param method: the HTTP method or GET, POST, PUT, PATCH, DELETE
         :param url: the url to call
-        :param kwargs: additional arguments such as `params` (query params) and `json` data.
+        :param kwargs: additional arguments such as `params` (query params), `json` data and `headers`, which
+            are added to the headers of the client.
         :raises ForbiddenError: If the user is forbidden to perform the URL call.
         :returns: Response
         """
@@ -329,16 +835,80 @@ class Client:
             kwargs[
                 "allow_redirects"
             ] = False  # to prevent redirects on write action. Better check your URL first.
-        self.last_response = self.session.request(
-            method, url, auth=self.auth, headers=self.headers, **kwargs
-        )
-        self.last_request = self.last_response.request
-        self.last_url = self.last_response.url
 
-        if self.last_response.status_code == requests.codes.forbidden:
-            raise ForbiddenError(self.last_response.json()["results"][0])
+        cache, cache_url = self.cache, None
+        if cache is not None and method == "GET" and set(kwargs) <= {"params"}:
+            cache_url = (
+                requests.Request(method, url, params=kwargs.get("params"))
+                .prepare()
+                .url
+            )
+            response = cache.get(cache_url)
+            if response is not None:
+                self.last_response = response
+                self.last_request = response.request
+                self.last_url = response.url
+                return response
+
+        for hook in self.hooks["pre_request"]:
+            hook(method, url, kwargs)
+
+        headers = self.headers
+        if kwargs.get("headers"):
+            headers = dict(self.headers, **kwargs.pop("headers"))
+        kwargs.pop("headers", None)
+
+        if kwargs.get("json") is not None and kwargs.get("data") is None:
+            kwargs["data"] = self.json_codec.dumps(kwargs.pop("json"))
+            headers = dict({"Content-Type": "application/json"}, **headers)
+
+        limiter, response = self.rate_limiter, None
+        if limiter is not None:
+            limiter.acquire()
+            self._local.throttled = False
+
+        start = time.perf_counter()
+        try:
+            response = self.session.request(
+                method, url, auth=self.auth, headers=headers, **kwargs
+            )
+        except requests.RequestException:
+            elapsed = time.perf_counter() - start
+            self._record_request(url, elapsed, None)
+            for hook in self.hooks["post_request"]:
+                hook(method, url, None, elapsed)
+            raise
+        finally:
+            if limiter is not None:
+                throttled = (
+                    response is not None
+                    and response.status_code in RETRY_ON_STATUS_CODES
+                )
+                # a throttled response that was retried already slowed down the limiter
+                limiter.release(
+                    throttled=throttled,
+                    adapt=not (throttled and self._local.throttled),
+                )
+
+        elapsed = time.perf_counter() - start
+        self._record_request(url, elapsed, response, stream=kwargs.get("stream"))
+        for hook in self.hooks["post_request"]:
+            hook(method, url, response, elapsed)
+
+        self.last_response = response
+        self.last_request = response.request
+        self.last_url = response.url
 
-        return self.last_response
+        if cache is not None:
+            if cache_url and response.status_code == requests.codes.ok:
+                cache.set(cache_url, response)
+            elif method != "GET":
+                cache.invalidate(url)
+
+        if response.status_code == requests.codes.forbidden:
+            raise ForbiddenError(self.json_codec.decode(response)["results"][0])
+
+        return response
 
     @property
     def app_versions(self) -> List[Dict]:
@@ -351,11 +921,17 @@ class Client:
             if response.status_code == requests.codes.not_found:
                 self._app_versions = []
             elif response.status_code == requests.codes.forbidden:
-                raise ForbiddenError(response.json()["results"][0]["detail"])
+                raise ForbiddenError(
+                    self.json_codec.decode(response)["results"][0]["detail"]
+                )
             elif response.status_code != requests.codes.ok:
-                raise APIError("Could not retrieve app versions", response=response)
+                raise APIError(
+                    "Could not retrieve app versions",
+                    response=response,
+                    json_codec=self.json_codec,
+                )
             else:
-                self._app_versions = response.json().get("results")
+                self._app_versions = self.json_codec.decode(response).get("results")
 
         return self._app_versions
 
@@ -382,8 +958,12 @@ class Client:
         if not self._widget_schemas:
             response = self._request("GET", self._build_url("widgets_schemas"))
             if response.status_code != requests.codes.ok:  # pragma: no cover
-                raise APIError("Could not retrieve widgets schemas.", response=response)
-            self._widget_schemas = response.json().get("results")
+                raise APIError(
+                    "Could not retrieve widgets schemas.",
+                    response=response,
+                    json_codec=self.json_codec,
+                )
+            self._widget_schemas = self.json_codec.decode(response).get("results")
 
         return self._widget_schemas
 
@@ -492,13 +1072,18 @@ class Client:
         respected. If additional API params are needed to be included (eg. for KE-chain 3/PIM2) these will be
         added/updated automatically before the request is performed.
 
+        The object is refetched using a conditional request: when the object was not modified in KE-chain since it
+        was retrieved, KE-chain may respond with `304 Not Modified` and the original object is returned untouched.
+        The `ETag` and `Last-Modified` validators of the response are remembered on the object, otherwise the
+        `updated_at` of the object is used.
+
         :param obj: object to reload
         :type obj: :py:obj:`obj`
         :param url: (optional) url to use
         :type url: basestring or None
         :param extra_params: additional object specific extra query string params (eg for activity)
         :type extra_params: dict
-        :return: a new object
+        :return: a new object, or the original object if it is not modified
         :raises NotFoundError: if original object is not found or deleted in the mean time
         """
         check_type(value=obj, cls=Base, key="obj")
@@ -557,15 +1142,48 @@ class Client:
                 else extra_api_params
             )
 
-        response = self._request("GET", url, params=extra_params)
-        data = response.json().get("results", [])
+        response = self._request(
+            "GET", url, params=extra_params, headers=self._conditional_headers(obj)
+        )
+        if response.status_code == requests.codes.not_modified:
+            return obj
+
+        data = self.json_codec.decode(response).get("results", [])
 
         if response.status_code != requests.codes.ok or not len(data) > 0:
             raise NotFoundError(
-                f"Could not reload {obj.__class__.__name__} {obj}", response=response
+                f"Could not reload {obj.__class__.__name__} {obj}",
+                response=response,
+                json_codec=self.json_codec,
             )
 
-        return obj.__class__(data[0], client=self)
+        reloaded = obj.__class__(data[0], client=self)
+        reloaded._etag = response.headers.get("ETag")
+        reloaded._last_modified = response.headers.get("Last-Modified")
+        return reloaded
+
+    @staticmethod
+    def _conditional_headers(obj: Base) -> Dict[str, str]:
+        """
+        Build the headers of a conditional request to retrieve the object, if it is not modified.
+
+        :param obj: object to retrieve
+        :return: dictionary with the `If-None-Match` and/or `If-Modified-Since` headers
+        """
+        headers = dict()
+        etag = getattr(obj, "_etag", None)
+        last_modified = getattr(obj, "_last_modified", None)
+        updated_at = getattr(obj, "updated_at", None)  # not all models have one
+
+        if etag:
+            headers["If-None-Match"] = etag
+        if last_modified:
+            headers["If-Modified-Since"] = last_modified
+        elif not etag and isinstance(updated_at, datetime.datetime):
+            headers["If-Modified-Since"] = format_datetime(
+                updated_at.astimezone(datetime.timezone.utc), usegmt=True
+            )
+        return headers
 
     @staticmethod
     def _retrieve_singular(method: Callable, *args, **kwargs):
@@ -578,7 +1196,9 @@ class Client:
         :raises NotFoundError: When no result is found.
         :raises MultipleFoundError: When more than a single result is found.
         """
-        kwargs["limit"] = kwargs.get("limit", 2)
+        # two results tell no, a single and multiple results apart, without retrieving the other batches
+        kwargs["limit"] = 2
+        kwargs.pop("concurrency", None)
         results = method(*args, **kwargs)
 
         criteria = f"\nargs: {args}\nkwargs: {kwargs}"
@@ -610,7 +1230,8 @@ class Client:
         :type pk: basestring or None
         :param status: if provided, filter the search for the status. eg. 'ACTIVE', 'TEMPLATE', 'LIBRARY'
         :type status: basestring or None
-        :param kwargs: optional additional search arguments
+        :param kwargs: optional additional search arguments,
+            `fields`, `only` and `defer` select the fields to retrieve, see :func:`parts`.
         :return: list of `Scopes`
         :rtype: list(:class:`models.Scope`)
         :raises NotFoundError: if no scopes are not found.
@@ -629,6 +1250,7 @@ class Client:
         ...
 
         """
+        from pykechain.models import Scope
         request_params = {
             "status": check_enum(status, ScopeStatus, "status"),
         }
@@ -640,20 +1262,15 @@ class Client:
         if pk:
             request_params["id"] = pk
 
-        request_params.update(API_EXTRA_PARAMS["scope"])
+        request_params.update(self._fields_params("scope", kwargs))
         url = self._build_url("scopes")
 
         if kwargs:
             request_params.update(**kwargs)
 
-        response = self._request("GET", url=url, params=request_params)
-
-        if response.status_code != requests.codes.ok:  # pragma: no cover
-            raise NotFoundError("Could not retrieve Scopes", response=response)
-
-        data = response.json()
+        results = self._paginate(url, request_params, description="Scopes")
 
-        return [Scope(s, client=self) for s in data["results"]]
+        return [Scope(s, client=self) for s in results]
 
     def scope(self, *args, **kwargs) -> Scope:
         """Return a single scope based on the provided name.
@@ -685,29 +1302,85 @@ class Client:
         :type name: basestring or None
         :param scope: filter by scope id
         :type scope: basestring or None
+        :param kwargs: additional search arguments,
+            `fields`, `only` and `defer` select the fields to retrieve, see :func:`parts`.
         :return: list of :class:`models.Activity`
         :raises NotFoundError: If no `Activities` are found
         """
+        from pykechain.models import Activity
+        request_params = self._activities_request_params(
+            name=name, pk=pk, scope=scope, **kwargs
+        )
+
+        results = self._paginate(
+            self._build_url("activities"), request_params, description="Activities"
+        )
+        return [Activity(a, client=self) for a in results]
+
+    def iter_activities(
+        self,
+        name: Optional[str] = None,
+        pk: Optional[str] = None,
+        scope: Optional[str] = None,
+        limit: Optional[int] = None,
+        batch: Optional[int] = None,
+        prefetch: bool = True,
+        **kwargs,
+    ) -> Iterator[Activity]:
+        """Iterate over activities, batch by batch.
+
+        Uses the same interface as the :func:`activities` method, but yields the activities as soon as their
+        batch is retrieved. Only a single batch of activities is kept in memory and the next batch is
+        retrieved in the background while the activities are being consumed.
+
+        .. versionadded:: 4.13
+
+        :param limit: (optional) maximum number of activities, defaults to all activities
+        :type limit: int or None
+        :param batch: (optional) number of activities per batch, defaults to the batch size of KE-chain
+        :type batch: int or None
+        :param prefetch: (optional) retrieve the next batch in the background, defaults to True
+        :type prefetch: bool
+        :param kwargs: additional `keyword=value` arguments for the api, see :func:`activities`
+        :return: generator of :class:`models.Activity`
+        :raises NotFoundError: If a batch of activities could not be retrieved
+        """
+        from pykechain.models import Activity
+        request_params = self._activities_request_params(
+            name=name, pk=pk, scope=scope, **kwargs
+        )
+
+        for json in self._iter_paginated(
+            self._build_url("activities"),
+            request_params,
+            limit=limit,
+            batch=batch,
+            prefetch=prefetch,
+            description="Activities",
+        ):
+            yield Activity(json, client=self)
+
+    @staticmethod
+    def _activities_request_params(
+        name: Optional[str] = None,
+        pk: Optional[str] = None,
+        scope: Optional[str] = None,
+        **kwargs,
+    ) -> Dict:
+        """Build the request parameters to retrieve activities, see :func:`activities`."""
+        from pykechain.models import Scope
         request_params = {
             "id": check_uuid(pk),
             "name": check_text(text=name, key="name"),
             "scope_id": check_base(scope, Scope, "scope"),
         }
 
-        request_params.update(API_EXTRA_PARAMS["activity"])
+        request_params.update(Client._fields_params("activity", kwargs))
 
         if kwargs:
             request_params.update(**kwargs)
 
-        response = self._request(
-            "GET", self._build_url("activities"), params=request_params
-        )
-
-        if response.status_code != requests.codes.ok:  # pragma: no cover
-            raise NotFoundError("Could not retrieve Activities", response=response)
-
-        data = response.json()
-        return [Activity(a, client=self) for a in data["results"]]
+        return request_params
 
     def activity(self, *args, **kwargs) -> Activity:
         """Search for a single activity.
@@ -739,6 +1412,7 @@ class Client:
         widget: Optional[str] = None,
         limit: Optional[int] = None,
         batch: Optional[int] = PARTS_BATCH_LIMIT,
+        concurrency: Optional[int] = None,
         **kwargs,
     ) -> PartSet:
         """Retrieve multiple KE-chain parts.
@@ -768,7 +1442,13 @@ class Client:
         :type limit: int or None
         :param batch: limit the batch size to # items (defaults to 100 items per batch)
         :type batch: int or None
-        :param kwargs: additional `keyword=value` arguments for the api
+        :param concurrency: (optional) number of batches to retrieve in parallel after the first batch,
+            defaults to retrieving the batches one after the other.
+        :type concurrency: int or None
+        :param kwargs: additional `keyword=value` arguments for the api, including the field projection:
+            `fields` to retrieve instead of the default fields (a list, a comma-separated string or the profile
+            `lean` retrieving the `id`, `name`, `parent_id` and `model_id`), `only` to retrieve a selection of
+            those fields and `defer` to skip some of them.
         :return: :class:`models.PartSet` which is an iterator of :class:`models.Part`
         :raises NotFoundError: If no `Part` is found
 
@@ -791,48 +1471,362 @@ class Client:
         >>> client.parts(limit=5)  # doctest:Ellipsis
         ...
 
+        Return all parts of a scope, retrieving 8 batches in parallel
+
+        >>> client.parts(scope_id=project.id, concurrency=8)  # doctest:Ellipsis
+        ...
+
+        Return the structure of a scope only, without the properties of the parts
+
+        >>> client.parts(scope_id=project.id, fields="lean")  # doctest:Ellipsis
+        ...
+
+        Return all parts without their properties
+
+        >>> client.parts(defer=["properties"])  # doctest:Ellipsis
+        ...
+
         """
-        # if limit is provided and the batchsize is bigger than the limit, ensure that the
-        # batch size is maximised
-        if limit and limit < batch:
-            batch = limit
+        from pykechain.models import Part, PartSet
+        request_params = self._parts_request_params(
+            name=name,
+            pk=pk,
+            model=model,
+            category=category,
+            scope_id=scope_id,
+            parent=parent,
+            activity=activity,
+            widget=widget,
+            **kwargs,
+        )
+
+        part_results = self._paginate(
+            self._build_url("parts"),
+            request_params,
+            limit=limit,
+            batch=batch,
+            concurrency=concurrency,
+            description="Parts",
+        )
+
+        return PartSet(Part(p, client=self) for p in part_results)
+
+    def iter_parts(
+        self,
+        name: Optional[str] = None,
+        pk: Optional[str] = None,
+        model: Optional[Part] = None,
+        category: Optional[Union[Category, str]] = Category.INSTANCE,
+        scope_id: Optional[str] = None,
+        parent: Optional[str] = None,
+        activity: Optional[str] = None,
+        widget: Optional[str] = None,
+        limit: Optional[int] = None,
+        batch: Optional[int] = PARTS_BATCH_LIMIT,
+        prefetch: bool = True,
+        **kwargs,
+    ) -> Iterator[Part]:
+        """Iterate over multiple KE-chain parts, batch by batch.
+
+        Uses the same interface as the :func:`parts` method, but yields the parts as soon as their batch is
+        retrieved instead of building a complete :class:`models.PartSet`. Only a single batch of parts is kept
+        in memory and the next batch is retrieved in the background while the parts are being consumed.
+
+        .. versionadded:: 4.13
+
+        :param limit: limit the return to # items (default unlimited, so return all results)
+        :type limit: int or None
+        :param batch: limit the batch size to # items (defaults to 100 items per batch)
+        :type batch: int or None
+        :param prefetch: (optional) retrieve the next batch in the background, defaults to True
+        :type prefetch: bool
+        :param kwargs: additional `keyword=value` arguments for the api, see :func:`parts`
+        :return: generator of :class:`models.Part`
+        :raises NotFoundError: If a batch of parts could not be retrieved
+
+        Example
+        -------
+        >>> for part in client.iter_parts(scope_id=project.id):
+        ...     export(part)
+
+        """
+        from pykechain.models import Part
+        request_params = self._parts_request_params(
+            name=name,
+            pk=pk,
+            model=model,
+            category=category,
+            scope_id=scope_id,
+            parent=parent,
+            activity=activity,
+            widget=widget,
+            **kwargs,
+        )
+
+        for json in self._iter_paginated(
+            self._build_url("parts"),
+            request_params,
+            limit=limit,
+            batch=batch,
+            prefetch=prefetch,
+            description="Parts",
+        ):
+            yield Part(json, client=self)
 
+    @staticmethod
+    def _parts_request_params(
+        name: Optional[str] = None,
+        pk: Optional[str] = None,
+        model: Optional[Part] = None,
+        category: Optional[Union[Category, str]] = Category.INSTANCE,
+        scope_id: Optional[str] = None,
+        parent: Optional[str] = None,
+        activity: Optional[str] = None,
+        widget: Optional[str] = None,
+        **kwargs,
+    ) -> Dict:
+        """Build the request parameters to retrieve parts, see :func:`parts`."""
+        from pykechain.models import Activity, Part
+        from pykechain.models.widgets.widget import Widget
         request_params = dict(
             id=check_uuid(pk),
             name=check_text(text=name, key="name"),
             category=check_enum(category, Category, "category"),
             activity_id=check_base(activity, Activity, "activity"),
             widget_id=check_base(widget, Widget, "widget"),
-            limit=batch,
             scope_id=check_uuid(scope_id),
             parent_id=check_base(parent, Part, "parent"),
             model_id=check_base(model, Part, "model"),
         )
-        url = self._build_url("parts")
-        request_params.update(API_EXTRA_PARAMS["parts"])
+        request_params.update(Client._fields_params("parts", kwargs))
 
         if kwargs:
             request_params.update(**kwargs)
 
-        response = self._request("GET", url, params=request_params)
+        return request_params
 
-        if response.status_code != requests.codes.ok:  # pragma: no cover
-            raise NotFoundError("Could not retrieve Parts", response=response)
+    def _paginate(
+        self,
+        url: str,
+        request_params: Optional[Dict] = None,
+        limit: Optional[int] = None,
+        batch: Optional[int] = None,
+        concurrency: Optional[int] = None,
+        description: str = "objects",
+    ) -> List[Dict]:
+        """
+        Retrieve the json results of all batches of a (paginated) list endpoint of KE-chain.
 
-        data = response.json()
+        The `next` links in the responses are followed until all results are retrieved or until the `limit`
+        is reached. When a `concurrency` is provided, the offsets of the remaining batches are computed from the
+        `count` of results reported in the first response and these batches are retrieved in parallel.
 
-        part_results = data["results"]
+        The pagination arguments `limit`, `batch` and `concurrency` may also be provided as part of the
+        `request_params`, as the list methods of the `Client` pass their `keyword=value` arguments on as request
+        parameters.
 
-        if batch and data.get("next"):
-            while data["next"]:
-                # respect the limit if set to > 0
-                if limit and len(part_results) >= limit:
-                    break
-                response = self._request("GET", data["next"])
-                data = response.json()
-                part_results.extend(data["results"])
+        :param url: url of the list endpoint
+        :type url: basestring
+        :param request_params: (optional) query parameters of the request
+        :type request_params: dict or None
+        :param limit: (optional) maximum number of results to retrieve, defaults to all results
+        :type limit: int or None
+        :param batch: (optional) number of results per batch, defaults to the batch size of KE-chain
+        :type batch: int or None
+        :param concurrency: (optional) number of batches to retrieve in parallel after the first batch
+        :type concurrency: int or None
+        :param description: (optional) description of the results used in the error message
+        :type description: basestring
+        :return: list of json results in the order provided by KE-chain
+        :raises NotFoundError: if a batch could not be retrieved
+        """
+        request_params, limit, batch, concurrency = self._pagination_params(
+            request_params, limit=limit, batch=batch, concurrency=concurrency
+        )
 
-        return PartSet(Part(p, client=self) for p in part_results)
+        data = self._retrieve_batch(url, request_params, description=description)
+        results = data["results"]
+        count = min(data.get("count") or 0, limit) if limit else data.get("count")
+
+        if concurrency and count and results and data.get("next") and "offset=" in data["next"]:
+            # the remaining batches follow the first batch, which starts at the offset requested by the caller
+            # and has the batch size applied by KE-chain. An empty first batch (eg. objects deleted since the
+            # count) gives no batch size, hence its `next` links are followed instead.
+            batch = len(results)
+            offset = int(request_params.get("offset") or 0)
+            end = min(data["count"], offset + limit) if limit else data["count"]
+            offsets = range(offset + batch, end, batch)
+            with ThreadPoolExecutor(max_workers=concurrency) as executor:
+                batches = executor.map(
+                    lambda offset: self._retrieve_batch(
+                        url,
+                        dict(request_params, limit=batch, offset=offset),
+                        description=description,
+                    ),
+                    offsets,
+                )
+                for batch_data in batches:
+                    results.extend(batch_data["results"])
+        else:
+            while data.get("next") and not (limit and len(results) >= limit):
+                data = self._retrieve_batch(data["next"], description=description)
+                results.extend(data["results"])
+
+        return results[:limit] if limit else results
+
+    def _iter_paginated(
+        self,
+        url: str,
+        request_params: Optional[Dict] = None,
+        limit: Optional[int] = None,
+        batch: Optional[int] = None,
+        prefetch: bool = True,
+        description: str = "objects",
+    ) -> Iterator[Dict]:
+        """
+        Iterate over the json results of a (paginated) list endpoint of KE-chain, batch by batch.
+
+        Only a single batch of results is kept in memory at any time. While the results of a batch are
+        consumed, the next batch is already retrieved in a background thread, unless `prefetch` is disabled.
+
+        :param url: url of the list endpoint
+        :type url: basestring
+        :param request_params: (optional) query parameters of the request
+        :type request_params: dict or None
+        :param limit: (optional) maximum number of results to retrieve, defaults to all results
+        :type limit: int or None
+        :param batch: (optional) number of results per batch, defaults to the batch size of KE-chain
+        :type batch: int or None
+        :param prefetch: (optional) retrieve the next batch in the background, defaults to True
+        :type prefetch: bool
+        :param description: (optional) description of the results used in the error message
+        :type description: basestring
+        :return: generator of json results in the order provided by KE-chain
+        :raises NotFoundError: if a batch could not be retrieved
+        """
+        request_params, limit, batch, _ = self._pagination_params(
+            request_params, limit=limit, batch=batch
+        )
+
+        with ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="pykechain-prefetch"
+        ) as executor:
+            data = self._retrieve_batch(url, request_params, description=description)
+            remaining = limit
+            while True:
+                results = data["results"][:remaining] if limit else data["results"]
+                if limit:
+                    remaining -= len(results)
+
+                next_batch = None
+                if data.get("next") and not (limit and remaining <= 0):
+                    if prefetch:
+                        next_batch = executor.submit(
+                            self._retrieve_batch, data["next"], description=description
+                        )
+                    else:
+                        next_batch = data["next"]
+
+                yield from results
+
+                if next_batch is None:
+                    return
+                elif prefetch:
+                    data = next_batch.result()
+                else:
+                    data = self._retrieve_batch(next_batch, description=description)
+
+    @staticmethod
+    def _pagination_params(
+        request_params: Optional[Dict] = None,
+        limit: Optional[int] = None,
+        batch: Optional[int] = None,
+        concurrency: Optional[int] = None,
+    ) -> Tuple[Dict, Optional[int], Optional[int], Optional[int]]:
+        """
+        Separate the pagination arguments from the query parameters of a list endpoint.
+
+        :return: tuple of the query parameters (including the batch size), limit, batch and concurrency
+        """
+        request_params = dict(request_params or {})
+        limit = check_type(request_params.pop("limit", None), int, "limit") or limit
+        batch = check_type(request_params.pop("batch", None), int, "batch") or batch
+        concurrency = (
+            check_type(request_params.pop("concurrency", None), int, "concurrency")
+            or concurrency
+        )
+
+        # if limit is provided and the batchsize is bigger than the limit, ensure that the
+        # batch size is maximised
+        if limit and (not batch or limit < batch):
+            batch = limit
+        if batch:
+            request_params["limit"] = batch
+
+        return request_params, limit, batch, concurrency
+
+    @staticmethod
+    def _fields_params(resource: str, kwargs: Dict) -> Dict:
+        """
+        Separate the field projection arguments from the keyword arguments and build the extra query parameters.
+
+        The `fields` replace the fields retrieved by default, either as a list of field names, a comma-separated
+        string or the name of a profile in `API_FIELDS_PROFILES` (eg. `lean`). The `only` fields restrict and the
+        `defer` fields remove fields of that selection. The `id` is always retrieved.
+
+        :param resource: name of the resource in the `API_EXTRA_PARAMS`, eg. `parts`
+        :param kwargs: keyword arguments of a retrieval method, from which `fields`, `only` and `defer` are popped
+        :return: the extra query parameters of the resource with the projected `fields`
+        :raises IllegalArgumentError: if the field projection arguments are not strings or lists of strings
+        """
+        extra_params = dict(API_EXTRA_PARAMS[resource])
+        fields = kwargs.pop("fields", None)
+        only = kwargs.pop("only", None)
+        defer = kwargs.pop("defer", None)
+        if fields is None and only is None and defer is None:
+            return extra_params
+
+        def field_names(value, key: str) -> List[str]:
+            if isinstance(value, str):
+                return [field.strip() for field in value.split(",") if field.strip()]
+            return check_list_of_text(value, key) or list()
+
+        default_fields = field_names(extra_params.get("fields", ""), "fields")
+        if fields is None:
+            selected = default_fields
+        elif isinstance(fields, str) and fields in API_FIELDS_PROFILES:
+            selected = [f for f in API_FIELDS_PROFILES[fields] if f in default_fields]
+        else:
+            selected = field_names(fields, "fields")
+        if only is not None:
+            only = set(field_names(only, "only"))
+            selected = [f for f in selected if f in only]
+        if defer is not None:
+            defer = set(field_names(defer, "defer"))
+            selected = [f for f in selected if f not in defer]
+        if "id" not in selected:
+            selected.insert(0, "id")
+
+        extra_params["fields"] = ",".join(selected)
+        return extra_params
+
+    def _retrieve_batch(
+        self,
+        url: str,
+        request_params: Optional[Dict] = None,
+        description: str = "objects",
+    ) -> Dict:
+        """Retrieve a single batch of a list endpoint of KE-chain and return its json data."""
+        response = self._request("GET", url, params=request_params)
+
+        if response.status_code != requests.codes.ok:  # pragma: no cover
+            raise NotFoundError(
+                f"Could not retrieve {description}",
+                response=response,
+                json_codec=self.json_codec,
+            )
+
+        return self.json_codec.decode(response)
 
     def part(self, *args, **kwargs) -> Part:
         """Retrieve single KE-chain part.
@@ -851,6 +1845,7 @@ class Client:
         :raises NotFoundError: When no `Part` is found
         :raises MultipleFoundError: When more than a single `Part` is found
         """
+        from pykechain.models import Part
         part_id = None
         if len(args) >= 2:
             # the 2nd arg (index 1) is the pk
@@ -865,13 +1860,17 @@ class Client:
 
         if part_id:
             url = self._build_url("part", part_id=part_id)
-            request_params = API_EXTRA_PARAMS["part"]
+            request_params = self._fields_params("part", kwargs)
 
             response = self._request("GET", url, params=request_params)
             if response.status_code != requests.codes.ok:  # pragma: no cover
-                raise NotFoundError("Could not retrieve Part", response=response)
+                raise NotFoundError(
+                    "Could not retrieve Part",
+                    response=response,
+                    json_codec=self.json_codec,
+                )
 
-            data = response.json()
+            data = self.json_codec.decode(response)
             part_results = data["results"][0]
             return Part(part_results, client=self)
 
@@ -915,27 +1914,83 @@ class Client:
         :type pk: basestring or None
         :param category: filter the properties by category. Defaults to INSTANCE. Other options MODEL or None
         :type category: basestring or None
-        :param kwargs: (optional) additional search keyword arguments
+        :param kwargs: (optional) additional search keyword arguments,
+            `fields`, `only` and `defer` select the fields to retrieve, see :func:`parts`.
         :return: list of :class:`models.Property`
         :raises NotFoundError: When no `Property` is found
         """
+        from pykechain.models import Property
+        request_params = self._properties_request_params(
+            name=name, pk=pk, category=category, **kwargs
+        )
+        results = self._paginate(
+            self._build_url("properties"), request_params, description="Properties"
+        )
+
+        return [Property.create(p, client=self) for p in results]
+
+    def iter_properties(
+        self,
+        name: Optional[str] = None,
+        pk: Optional[str] = None,
+        category: Optional[Union[Category, str]] = Category.INSTANCE,
+        limit: Optional[int] = None,
+        batch: Optional[int] = None,
+        prefetch: bool = True,
+        **kwargs,
+    ) -> Iterator["AnyProperty"]:
+        """Iterate over properties, batch by batch.
+
+        Uses the same interface as the :func:`properties` method, but yields the properties as soon as their
+        batch is retrieved. Only a single batch of properties is kept in memory and the next batch is
+        retrieved in the background while the properties are being consumed.
+
+        .. versionadded:: 4.13
+
+        :param limit: (optional) maximum number of properties, defaults to all properties
+        :type limit: int or None
+        :param batch: (optional) number of properties per batch, defaults to the batch size of KE-chain
+        :type batch: int or None
+        :param prefetch: (optional) retrieve the next batch in the background, defaults to True
+        :type prefetch: bool
+        :param kwargs: additional `keyword=value` arguments for the api, see :func:`properties`
+        :return: generator of :class:`models.Property`
+        :raises NotFoundError: If a batch of properties could not be retrieved
+        """
+        from pykechain.models import Property
+        request_params = self._properties_request_params(
+            name=name, pk=pk, category=category, **kwargs
+        )
+
+        for json in self._iter_paginated(
+            self._build_url("properties"),
+            request_params,
+            limit=limit,
+            batch=batch,
+            prefetch=prefetch,
+            description="Properties",
+        ):
+            yield Property.create(json, client=self)
+
+    @staticmethod
+    def _properties_request_params(
+        name: Optional[str] = None,
+        pk: Optional[str] = None,
+        category: Optional[Union[Category, str]] = Category.INSTANCE,
+        **kwargs,
+    ) -> Dict:
+        """Build the request parameters to retrieve properties, see :func:`properties`."""
         request_params = {
             "name": check_text(text=name, key="name"),
             "id": check_uuid(pk),
             "category": check_enum(category, Category, "category"),
         }
+        fields_params = Client._fields_params("properties", kwargs)
         if kwargs:  # pragma: no cover
             request_params.update(**kwargs)
 
-        request_params.update(API_EXTRA_PARAMS["properties"])
-        response = self._request(
-            "GET", self._build_url("properties"), params=request_params
-        )
-
-        if response.status_code != requests.codes.ok:  # pragma: no cover
-            raise NotFoundError("Could not retrieve Properties", response=response)
-
-        return [Property.create(p, client=self) for p in response.json()["results"]]
+        request_params.update(fields_params)
+        return request_params
 
     def property(self, *args, **kwargs) -> "AnyProperty":  # noqa: F
         """Retrieve single KE-chain Property.
@@ -954,6 +2009,7 @@ class Client:
         :raises NotFoundError: When no `Property` is found
         :raises MultipleFoundError: When more than a single `Property` is found
         """
+        from pykechain.models import Property
         property_id = None
         if len(args) >= 2:
             # the 2nd arg (index 1) is the pk
@@ -972,9 +2028,13 @@ class Client:
 
             response = self._request("GET", url, params=request_params)
             if response.status_code != requests.codes.ok:  # pragma: no cover
-                raise NotFoundError("Could not retrieve Property", response=response)
+                raise NotFoundError(
+                    "Could not retrieve Property",
+                    response=response,
+                    json_codec=self.json_codec,
+                )
 
-            data = response.json()
+            data = self.json_codec.decode(response)
             property_results = data["results"][0]
             return Property.create(property_results, client=self)
         return self._retrieve_singular(self.properties, *args, **kwargs)
@@ -1002,6 +2062,7 @@ class Client:
         :return: list of :class:`models.Service` objects
         :raises NotFoundError: When no `Service` objects are found
         """
+        from pykechain.models import Service
         request_params = {
             "name": check_text(text=name, key="name"),
             "id": check_uuid(pk),
@@ -1012,14 +2073,11 @@ class Client:
         if kwargs:
             request_params.update(**kwargs)
 
-        response = self._request(
-            "GET", self._build_url("services"), params=request_params
+        results = self._paginate(
+            self._build_url("services"), request_params, description="Services"
         )
 
-        if response.status_code != requests.codes.ok:  # pragma: no cover
-            raise NotFoundError("Could not retrieve Services", response=response)
-
-        return [Service(service, client=self) for service in response.json()["results"]]
+        return [Service(service, client=self) for service in results]
 
     def service(self, *args, **kwargs):
         """
@@ -1061,6 +2119,7 @@ class Client:
         :return: a single :class:`models.ServiceExecution` object
         :raises NotFoundError: When no `ServiceExecution` object is found
         """
+        from pykechain.models import ServiceExecution
         request_params = {
             "name": check_text(text=name, key="name"),
             "id": check_uuid(pk),
@@ -1070,18 +2129,15 @@ class Client:
         if kwargs:
             request_params.update(**kwargs)
 
-        response = self._request(
-            "GET", self._build_url("service_executions"), params=request_params
+        results = self._paginate(
+            self._build_url("service_executions"),
+            request_params,
+            description="Service Executions",
         )
 
-        if response.status_code != requests.codes.ok:  # pragma: no cover
-            raise NotFoundError(
-                "Could not retrieve Service Executions", response=response
-            )
-
         return [
             ServiceExecution(service_execution, client=self)
-            for service_execution in response.json()["results"]
+            for service_execution in results
         ]
 
     def service_execution(self, *args, **kwargs):
@@ -1117,6 +2173,7 @@ class Client:
         :return: List of :class:`Users`
         :raises NotFoundError: when a user could not be found
         """
+        from pykechain.models import User
         request_params = {
             "username": check_text(text=username, key="username"),
             "id": check_type(pk, (str, int), "pk"),
@@ -1124,12 +2181,11 @@ class Client:
         if kwargs:
             request_params.update(**kwargs)
 
-        response = self._request("GET", self._build_url("users"), params=request_params)
-
-        if response.status_code != requests.codes.ok:  # pragma: no cover
-            raise NotFoundError("Could not retrieve Users", response=response)
+        results = self._paginate(
+            self._build_url("users"), request_params, description="Users"
+        )
 
-        return [User(user, client=self) for user in response.json()["results"]]
+        return [User(user, client=self) for user in results]
 
     def user(self, *args, **kwargs) -> User:
         """
@@ -1153,6 +2209,7 @@ class Client:
         :returns User
         :rtype User
         """
+        from pykechain.models import User
         try:
             response = self._request(
                 method="GET", url=self._build_url(resource="user_current")
@@ -1163,9 +2220,13 @@ class Client:
             )
 
         if response.status_code != requests.codes.ok:  # pragma: no cover
-            raise NotFoundError("Could not retrieve current User", response=response)
+            raise NotFoundError(
+                "Could not retrieve current User",
+                response=response,
+                json_codec=self.json_codec,
+            )
 
-        return User(response.json()["results"][0], client=self)
+        return User(self.json_codec.decode(response)["results"][0], client=self)
 
     def create_user(
         self,
@@ -1193,6 +2254,7 @@ class Client:
         :param send_passwd_link: (optional) boolean to send out a password reset link after
             the user is created. Defaults to False.
         """
+        from pykechain.models import Team, User
         request_payload = {
             "username": check_text(username, "username"),
             "email": check_text(email, "email"),
@@ -1207,9 +2269,13 @@ class Client:
         response = self._request("POST", self._build_url("users"), json=request_payload)
 
         if response.status_code != requests.codes.created:  # pragma: no cover
-            raise APIError("Could not create a new user", response=response)
+            raise APIError(
+                "Could not create a new user",
+                response=response,
+                json_codec=self.json_codec,
+            )
 
-        user = User(response.json()["results"][0], client=self)
+        user = User(self.json_codec.decode(response)["results"][0], client=self)
         if send_passwd_link:
             user.reset_password()
 
@@ -1237,6 +2303,7 @@ class Client:
         :return: List of :class:`Teams`
         :raises NotFoundError: when a team could not be found
         """
+        from pykechain.models import Team
         request_params = {
             "name": check_text(text=name, key="name"),
             "id": check_uuid(pk),
@@ -1245,12 +2312,11 @@ class Client:
         if kwargs:
             request_params.update(**kwargs)
 
-        response = self._request("GET", self._build_url("teams"), params=request_params)
-
-        if response.status_code != requests.codes.ok:  # pragma: no cover
-            raise NotFoundError("Could not retrieve Teams", response=response)
+        results = self._paginate(
+            self._build_url("teams"), request_params, description="Teams"
+        )
 
-        return [Team(team, client=self) for team in response.json()["results"]]
+        return [Team(team, client=self) for team in results]
 
     def team(self, *args, **kwargs):
         """
@@ -1280,14 +2346,16 @@ class Client:
         :type pk: basestring or None
         :param activity: (optional) the :class:`Activity` or UUID of the activity to filter the widgets for.
         :type activity: basestring or None
-        :param kwargs: additional keyword arguments
+        :param kwargs: additional keyword arguments,
+            `fields`, `only` and `defer` select the fields to retrieve, see :func:`parts`.
         :return: A list of Widget objects
         :rtype: List
         :raises NotFoundError: when the widgets could not be found
         :raises APIError: when the API does not support the widgets, or when the API gives an error.
         """
-        """Widgets of an activity."""
-        request_params = dict(API_EXTRA_PARAMS["widgets"])
+        from pykechain.models import Activity
+        from pykechain.models.widgets.widget import Widget
+        request_params = self._fields_params("widgets", kwargs)
         request_params["id"] = check_uuid(pk)
 
         if isinstance(activity, Activity):
@@ -1298,16 +2366,11 @@ class Client:
         if kwargs:
             request_params.update(**kwargs)
 
-        response = self._request(
-            "GET", self._build_url("widgets"), params=request_params
+        results = self._paginate(
+            self._build_url("widgets"), request_params, description="Widgets"
         )
 
-        if response.status_code != requests.codes.ok:  # pragma: no cover
-            raise NotFoundError("Could not retrieve Widgets", response=response)
-
-        return [
-            Widget.create(json=json, client=self) for json in response.json()["results"]
-        ]
+        return [Widget.create(json=json, client=self) for json in results]
 
     def widget(self, *args, **kwargs) -> Widget:
         """
@@ -1362,6 +2425,7 @@ class Client:
         :raises APIError: When the object could not be created
         :raises IllegalArgumentError: When an incorrect arguments are provided
         """
+        from pykechain.models import Activity
         if isinstance(parent, Activity):
             parent_classification = parent.classification
             parent_id = parent.id
@@ -1422,9 +2486,15 @@ class Client:
         )
 
         if response.status_code != requests.codes.created:  # pragma: no cover
-            raise APIError("Could not create Activity.", response=response)
+            raise APIError(
+                "Could not create Activity.",
+                response=response,
+                json_codec=self.json_codec,
+            )
 
-        new_activity = Activity(response.json()["results"][0], client=self)
+        new_activity = Activity(
+            self.json_codec.decode(response)["results"][0], client=self
+        )
         if isinstance(parent, Activity) and parent._cached_children is not None:
             parent._cached_children.append(new_activity)
         return new_activity
@@ -1483,6 +2553,7 @@ class Client:
         :rtype: list
         :raises APIError if cloned
         """
+        from pykechain.models import Activity, Part
         if self.match_app_version(
             label="kechain2.core.pim", version=">=3.7.0"
         ):  # pragma: no cover
@@ -1553,10 +2624,15 @@ class Client:
         if (asynchronous and response.status_code != requests.codes.accepted) or (
             not asynchronous and response.status_code != requests.codes.created
         ):  # pragma: no cover
-            raise APIError("Could not clone Activities.", response=response)
+            raise APIError(
+                "Could not clone Activities.",
+                response=response,
+                json_codec=self.json_codec,
+            )
 
         cloned_activities = [
-            Activity(d, client=self) for d in response.json()["results"]
+            Activity(d, client=self)
+            for d in self.json_codec.decode(response)["results"]
         ]
 
         if isinstance(activity_parent, Activity):
@@ -1581,10 +2657,15 @@ class Client:
         response = self._request("PUT", url, json=activities)
 
         if response.status_code != requests.codes.ok:  # pragma: no cover
-            raise APIError("Could not update Activities", response=response)
+            raise APIError(
+                "Could not update Activities",
+                response=response,
+                json_codec=self.json_codec,
+            )
 
     def _create_part(self, action: str, data: Dict, **kwargs) -> Optional[Part]:
         """Create a part for PIM 2 internal core function."""
+        from pykechain.models import Part
         # suppress_kevents should be in the data (not the query_params)
         if "suppress_kevents" in kwargs:
             data["suppress_kevents"] = kwargs.pop("suppress_kevents")
@@ -1598,9 +2679,11 @@ class Client:
         )
 
         if response.status_code != requests.codes.created:
-            raise APIError("Could not create Part", response=response)
+            raise APIError(
+                "Could not create Part", response=response, json_codec=self.json_codec
+            )
 
-        return Part(response.json()["results"][0], client=self)
+        return Part(self.json_codec.decode(response)["results"][0], client=self)
 
     def create_part(
         self, parent: Part, model: Part, name: Optional[str] = None, **kwargs
@@ -1624,6 +2707,7 @@ class Client:
         :raises IllegalArgumentError: When the provided arguments are incorrect
         :raises APIError: if the `Part` could not be created
         """
+        from pykechain.models import Part
         if not isinstance(parent, Part) or not isinstance(model, Part):
             raise IllegalArgumentError(
                 "The `parent` and `model` should be 'Part' objects"
@@ -1663,6 +2747,7 @@ class Client:
         :raises IllegalArgumentError: When the provided arguments are incorrect
         :raises APIError: if the `Part` could not be created
         """
+        from pykechain.models import Part
         if isinstance(parent, Part):
             pass
         elif is_uuid(parent):
@@ -1737,6 +2822,7 @@ class Client:
         ...                                                 properties_fvalues=properties_fvalues)
 
         """
+        from pykechain.models import Part
         if isinstance(parent, Part):
             pass
         elif is_uuid(parent):
@@ -1790,6 +2876,7 @@ class Client:
         :return: cloned :class:`models.Part`
         :raises APIError: if the `Part` could not be cloned
         """
+        from pykechain.models import Part
         check_type(part, Part, "part")
         check_type(parent, Part, "parent")
 
@@ -1824,9 +2911,11 @@ class Client:
         response = self._request("POST", url, params=query_params, data=data)
 
         if response.status_code != requests.codes.created:
-            raise APIError("Could not clone Part", response=response)
+            raise APIError(
+                "Could not clone Part", response=response, json_codec=self.json_codec
+            )
 
-        return Part(response.json()["results"][0], client=self)
+        return Part(self.json_codec.decode(response)["results"][0], client=self)
 
     def create_proxy_model(
         self,
@@ -1859,6 +2948,7 @@ class Client:
         :raises IllegalArgumentError: When the provided arguments are incorrect
         :raises APIError: if the `Part` could not be created
         """
+        from pykechain.models import Part
         check_type(model, Part, "model")
         check_type(parent, Part, "parent")
 
@@ -1909,6 +2999,7 @@ class Client:
         :return: list of Part instances or list of part UUIDs
         :rtype list
         """
+        from pykechain.models import PartSet
         check_list_of_dicts(
             parts,
             "parts",
@@ -1947,18 +3038,16 @@ class Client:
             not asynchronous and response.status_code != requests.codes.created
         ):  # pragma: no cover
             raise APIError(
-                f"Could not create Parts. ({response.status_code})", response=response
+                f"Could not create Parts. ({response.status_code})",
+                response=response,
+                json_codec=self.json_codec,
             )
 
-        part_ids = response.json()["results"][0]["parts_created"]
+        part_ids = self.json_codec.decode(response)["results"][0]["parts_created"]
         if retrieve_instances:
-            instances_per_id = dict()
-            for part_ids_chunk in get_in_chunks(lst=part_ids, chunk_size=50):
-                instances_per_id.update(
-                    {
-                        p.id: p for p in self.parts(id__in=",".join(part_ids_chunk))
-                    }  # `id__in` does not guarantee order
-                )
+            instances_per_id = self._retrieve_in_chunks(
+                self.parts, part_ids, chunk_size=50
+            )
             part_instances = [
                 instances_per_id[pk] for pk in part_ids
             ]  # Ensures order of parts wrt request
@@ -1982,6 +3071,7 @@ class Client:
         :raises APIError: if the parts could not be deleted
         :raises IllegalArgumentError: if there were neither Parts nor UUIDs in the list of parts
         """
+        from pykechain.models import Part
         check_type(asynchronous, bool, "asynchronous")
 
         list_parts = list()
@@ -2011,7 +3101,9 @@ class Client:
             and response.status_code not in (requests.codes.ok, requests.codes.accepted)
         ):  # pragma: no cover
             raise APIError(
-                f"Could not delete Parts. ({response.status_code})", response=response
+                f"Could not delete Parts. ({response.status_code})",
+                response=response,
+                json_codec=self.json_codec,
             )
         return True
 
@@ -2054,6 +3146,7 @@ class Client:
         :raises IllegalArgumentError: When the provided arguments are incorrect
         :raises APIError: if the `Property` model could not be created
         """
+        from pykechain.models import Part, Property
         check_enum(property_type, PropertyType, "property_type")
         check_type(model, Part, "model")
         if model.category != Category.MODEL:
@@ -2110,9 +3203,15 @@ class Client:
         response = self._request("POST", url, params=query_params, json=data)
 
         if response.status_code != requests.codes.created:
-            raise APIError("Could not create Property", response=response)
+            raise APIError(
+                "Could not create Property",
+                response=response,
+                json_codec=self.json_codec,
+            )
 
-        prop = Property.create(response.json()["results"][0], client=self)
+        prop = Property.create(
+            self.json_codec.decode(response)["results"][0], client=self
+        )
 
         model.properties.append(prop)
 
@@ -2165,6 +3264,7 @@ class Client:
         :raises APIError: In case of failure of the creation or failure to upload the pkg_path
         :raises OSError: In case of failure to locate the `pkg_path`
         """
+        from pykechain.models import Scope, Service
         data = dict(
             name=check_text(name, "name"),
             scope=check_base(scope, Scope, "scope"),  # not scope_id!
@@ -2180,9 +3280,15 @@ class Client:
         response = self._request("POST", self._build_url("services"), json=data)
 
         if response.status_code != requests.codes.created:  # pragma: no cover
-            raise APIError("Could not create Service", response=response)
+            raise APIError(
+                "Could not create Service",
+                response=response,
+                json_codec=self.json_codec,
+            )
 
-        service = Service(response.json().get("results")[0], client=self)
+        service = Service(
+            self.json_codec.decode(response).get("results")[0], client=self
+        )
 
         if pkg_path:
             # upload the package / refresh of the service will be done in the upload function
@@ -2227,6 +3333,7 @@ class Client:
         :return: the created :class:`models.Scope`
         :raises APIError: In case of failure of the creation of new Scope
         """
+        from pykechain.models import Scope, Team
         start_date = start_date if start_date else datetime.datetime.now()
 
         data_dict = {
@@ -2247,9 +3354,11 @@ class Client:
         response = self._request("POST", url, params=query_params, data=data_dict)
 
         if response.status_code != requests.codes.created:  # pragma: no cover
-            raise APIError("Could not create Scope", response=response)
+            raise APIError(
+                "Could not create Scope", response=response, json_codec=self.json_codec
+            )
 
-        return Scope(response.json()["results"][0], client=self)
+        return Scope(self.json_codec.decode(response)["results"][0], client=self)
 
     def delete_scope(self, scope: Scope, asynchronous: Optional[bool] = True) -> bool:
         """
@@ -2266,6 +3375,7 @@ class Client:
         :return: True when the delete is a success.
         :raises APIError: in case of failure in the deletion of the scope
         """
+        from pykechain.models import Scope
         check_type(scope, Scope, "scope")
 
         query_options = {
@@ -2279,7 +3389,11 @@ class Client:
         )
 
         if response.status_code != requests.codes.no_content:  # pragma: no cover
-            raise APIError(f"Could not delete Scope {scope}", response=response)
+            raise APIError(
+                f"Could not delete Scope {scope}",
+                response=response,
+                json_codec=self.json_codec,
+            )
 
         return True
 
@@ -2332,6 +3446,7 @@ class Client:
         :raises IllegalArgumentError: When the provided arguments are incorrect
         :raises APIError: When the server is unable to clone the scope (eg. permissions)
         """
+        from pykechain.models import Scope, Team
         check_type(source_scope, Scope, "scope")
         check_type(scope_options, dict, "scope_options")
 
@@ -2361,17 +3476,23 @@ class Client:
         if response.status_code != requests.codes.created:  # pragma: no cover
             if response.status_code == requests.codes.forbidden:
                 raise ForbiddenError(
-                    f"Forbidden to clone Scope {source_scope}", response=response
+                    f"Forbidden to clone Scope {source_scope}",
+                    response=response,
+                    json_codec=self.json_codec,
                 )
             else:
                 raise APIError(
-                    f"Could not clone Scope {source_scope}", response=response
+                    f"Could not clone Scope {source_scope}",
+                    response=response,
+                    json_codec=self.json_codec,
                 )
 
         if asynchronous:
             return None
 
-        cloned_scope = Scope(response.json()["results"][0], client=source_scope._client)
+        cloned_scope = Scope(
+            self.json_codec.decode(response)["results"][0], client=source_scope._client
+        )
 
         # TODO work-around, some attributes are not (yet) in the KE-chain response.json()
         cloned_scope._tags = tags
@@ -2411,6 +3532,7 @@ class Client:
         :raises IllegalArgumentError: When the provided arguments are incorrect
         :raises APIError: When an API Error occurs
         """
+        from pykechain.models import Team, User
         if isinstance(user, str):
             user = self.user(username=user)
         elif isinstance(user, int):
@@ -2433,9 +3555,13 @@ class Client:
         response = self._request("POST", url, json=data)
 
         if response.status_code != requests.codes.created:  # pragma: no cover
-            raise APIError("Could not create Team", response=response)
+            raise APIError(
+                "Could not create Team", response=response, json_codec=self.json_codec
+            )
 
-        new_team = Team(json=response.json().get("results")[0], client=self)
+        new_team = Team(
+            json=self.json_codec.decode(response).get("results")[0], client=self
+        )
 
         new_team.add_members([user], role=TeamRoles.OWNER)
         team_members = new_team.members()
@@ -2463,6 +3589,8 @@ class Client:
         **kwargs,
     ) -> Dict:
         """Validate the format and content of the configuration of a widget."""
+        from pykechain.models import Activity
+        from pykechain.models.widgets.widget import Widget
         if widget_type == WidgetTypes.PROGRESS:
             warnings.warn(
                 "The progress widget is not available in KE-chain from June 2024 onwards.",
@@ -2507,6 +3635,7 @@ class Client:
         :return: Tuple with both input lists, now with only UUIDs
         :rtype Tuple[List, List]
         """
+        from pykechain.models import Part, Property
         if kwargs.get("inputs"):
             readable_models = kwargs.pop("inputs")
         if kwargs.get("outputs"):
@@ -2579,6 +3708,8 @@ class Client:
         :raises IllegalArgumentError: when an illegal argument is send.
         :raises APIError: when an API Error occurs.
         """
+        from pykechain.models import Activity
+        from pykechain.models.widgets.widget import Widget
         data = self._validate_widget(
             activity=activity,
             widget_type=widget_type,
@@ -2609,13 +3740,17 @@ class Client:
         )
 
         if response.status_code != requests.codes.created:  # pragma: no cover
-            raise APIError("Could not create Widget", response=response)
+            raise APIError(
+                "Could not create Widget", response=response, json_codec=self.json_codec
+            )
 
         # create the widget and do postprocessing
         manager = activity._widgets_manager if isinstance(activity, Activity) else None
 
         widget = Widget.create(
-            json=response.json().get("results")[0], client=self, manager=manager
+            json=self.json_codec.decode(response).get("results")[0],
+            client=self,
+            manager=manager,
         )
 
         # update the associations if needed
@@ -2638,6 +3773,7 @@ class Client:
         :return: list of `Widget` objects
         :rtype List[Widget]
         """
+        from pykechain.models.widgets.widget import Widget
         bulk_data = list()
         bulk_associations = list()
         for widget in widgets:
@@ -2668,11 +3804,15 @@ class Client:
         )
 
         if response.status_code != requests.codes.created:  # pragma: no cover
-            raise APIError("Could not create Widgets", response=response)
+            raise APIError(
+                "Could not create Widgets",
+                response=response,
+                json_codec=self.json_codec,
+            )
 
         # create the widget and do postprocessing
         widgets = []
-        for widget_response in response.json().get("results"):
+        for widget_response in self.json_codec.decode(response).get("results"):
             widget = Widget.create(json=widget_response, client=self)
             widgets.append(widget)
 
@@ -2691,6 +3831,7 @@ class Client:
         :return: list of Widget objects
         :rtype List[Widget]
         """
+        from pykechain.models.widgets.widget import Widget
         check_list_of_dicts(widgets, "widgets", fields=["id"])
         if len(widgets) != len({w.get("id") for w in widgets}):
             raise IllegalArgumentError(
@@ -2706,9 +3847,13 @@ class Client:
         )
 
         if response.status_code != requests.codes.ok:
-            raise APIError("Could not update Widgets", response=response)
+            raise APIError(
+                "Could not update Widgets",
+                response=response,
+                json_codec=self.json_codec,
+            )
 
-        widgets_response = response.json().get("results")
+        widgets_response = self.json_codec.decode(response).get("results")
         return [
             Widget.create(json=widget_json, client=self)
             for widget_json in widgets_response
@@ -2724,12 +3869,17 @@ class Client:
         :raises APIError: whenever the widget could not be deleted
         :raises IllegalArgumentError: whenever the input `widget` is invalid
         """
+        from pykechain.models.widgets.widget import Widget
         widget = check_base(widget, Widget, "widget")
         url = self._build_url("widget", widget_id=widget)
         response = self._request("DELETE", url)
 
         if response.status_code != requests.codes.no_content:  # pragma: no cover
-            raise APIError(f"Could not delete Widget {widget}", response=response)
+            raise APIError(
+                f"Could not delete Widget {widget}",
+                response=response,
+                json_codec=self.json_codec,
+            )
 
     def delete_widgets(self, widgets: List[Union[Widget, str]]) -> None:
         """
@@ -2741,6 +3891,7 @@ class Client:
         :raises APIError: whenever the widgets could not be deleted
         :raises IllegalArgumentError: whenever the input `widgets` is invalid
         """
+        from pykechain.models.widgets.widget import Widget
         widget_ids = check_list_of_base(widgets, Widget, "widgets")
 
         data = [dict(id=pk) for pk in widget_ids]
@@ -2749,7 +3900,11 @@ class Client:
         response = self._request("DELETE", url, json=data)
 
         if response.status_code != requests.codes.no_content:
-            raise APIError("Could not delete Widgets", response=response)
+            raise APIError(
+                "Could not delete Widgets",
+                response=response,
+                json_codec=self.json_codec,
+            )
 
     @staticmethod
     def _validate_associations(
@@ -2757,6 +3912,7 @@ class Client:
         associations: List[Tuple[List, List, Part, Part]],
     ) -> List[str]:
         """Perform the validation of the internal widgets and associations."""
+        from pykechain.models.widgets.widget import Widget
         widget_ids = check_list_of_base(widgets, Widget, "widgets")
 
         if not isinstance(associations, List) and all(
@@ -2802,6 +3958,8 @@ class Client:
         :return: list of association objects
         :rtype List[Association]
         """
+        from pykechain.models import Activity, Association, Part, Property, Scope
+        from pykechain.models.widgets.widget import Widget
         part = check_type(part, Part, "part")
         if part is not None:
             if part.category == Category.MODEL:
@@ -2845,10 +4003,15 @@ class Client:
         response = self._request("GET", url, params=request_params)
 
         if response.status_code != requests.codes.ok:  # pragma: no cover
-            raise APIError("Could not retrieve Associations", response=response)
+            raise APIError(
+                "Could not retrieve Associations",
+                response=response,
+                json_codec=self.json_codec,
+            )
 
         associations = [
-            Association(json=r, client=self) for r in response.json()["results"]
+            Association(json=r, client=self)
+            for r in self.json_codec.decode(response)["results"]
         ]
 
         return associations
@@ -2965,7 +4128,11 @@ class Client:
         )
 
         if response.status_code != requests.codes.ok:
-            raise APIError("Could not update Associations", response=response)
+            raise APIError(
+                "Could not update Associations",
+                response=response,
+                json_codec=self.json_codec,
+            )
 
         return None
 
@@ -3083,7 +4250,11 @@ class Client:
         )
 
         if response.status_code != requests.codes.ok:  # pragma: no cover
-            raise APIError("Could not set Associations", response=response)
+            raise APIError(
+                "Could not set Associations",
+                response=response,
+                json_codec=self.json_codec,
+            )
 
         return None
 
@@ -3100,6 +4271,7 @@ class Client:
         :raises APIError: when the associations could not be cleared.
         :raise IllegalArgumentError: if the widget is not of type Widget
         """
+        from pykechain.models.widgets.widget import Widget
         check_type(widget, Widget, "widget")
 
         # perform the call
@@ -3108,7 +4280,9 @@ class Client:
 
         if response.status_code != requests.codes.ok:  # pragma: no cover
             raise APIError(
-                f"Could not clear Associations of Widget {widget}", response=response
+                f"Could not clear Associations of Widget {widget}",
+                response=response,
+                json_codec=self.json_codec,
             )
 
         return None
@@ -3130,6 +4304,8 @@ class Client:
         :raises APIError: when the associations could not be removed
         :raise IllegalArgumentError: if the widget is not of type Widget
         """
+        from pykechain.models import Property
+        from pykechain.models.widgets.widget import Widget
         check_type(widget, Widget, "widget")
 
         model_ids = check_list_of_base(models, Property, "models")
@@ -3150,7 +4326,9 @@ class Client:
 
         if response.status_code != requests.codes.ok:  # pragma: no cover
             raise APIError(
-                f"Could not remove Associations of Widget {widget}", response=response
+                f"Could not remove Associations of Widget {widget}",
+                response=response,
+                json_codec=self.json_codec,
             )
 
         return
@@ -3178,6 +4356,7 @@ class Client:
         :raises IllegalArgumentError: if the 'parent' type is not :class:`Activity` or UUID
         :raises APIError: if an Error occurs.
         """
+        from pykechain.models import Activity
         activity = check_type(activity, Activity, "activity")
 
         if isinstance(parent, Activity):
@@ -3208,19 +4387,46 @@ class Client:
         response = self._request("PUT", url, data=update_dict)
 
         if response.status_code != requests.codes.ok:  # pragma: no cover
-            raise APIError(f"Could not move Activity {activity}", response=response)
+            raise APIError(
+                f"Could not move Activity {activity}",
+                response=response,
+                json_codec=self.json_codec,
+            )
 
         activity.parent_id = parent_id
 
-    def update_properties(self, properties: List[Dict]) -> List["AnyProperty"]:
+    def update_properties(
+        self,
+        properties: List[Dict],
+        chunk_size: int = PROPERTY_UPDATES_CHUNK_SIZE,
+        concurrency: Optional[int] = None,
+        return_objects: bool = True,
+    ) -> Optional[List["AnyProperty"]]:
         """
         Update multiple properties simultaneously.
 
+        The properties are updated with a request per `chunk_size` properties. When a `concurrency` is provided,
+        that many requests are sent in parallel. A chunk that could not be updated does not stop the update of the
+        other chunks: the failed chunks are reported together in a single `PropertiesUpdateError` afterwards, which
+        holds the properties of the chunks that were updated.
+
+        .. versionchanged:: 4.13
+           Added the `chunk_size`, `concurrency` and `return_objects` arguments.
+
         :param properties: list of dictionaries to set the properties
         :type properties: List[Dict]
-        :raises: IllegalArgumentError
-        :return: list of Properties
-        :rtype List[AnyProperty]
+        :param chunk_size: (optional) maximum number of properties to update per request, defaults to 100
+        :type chunk_size: int
+        :param concurrency: (optional) number of requests to send in parallel
+        :type concurrency: int or None
+        :param return_objects: (optional) create the updated properties from the response, defaults to True.
+            Set to False to save the memory and time of creating the properties when updating many properties.
+        :type return_objects: bool
+        :raises IllegalArgumentError: if the properties are not a list of dicts
+        :raises PropertiesUpdateError: if any of the chunks could not be updated, mentioning the properties of every
+            failed chunk and holding the properties of the chunks that were updated
+        :return: list of Properties, or None if `return_objects` is False
+        :rtype List[AnyProperty] or None
 
 
         Examples
@@ -3229,24 +4435,102 @@ class Client:
         >>> update_dicts = [dict(id=p.id, value=p.value) for p in properties]
         >>> client.update_properties(properties=update_dicts)
 
+        Update many properties, 4 requests at the time, without retrieving them
+
+        >>> client.update_properties(properties=update_dicts, chunk_size=500, concurrency=4, return_objects=False)
+
         """
         check_list_of_dicts(properties, "properties")
+        check_type(return_objects, bool, "return_objects")
+
+        chunks = list(get_in_chunks(lst=properties, chunk_size=chunk_size))
+        return_objects_per_chunk = [return_objects] * len(chunks)
+        if concurrency and len(chunks) > 1:
+            with ThreadPoolExecutor(max_workers=concurrency) as executor:
+                results = list(
+                    executor.map(
+                        self._update_properties_chunk, chunks, return_objects_per_chunk
+                    )
+                )
+        else:
+            results = list(
+                map(self._update_properties_chunk, chunks, return_objects_per_chunk)
+            )
 
-        response = self._request(
-            "POST",
-            self._build_url("properties_bulk_update"),
-            params=API_EXTRA_PARAMS["property"],
-            json=properties,
-        )
+        updated = [
+            prop for props, error in results if error is None for prop in props or ()
+        ]
+        failures = [
+            (index, error)
+            for index, (_, error) in enumerate(results)
+            if error is not None
+        ]
+        if failures:
+            raise PropertiesUpdateError(
+                "Could not update the Properties of {} out of {} chunk(s):\n{}".format(
+                    len(failures),
+                    len(chunks),
+                    "\n".join(
+                        "- chunk {} (properties {}): {}".format(
+                            index,
+                            ", ".join(str(p.get("id")) for p in chunks[index]),
+                            error.msg or str(error),
+                        )
+                        for index, error in failures
+                    ),
+                ),
+                response=failures[0][1].response,
+                json_codec=self.json_codec,
+                updated=updated,
+                updated_ids=[
+                    p.get("id")
+                    for chunk, (_, error) in zip(chunks, results)
+                    if error is None
+                    for p in chunk
+                ],
+                failed_ids=[
+                    p.get("id") for index, _ in failures for p in chunks[index]
+                ],
+            )
 
-        if response.status_code != requests.codes.ok:  # pragma: no cover
-            raise APIError("Could not update Properties", response=response)
+        if not return_objects:
+            return None
+        return updated
 
-        properties = [
-            Property.create(client=self, json=js) for js in response.json()["results"]
-        ]
+    def _update_properties_chunk(
+        self, properties: List[Dict], return_objects: bool = True
+    ) -> Tuple[Optional[List["AnyProperty"]], Optional[APIError]]:
+        """
+        Update a chunk of properties with a single request.
 
-        return properties
+        :param properties: list of dictionaries to set the properties
+        :param return_objects: (optional) create the updated properties from the response
+        :return: tuple of the updated properties (None if not `return_objects`) and the error (None if updated)
+        """
+        from pykechain.models import Property
+        try:
+            response = self._request(
+                "POST",
+                self._build_url("properties_bulk_update"),
+                params=API_EXTRA_PARAMS["property"],
+                json=properties,
+            )
+        except requests.RequestException as error:
+            return None, APIError(f"Could not update Properties: {error}")
+
+        if response.status_code != requests.codes.ok:
+            return None, APIError(
+                "Could not update Properties",
+                response=response,
+                json_codec=self.json_codec,
+            )
+
+        if not return_objects:
+            return None, None
+        return [
+            Property.create(client=self, json=js)
+            for js in self.json_codec.decode(response)["results"]
+        ], None
 
     def notifications(self, pk: Optional[str] = None, **kwargs) -> List[Notification]:
         """Retrieve one or more notifications stored on the instance.
@@ -3260,23 +4544,19 @@ class Client:
         :return: list of :class:`models.Notification` objects
         :raises APIError: When the retrieval call failed due to various reasons
         """
+        from pykechain.models import Notification
         request_params = {"id": check_uuid(pk)}
 
         if kwargs:
             request_params.update(**kwargs)
 
-        response = self._request(
-            "GET", self._build_url("notifications"), params=request_params
+        results = self._paginate(
+            self._build_url("notifications"),
+            request_params,
+            description="Notifications",
         )
 
-        if response.status_code != requests.codes.ok:  # pragma: no cover
-            raise APIError("Could not retrieve Notifications", response=response)
-
-        data = response.json()
-
-        return [
-            Notification(notification, client=self) for notification in data["results"]
-        ]
+        return [Notification(notification, client=self) for notification in results]
 
     def notification(self, pk: Optional[str] = None, *args, **kwargs) -> Notification:
         """Retrieve a single KE-chain notification.
@@ -3331,6 +4611,7 @@ class Client:
         :return: the newly created `Notification`
         :raises: APIError: when the `Notification` could not be created
         """
+        from pykechain.models import Notification, Team, User
         if from_user is None:
             from_user = self.current_user()
 
@@ -3375,9 +4656,15 @@ class Client:
         response = self._request("POST", url, data=data)
 
         if response.status_code != requests.codes.created:  # pragma: no cover
-            raise APIError("Could not create Notification", response=response)
+            raise APIError(
+                "Could not create Notification",
+                response=response,
+                json_codec=self.json_codec,
+            )
 
-        notification = Notification(response.json().get("results")[0], client=self)
+        notification = Notification(
+            self.json_codec.decode(response).get("results")[0], client=self
+        )
         return notification
 
     def delete_notification(self, notification: Union[Notification, str]) -> None:
@@ -3390,6 +4677,7 @@ class Client:
         :raises APIError: whenever the notification could not be deleted
         :raises IllegalArgumentError: whenever the input `notification` is invalid
         """
+        from pykechain.models import Notification
         notification = check_base(notification, Notification, "notification")
 
         url = self._build_url("notification", notification_id=notification)
@@ -3397,7 +4685,9 @@ class Client:
 
         if response.status_code != requests.codes.no_content:  # pragma: no cover
             raise APIError(
-                f"Could not delete Notification {notification}", response=response
+                f"Could not delete Notification {notification}",
+                response=response,
+                json_codec=self.json_codec,
             )
 
     def banners(
@@ -3416,6 +4706,7 @@ class Client:
         :return: list of Banner objects
         :rtype list
         """
+        from pykechain.models.banner import Banner
         request_params = {
             "text": check_text(text, "text"),
             "id": check_uuid(pk),
@@ -3426,15 +4717,10 @@ class Client:
         if kwargs:  # pragma: no cover
             request_params.update(**kwargs)
 
-        response = self._request(
-            "GET", self._build_url("banners"), params=request_params
+        results = self._paginate(
+            self._build_url("banners"), request_params, description="Banners"
         )
-
-        if response.status_code != requests.codes.ok:  # pragma: no cover
-            raise NotFoundError("Could not retrieve Banners", response=response)
-
-        data = response.json()
-        return [Banner(banner, client=self) for banner in data["results"]]
+        return [Banner(banner, client=self) for banner in results]
 
     def banner(self, *args, **kwargs) -> Banner:
         """
@@ -3474,6 +4760,7 @@ class Client:
         :return: the new banner
         :rtype: Banner
         """
+        from pykechain.models.banner import Banner
         data = {
             "text": check_text(text, "text"),
             "icon": check_text(icon, "icon"),
@@ -3492,9 +4779,11 @@ class Client:
         )
 
         if response.status_code != requests.codes.created:  # pragma: no cover
-            raise APIError("Could not create Banner", response=response)
+            raise APIError(
+                "Could not create Banner", response=response, json_codec=self.json_codec
+            )
 
-        return Banner(response.json()["results"][0], client=self)
+        return Banner(self.json_codec.decode(response)["results"][0], client=self)
 
     def active_banner(self) -> Banner:
         """
@@ -3506,12 +4795,17 @@ class Client:
         :raises NotFoundError whenever there is no active banner.
         :raises MultipleFoundError whenever multiple banners are active.
         """
+        from pykechain.models.banner import Banner
         response = self._request("GET", self._build_url("banner_active"))
 
         if response.status_code != requests.codes.ok:  # pragma: no cover
-            raise NotFoundError("Could not retrieve active Banner", response=response)
+            raise NotFoundError(
+                "Could not retrieve active Banner",
+                response=response,
+                json_codec=self.json_codec,
+            )
 
-        active_banner_list = response.json()["results"]
+        active_banner_list = self.json_codec.decode(response)["results"]
         if not active_banner_list:
             raise NotFoundError("No current active banner.")
         elif len(active_banner_list) > 1:
@@ -3541,6 +4835,7 @@ class Client:
         :type expires_in: int
         :return: list of Expiring Downloads objects
         """
+        from pykechain.models.expiring_download import ExpiringDownload
         request_params = {
             "id": check_uuid(pk),
             "expires_in": check_type(expires_in, int, "expires_in"),
@@ -3550,19 +4845,13 @@ class Client:
         if kwargs:
             request_params.update(**kwargs)
 
-        response = self._request(
-            "GET", self._build_url("expiring_downloads"), params=request_params
+        results = self._paginate(
+            self._build_url("expiring_downloads"),
+            request_params,
+            description="Expiring Downloads",
         )
 
-        if response.status_code != requests.codes.ok:  # pragma: no cover
-            raise NotFoundError(
-                "Could not retrieve Expiring Downloads", response=response
-            )
-
-        return [
-            ExpiringDownload(json=download, client=self)
-            for download in response.json()["results"]
-        ]
+        return [ExpiringDownload(json=download, client=self) for download in results]
 
     def create_expiring_download(
         self,
@@ -3581,6 +4870,7 @@ class Client:
         :type content_path: str
         :return:
         """
+        from pykechain.models.expiring_download import ExpiringDownload
         expires_at = check_type(expires_at, datetime.datetime, "expires_at")
         data = dict(
             created_at=datetime.datetime.now().isoformat(),
@@ -3591,10 +4881,14 @@ class Client:
             "POST", self._build_url("expiring_downloads"), json=data
         )
         if response.status_code != requests.codes.created:  # pragma: no cover
-            raise APIError("Could not create Expiring Download", response=response)
+            raise APIError(
+                "Could not create Expiring Download",
+                response=response,
+                json_codec=self.json_codec,
+            )
 
         expiring_download = ExpiringDownload(
-            response.json().get("results")[0], client=self
+            self.json_codec.decode(response).get("results")[0], client=self
         )
 
         if content_path:
@@ -3636,6 +4930,8 @@ class Client:
         :return: a created Context Object
         :raises APIError: When the object cannot be created.
         """
+        from pykechain.models import Activity, Scope
+        from pykechain.models.context import Context
         data = {
             "name": check_text(name, "name"),
             "description": check_text(description or "", "description"),
@@ -3668,9 +4964,13 @@ class Client:
         )
 
         if response.status_code != requests.codes.created:
-            raise APIError("Could not create Context", response=response)
+            raise APIError(
+                "Could not create Context",
+                response=response,
+                json_codec=self.json_codec,
+            )
 
-        return Context(response.json()["results"][0], client=self)
+        return Context(self.json_codec.decode(response)["results"][0], client=self)
 
     def delete_context(self, context: Context) -> None:
         """Delete the Context.
@@ -3679,6 +4979,7 @@ class Client:
 
         :param context: The context object to delete
         """
+        from pykechain.models.context import Context
         context = check_type(context, Context, "context")
         self._build_url("context", context_id=context.id)
 
@@ -3687,7 +4988,11 @@ class Client:
         )
 
         if response.status_code != requests.codes.no_content:  # pragma: no cover
-            raise APIError("Could not delete Contexts", response=response)
+            raise APIError(
+                "Could not delete Contexts",
+                response=response,
+                json_codec=self.json_codec,
+            )
 
     def context(self, *args, **kwargs) -> Context:
         """
@@ -3698,6 +5003,7 @@ class Client:
         :return: a single Contexts
         :rtype: Context
         """
+        from pykechain.models.context import Context
         return Context.get(client=self, **kwargs)
         # return self._retrieve_singular(self.contexts, *args, **kwargs)  # noqa
 
@@ -3722,6 +5028,8 @@ class Client:
         :return: a list of Contexts
         :rtype: List[Context]
         """
+        from pykechain.models import Activity, Scope
+        from pykechain.models.context import Context
         request_params = {
             "id": check_uuid(pk),
             "context_type": check_enum(context_type, ContextType, "context"),
@@ -3744,6 +5052,7 @@ class Client:
 
         :return: a created Form Model
         """
+        from pykechain.models.form import Form
         return Form.create_model(client=self, *args, **kwargs)
 
     def instantiate_form(self, model, *args, **kwargs) -> Form:
@@ -3754,6 +5063,7 @@ class Client:
 
         :return: a created Form Instance
         """
+        from pykechain.models.form import Form
         return Form.instantiate(self=model, *args, **kwargs)
 
     def form(self, *args, **kwargs) -> Form:
@@ -3792,6 +5102,9 @@ class Client:
         :param ref: (optional) the ref of the form to filter on
         :return: a list of Forms
         """
+        from pykechain.models import Scope
+        from pykechain.models.context import Context
+        from pykechain.models.form import Form
         request_params = {
             "name": check_text(name, "name"),
             "id": check_uuid(pk),
@@ -3837,6 +5150,8 @@ class Client:
         :return: list of Form instances or list of form UUIDs
         :rtype list
         """
+        from pykechain.models.context import Context
+        from pykechain.models.form import Form
         check_list_of_dicts(
             forms,
             "forms",
@@ -3867,17 +5182,17 @@ class Client:
             not asynchronous and response.status_code != requests.codes.created
         ):  # pragma: no cover
             raise APIError(
-                f"Could not create Forms. ({response.status_code})", response=response
+                f"Could not create Forms. ({response.status_code})",
+                response=response,
+                json_codec=self.json_codec,
             )
-        form_ids = [form.get("id") for form in response.json()["results"]]
+        form_ids = [
+            form.get("id") for form in self.json_codec.decode(response)["results"]
+        ]
         if retrieve_instances:
-            instances_per_id = dict()
-            for forms_ids_chunk in get_in_chunks(lst=form_ids, chunk_size=50):
-                instances_per_id.update(
-                    {
-                        p.id: p for p in self.forms(id__in=",".join(forms_ids_chunk))
-                    }  # `id__in` does not guarantee order
-                )
+            instances_per_id = self._retrieve_in_chunks(
+                self.forms, form_ids, chunk_size=50
+            )
             form_instances = [
                 instances_per_id[pk] for pk in form_ids
             ]  # Ensures order of parts wrt request
@@ -3901,6 +5216,7 @@ class Client:
         :raises APIError: if the forms could not be deleted
         :raises IllegalArgumentError: if there were neither Forms nor UUIDs in the list of forms
         """
+        from pykechain.models.form import Form
         check_type(asynchronous, bool, "asynchronous")
 
         list_forms = list()
@@ -3930,7 +5246,9 @@ class Client:
             and response.status_code not in (requests.codes.ok, requests.codes.accepted)
         ):  # pragma: no cover
             raise APIError(
-                f"Could not delete Forms. ({response.status_code})", response=response
+                f"Could not delete Forms. ({response.status_code})",
+                response=response,
+                json_codec=self.json_codec,
             )
         return True
 
@@ -3958,6 +5276,8 @@ class Client:
         :return: a single Workflows
         :rtype: Workflow
         """
+        from pykechain.models import Scope
+        from pykechain.models.workflow import Workflow
         request_params = {
             "name": check_text(name, "name"),
             "id": check_uuid(pk),
@@ -3996,6 +5316,8 @@ class Client:
         :param ref: (optional) the ref of the workflow to filter on
         :return: a list of Workflows
         """
+        from pykechain.models import Scope
+        from pykechain.models.workflow import Workflow
         request_params = {
             "name": check_text(name, "name"),
             "id": check_uuid(pk),
@@ -4017,6 +5339,7 @@ class Client:
 
         :return: a Workflow object
         """
+        from pykechain.models.workflow import Workflow
         return Workflow.create(client=self, scope=scope, **kwargs)
 
     def import_parts(
@@ -4070,6 +5393,7 @@ class Client:
 
         :return: a StoredFile object
         """
+        from pykechain.models.stored_file import StoredFile
         return StoredFile.create(client=self, **kwargs)
 
     def stored_file(
@@ -4099,6 +5423,8 @@ class Client:
         :return: a single StoredFiles
         :rtype: StoredFile
         """
+        from pykechain.models import Scope
+        from pykechain.models.stored_file import StoredFile
         request_params = {
             "name": check_text(name, "name"),
             "id": check_uuid(pk),
@@ -4143,6 +5469,8 @@ class Client:
 
         :return: a list of StoredFiles
         """
+        from pykechain.models import Scope
+        from pykechain.models.stored_file import StoredFile
         request_params = {
             "name": check_text(name, "name"),
             "id": check_uuid(pk),
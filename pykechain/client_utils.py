@@ -1,16 +1,96 @@
+import importlib
+import json
+import re
+import threading
+import time
+import weakref
+from collections import OrderedDict
+from email.utils import parsedate_to_datetime
+from functools import lru_cache
 from ssl import SSLError
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Tuple,
+    Union,
+)
+from urllib.parse import urlparse
 
+import requests
 from urllib3 import Retry
 from urllib3.exceptions import MaxRetryError
 
+from pykechain.defaults import (
+    BATCH_LOADER_CHUNK_SIZE,
+    CACHE_INVALIDATES,
+    CACHE_MAXSIZE,
+    CACHE_TTL,
+    JSON_LIBRARIES,
+    PROPERTY_UPDATES_CHUNK_SIZE,
+    RATE_LIMITER_DECREASE_FACTOR,
+    RATE_LIMITER_INITIAL_CONCURRENCY,
+    RATE_LIMITER_MAX_CONCURRENCY,
+    RETRY_ON_STATUS_CODES,
+    UNIT_OF_WORK_CHUNK_SIZE,
+)
+from pykechain.exceptions import APIError, IllegalArgumentError, NotFoundError
+from pykechain.models.base import Base
+from pykechain.models.input_checks import check_uuid
+from pykechain.utils import get_in_chunks
+
+if TYPE_CHECKING:
+    from pykechain.client import Client
+    from pykechain.models import Activity, Part, Property
+    from pykechain.models.widgets import Widget
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """
+    Parse the value of a `Retry-After` header into a number of seconds.
+
+    :param value: the value of the header, either a number of seconds or a HTTP date
+    :return: number of seconds to wait, or None if the value is missing or invalid
+    """
+    if not value:
+        return None
+    try:
+        return max(float(value), 0.0)
+    except ValueError:
+        pass
+    try:
+        return max(parsedate_to_datetime(value).timestamp() - time.time(), 0.0)
+    except (TypeError, ValueError):
+        return None
+
 
 class PykeRetry(Retry):
     """
     Pykechain Implementation of urllib3.Retry function.
 
-    It contains a fast bailout of any SSLCertificate Errors.
+    It contains a fast bailout of any SSLCertificate Errors and retries requests of any method when KE-chain
+    throttles them with `429 Too Many Requests` or responds `503 Service Unavailable` with a `Retry-After`, as
+    those requests are not processed. A bare `503` is only retried for idempotent methods.
+
+    :ivar on_retry: (optional) callable `(method, url, response, error)` called on every retry, eg. to
+        count the retries in the metrics of the client.
     """
 
+    def __init__(self, *args, on_retry: Optional[Callable] = None, **kwargs):
+        """Create a retry configuration, see `urllib3.Retry`."""
+        super().__init__(*args, **kwargs)
+        self.on_retry = on_retry
+
+    def new(self, **kw) -> "PykeRetry":
+        """Create a copy of the retry configuration, keeping the `on_retry` callable."""
+        retry = super().new(**kw)
+        retry.on_retry = self.on_retry
+        return retry
+
     def increment(
         self,
         method=None,
@@ -24,6 +104,9 @@ class PykeRetry(Retry):
         if self._is_ssl_error(error):
             raise MaxRetryError(_pool, url, error)
 
+        if self.on_retry is not None:
+            self.on_retry(method, url, response, error)
+
         return super().increment(
             method=method,
             url=url,
@@ -33,5 +116,1032 @@ class PykeRetry(Retry):
             _stacktrace=_stacktrace,
         )
 
+    def is_retry(
+        self, method: str, status_code: int, has_retry_after: bool = False
+    ) -> bool:
+        """
+        Retry on a status code in `RETRY_ON_STATUS_CODES`, see `urllib3.Retry.is_retry`.
+
+        Requests of any method are retried when throttled (`429`). A `503` without a `Retry-After` may come from
+        a proxy or load balancer after the request was processed, so it is only retried for idempotent methods,
+        to avoid creating objects twice.
+        """
+        if (
+            self.status_forcelist
+            and status_code in self.status_forcelist
+            and status_code in RETRY_ON_STATUS_CODES
+            and (
+                status_code == requests.codes.too_many_requests
+                or has_retry_after
+                or self._is_method_retryable(method)
+            )
+        ):
+            return True
+        return super().is_retry(
+            method=method, status_code=status_code, has_retry_after=has_retry_after
+        )
+
     def _is_ssl_error(self, error):
         return error and isinstance(error, SSLError)
+
+
+class ResponseCache:
+    """
+    Cache of the responses of GET requests to KE-chain, with a time-to-live and least recently used eviction.
+
+    The cached responses are grouped per collection of the API (eg. `parts` or `properties`) so any write
+    request to a collection invalidates the cached responses of that collection and the collections that
+    depend on it, see `CACHE_INVALIDATES` in :mod:`pykechain.defaults`. The cache is thread-safe.
+
+    .. versionadded:: 4.13
+
+    :ivar maxsize: maximum number of responses in the cache
+    :ivar ttl: number of seconds a response remains valid
+    :ivar hits: number of requests served from the cache
+    :ivar misses: number of requests not found in the cache
+    """
+
+    _collection_pattern = re.compile(r"^/?(?:.*?/)?api/(?:v3/)?([^/.]+)")
+
+    def __init__(self, maxsize: int = CACHE_MAXSIZE, ttl: float = CACHE_TTL) -> None:
+        """
+        Create an empty response cache.
+
+        :param maxsize: (optional) maximum number of responses in the cache
+        :param ttl: (optional) number of seconds a response remains valid
+        """
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self._responses: (
+            "OrderedDict[str, Tuple[float, Optional[str], requests.Response]]"
+        ) = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._responses)
+
+    def __getstate__(self) -> Dict:
+        state = self.__dict__.copy()
+        del state["_lock"]
+        return state
+
+    def __setstate__(self, state: Dict) -> None:
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+
+    def __repr__(self):  # pragma: no cover
+        return f"<pyke ResponseCache size={len(self)} hits={self.hits} misses={self.misses}>"
+
+    @classmethod
+    def collection(cls, url: str) -> Optional[str]:
+        """
+        Determine the collection of the API that an url belongs to.
+
+        :param url: url of the request
+        :return: name of the collection, eg. `parts`, or None if it cannot be determined
+        """
+        match = cls._collection_pattern.match(urlparse(url).path)
+        return match.group(1) if match else None
+
+    def get(self, url: str) -> Optional[requests.Response]:
+        """
+        Retrieve a valid response from the cache.
+
+        :param url: the full url of the request, including the query parameters
+        :return: the cached response or None
+        """
+        with self._lock:
+            entry = self._responses.get(url)
+            if entry is not None and entry[0] < time.monotonic():
+                del self._responses[url]
+                entry = None
+
+            if entry is None:
+                self.misses += 1
+                return None
+
+            self._responses.move_to_end(url)
+            self.hits += 1
+            return entry[2]
+
+    def set(self, url: str, response: requests.Response) -> None:
+        """
+        Store a response in the cache, evicting the least recently used response if the cache is full.
+
+        :param url: the full url of the request, including the query parameters
+        :param response: the response to cache
+        """
+        if self.maxsize <= 0:
+            return
+
+        with self._lock:
+            self._responses[url] = (
+                time.monotonic() + self.ttl,
+                self.collection(url),
+                response,
+            )
+            self._responses.move_to_end(url)
+            while len(self._responses) > self.maxsize:
+                self._responses.popitem(last=False)
+
+    def invalidate(self, url: str) -> None:
+        """
+        Invalidate the cached responses affected by a write request to the url.
+
+        :param url: url of the write request
+        """
+        collection = self.collection(url)
+        if collection not in CACHE_INVALIDATES:
+            self.clear()
+            return
+
+        self.invalidate_collections(
+            (collection,) + tuple(CACHE_INVALIDATES[collection])
+        )
+
+    def invalidate_collections(self, collections: Iterable[str]) -> None:
+        """
+        Invalidate all cached responses of the collections.
+
+        :param collections: names of the collections, eg. `parts`
+        """
+        collections = set(collections)
+        with self._lock:
+            for url in [
+                url
+                for url, (_, collection, _) in self._responses.items()
+                if collection in collections
+            ]:
+                del self._responses[url]
+
+    def clear(self) -> None:
+        """Remove all responses from the cache."""
+        with self._lock:
+            self._responses.clear()
+
+    def stats(self) -> Dict[str, float]:
+        """
+        Return the statistics of the cache.
+
+        :return: dictionary with the `hits`, `misses`, `size`, `maxsize` and `ttl` of the cache
+        """
+        return dict(
+            hits=self.hits,
+            misses=self.misses,
+            size=len(self),
+            maxsize=self.maxsize,
+            ttl=self.ttl,
+        )
+
+
+class IdentityMap:
+    """
+    Map of the pykechain models of a client, keyed by their class and id.
+
+    The map only holds weak references to the models, so it does not keep them in memory when they are
+    no longer used. The map is thread-safe.
+
+    .. versionadded:: 4.13
+    """
+
+    def __init__(self) -> None:
+        """Create an empty identity map."""
+        self._objects: "weakref.WeakValueDictionary[Tuple[type, str], Any]" = (
+            weakref.WeakValueDictionary()
+        )
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._objects)
+
+    def __contains__(self, obj: Any) -> bool:
+        return self._objects.get((type(obj), obj.id)) is obj
+
+    def __getstate__(self) -> Dict:
+        return dict()  # a copy starts with an empty map
+
+    def __setstate__(self, state: Dict) -> None:
+        self.__init__()
+
+    def __repr__(self):  # pragma: no cover
+        return f"<pyke IdentityMap size={len(self)}>"
+
+    def get(self, cls: type, pk: str) -> Optional[Any]:
+        """
+        Retrieve the live model of the class with the id.
+
+        :param cls: class of the model, eg. `Part`
+        :param pk: id of the model
+        :return: the model or None
+        """
+        return self._objects.get((cls, pk))
+
+    def get_or_add(self, cls: type, pk: str, factory: Callable[[], Any]) -> Any:
+        """
+        Retrieve the live model of the class with the id, or add the model created by the factory.
+
+        :param cls: class of the model, eg. `Part`
+        :param pk: id of the model
+        :param factory: callable creating a new model if there is no live model
+        :return: the model
+        """
+        with self._lock:
+            obj = self._objects.get((cls, pk))
+            if obj is None:
+                obj = factory()
+                self._objects[(cls, pk)] = obj
+            return obj
+
+    def discard(self, obj: Any) -> None:
+        """
+        Remove the model from the map, if present.
+
+        :param obj: the model
+        """
+        with self._lock:
+            if self._objects.get((type(obj), obj.id)) is obj:
+                del self._objects[(type(obj), obj.id)]
+
+    def clear(self) -> None:
+        """Remove all models from the map."""
+        with self._lock:
+            self._objects.clear()
+
+
+class BatchResult:
+    """
+    Result of a lookup collected by a :class:`BatchLoader`.
+
+    The result is available once the lookups of the loader are loaded, which happens at the end of the
+    `with client.batch()` block or as soon as the result is requested.
+
+    .. versionadded:: 4.13
+    """
+
+    def __init__(self, loader: "BatchLoader", pk: str) -> None:
+        """
+        Create a pending result.
+
+        :param loader: the loader collecting the lookup
+        :param pk: id of the object to look up
+        """
+        self.pk = pk
+        self._loader = loader
+        self._done = False
+        self._value = None
+        self._exception: Optional[Exception] = None
+
+    def __repr__(self):  # pragma: no cover
+        return f"<pyke BatchResult {self.pk} done={self._done}>"
+
+    def done(self) -> bool:
+        """Return whether the lookup is loaded."""
+        return self._done
+
+    def result(self) -> Any:
+        """
+        Return the object that is looked up, loading all pending lookups of the loader if needed.
+
+        :return: the pykechain model
+        :raises NotFoundError: if the object could not be found
+        """
+        if not self._done:
+            self._loader.load()
+        if self._exception is not None:
+            raise self._exception
+        return self._value
+
+    def _set_result(self, value: Any) -> None:
+        self._value, self._done = value, True
+
+    def _set_exception(self, exception: Exception) -> None:
+        self._exception, self._done = exception, True
+
+
+class BatchLoader:
+    """
+    Loader collecting singular lookups of objects, to retrieve them with a request per batch of objects.
+
+    Rather than retrieving every object with its own request, the lookups are collected and the objects are
+    retrieved per kind (eg. parts) using `id__in` requests of (at most) `chunk_size` objects each. Use it with
+    :func:`pykechain.Client.batch`.
+
+    .. versionadded:: 4.13
+    """
+
+    # kind of object: (name of the `Client` method retrieving multiple objects, extra arguments of that method)
+    _methods = dict(
+        part=("parts", dict(category=None)),
+        property=("properties", dict(category=None)),
+        activity=("activities", dict()),
+        user=("users", dict()),
+        scope=("scopes", dict(status=None)),
+    )
+
+    def __init__(
+        self, client: "Client", chunk_size: int = BATCH_LOADER_CHUNK_SIZE
+    ) -> None:
+        """
+        Create a batch loader.
+
+        :param client: the client to retrieve the objects with
+        :param chunk_size: (optional) maximum number of objects to retrieve per request
+        """
+        self._client = client
+        self.chunk_size = chunk_size
+        self._pending: Dict[str, Dict[str, BatchResult]] = dict()
+        self._lock = threading.Lock()
+
+    def __enter__(self) -> "BatchLoader":
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        if exc_type is None:
+            self.load()
+
+    def part(self, pk: str) -> BatchResult:
+        """Look up a part by its id, being an instance or a model."""
+        return self._add("part", pk)
+
+    def property(self, pk: str) -> BatchResult:
+        """Look up a property by its id, being an instance or a model."""
+        return self._add("property", pk)
+
+    def activity(self, pk: str) -> BatchResult:
+        """Look up an activity by its id."""
+        return self._add("activity", pk)
+
+    def user(self, pk: str) -> BatchResult:
+        """Look up a user by its id."""
+        return self._add("user", pk)
+
+    def scope(self, pk: str) -> BatchResult:
+        """Look up a scope by its id, regardless of its status."""
+        return self._add("scope", pk)
+
+    def _add(self, kind: str, pk: str) -> BatchResult:
+        pk = str(check_uuid(pk)) if kind != "user" else str(pk)
+        with self._lock:
+            lookups = self._pending.setdefault(kind, dict())
+            if pk not in lookups:
+                lookups[pk] = BatchResult(loader=self, pk=pk)
+            return lookups[pk]
+
+    def load(self) -> None:
+        """Retrieve the objects of all pending lookups."""
+        with self._lock:
+            pending, self._pending = self._pending, dict()
+
+        for kind, lookups in pending.items():
+            method_name, kwargs = self._methods[kind]
+            try:
+                objects = self._client._retrieve_in_chunks(
+                    getattr(self._client, method_name),
+                    list(lookups),
+                    chunk_size=self.chunk_size,
+                    **kwargs,
+                )
+            except Exception as e:
+                for lookup in lookups.values():
+                    lookup._set_exception(e)
+                continue
+
+            objects = {
+                str(pk): obj for pk, obj in objects.items()
+            }  # user ids are integers
+            for pk, lookup in lookups.items():
+                if pk in objects:
+                    lookup._set_result(objects[pk])
+                else:
+                    lookup._set_exception(
+                        NotFoundError(f"Could not find {kind} with id '{pk}'")
+                    )
+
+
+class WriteResult(BatchResult):
+    """
+    Result of a write recorded by a :class:`UnitOfWork`.
+
+    The result is available once the writes of the unit of work are sent, which happens at the end of the
+    `with client.unit_of_work()` block or as soon as the result is requested.
+
+    .. versionadded:: 4.13
+
+    :ivar kind: kind of the write, eg. `create part` or `update property`
+    :ivar pk: id of the object that is updated, None for objects that are created
+    """
+
+    def __init__(
+        self, unit_of_work: "UnitOfWork", kind: str, pk: Optional[str] = None
+    ) -> None:
+        """
+        Create a pending result.
+
+        :param unit_of_work: the unit of work recording the write
+        :param kind: kind of the write
+        :param pk: (optional) id of the object that is updated
+        """
+        super().__init__(loader=unit_of_work, pk=pk)
+        self.kind = kind
+
+    def __repr__(self):  # pragma: no cover
+        return f"<pyke WriteResult '{self.kind}' {self.pk} done={self._done}>"
+
+    def result(self) -> Any:
+        """
+        Return the object that is written, sending all pending writes of the unit of work if needed.
+
+        :return: the pykechain model
+        :raises APIError: if the object could not be written
+        :raises IllegalArgumentError: if KE-chain refused the data of the object
+        """
+        if not self._done:
+            self._loader.flush()
+        if self._exception is not None:
+            raise self._exception
+        return self._value
+
+
+class UnitOfWork:
+    """
+    Unit of work recording writes, to send them to KE-chain with a request per batch of objects.
+
+    Inside the `with client.unit_of_work()` block, setting the value of a property and editing a widget or an
+    activity are recorded rather than sent right away. Parts and widgets are created with :func:`add_part`
+    and :func:`create_widget`. At the end of the block the writes are sent through the bulk endpoints of
+    KE-chain, (at most) `chunk_size` objects per request, creating objects before updating objects:
+
+    1. creation of parts, via `parts_bulk_create`
+    2. creation of widgets, via `widgets_bulk_create`
+    3. updates of properties, via `properties_bulk_update`
+    4. updates of widgets, via `widgets_bulk_update`
+    5. updates of activities, via `activities_bulk_update`
+
+    Multiple updates of the same object are merged into a single update. When KE-chain refuses a request,
+    the objects of that request are written one by one to single out the objects that fail. The failed
+    writes are collected in :attr:`failures` and reported in a single :class:`pykechain.exceptions.APIError`
+    once all writes are sent. Use it with :func:`pykechain.Client.unit_of_work`.
+
+    The unit of work only records the writes performed in the thread that entered the `with` block.
+
+    .. versionadded:: 4.13
+
+    :ivar failures: the :class:`WriteResult` of every write that failed
+    """
+
+    # the writes in the order in which they are sent: (action, kind of object, method sending a chunk of writes)
+    _writers = (
+        ("create", "part", "_create_parts"),
+        ("create", "widget", "_create_widgets"),
+        ("update", "property", "_update_properties"),
+        ("update", "widget", "_update_widgets"),
+        ("update", "activity", "_update_activities"),
+    )
+
+    def __init__(
+        self,
+        client: "Client",
+        chunk_size: int = UNIT_OF_WORK_CHUNK_SIZE,
+        raise_on_failure: bool = True,
+    ) -> None:
+        """
+        Create a unit of work.
+
+        :param client: the client to send the writes with
+        :param chunk_size: (optional) maximum number of objects to write per request
+        :param raise_on_failure: (optional) raise an `APIError` if any write failed
+        """
+        self._client = client
+        self.chunk_size = chunk_size
+        self.raise_on_failure = raise_on_failure
+        self.failures: List[WriteResult] = list()
+        self._creates: Dict[str, List[Tuple[Dict, WriteResult]]] = dict()
+        self._updates: Dict[str, Dict[str, Tuple[Any, Dict, WriteResult]]] = dict()
+        self._previous: Optional[UnitOfWork] = None
+        self._lock = threading.RLock()
+
+    def __enter__(self) -> "UnitOfWork":
+        self._previous = self._client._active_unit_of_work()
+        self._client._local.unit_of_work = self
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self._client._local.unit_of_work = self._previous
+        if exc_type is None:
+            self.flush()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return sum(len(items) for items in self._creates.values()) + sum(
+                len(items) for items in self._updates.values()
+            )
+
+    def add_part(
+        self,
+        parent: "Part",
+        model: "Part",
+        name: Optional[str] = None,
+        update_dict: Optional[Dict] = None,
+    ) -> WriteResult:
+        """
+        Record the creation of a part instance of a model as a child of a part instance.
+
+        :param parent: parent part instance of the new part
+        :param model: model of the new part
+        :param name: (optional) name of the new part, defaults to the name of the model
+        :param update_dict: (optional) values of the new properties per name, ref or id of the property models
+        :return: the result, being the new :class:`pykechain.models.Part` when sent
+        :raises NotFoundError: if a property in the `update_dict` is not a property of the model
+        """
+        properties = list()
+        for key, value in (update_dict or dict()).items():
+            prop = model.property(key)
+            properties.append(
+                dict(
+                    name=prop.name, value=prop.serialize_value(value), model_id=prop.id
+                )
+            )
+        data = dict(
+            name=name or model.name,
+            parent_id=parent.id,
+            model_id=model.id,
+            properties=properties,
+        )
+        return self._add_create("part", data)
+
+    def create_widget(self, **widget) -> WriteResult:
+        """
+        Record the creation of a widget.
+
+        :param widget: configuration of the widget, see :func:`pykechain.Client.create_widgets`
+        :return: the result, being the new :class:`pykechain.models.widgets.Widget` when sent
+        """
+        return self._add_create("widget", widget)
+
+    def update_property(self, prop: Union["Property", str], **data) -> WriteResult:
+        """
+        Record an update of a property, eg. to set its value to 3 using `value=3`.
+
+        :param prop: the property or its id
+        :param data: the fields of the property to update
+        :return: the result, being the updated :class:`pykechain.models.Property` when sent
+        """
+        return self._add_update("property", prop, data)
+
+    def update_widget(self, widget: Union["Widget", str], **data) -> WriteResult:
+        """
+        Record an update of a widget, eg. of its meta using `meta=meta`.
+
+        :param widget: the widget or its id
+        :param data: the fields of the widget to update
+        :return: the result, being the updated :class:`pykechain.models.widgets.Widget` when sent
+        """
+        return self._add_update("widget", widget, data)
+
+    def update_activity(self, activity: Union["Activity", str], **data) -> WriteResult:
+        """
+        Record an update of an activity, eg. of its name using `name="Design"`.
+
+        :param activity: the activity or its id
+        :param data: the fields of the activity to update
+        :return: the result, being the activity when sent (None if only its id is provided)
+        """
+        return self._add_update("activity", activity, data)
+
+    def _add_create(self, kind: str, data: Dict) -> WriteResult:
+        result = WriteResult(unit_of_work=self, kind=f"create {kind}")
+        with self._lock:
+            self._creates.setdefault(kind, list()).append((data, result))
+        return result
+
+    def _add_update(self, kind: str, obj: Any, data: Dict) -> WriteResult:
+        pk = str(check_uuid(getattr(obj, "id", obj)))
+        with self._lock:
+            updates = self._updates.setdefault(kind, dict())
+            if pk in updates:
+                _, pending_data, result = updates[pk]
+                pending_data.update(data)
+                if isinstance(obj, Base):
+                    updates[pk] = (obj, pending_data, result)
+            else:
+                result = WriteResult(unit_of_work=self, kind=f"update {kind}", pk=pk)
+                updates[pk] = (obj, dict(data), result)
+            return result
+
+    def flush(self) -> None:
+        """
+        Send all pending writes to KE-chain.
+
+        The objects that are updated are refreshed with the response of KE-chain.
+
+        :raises APIError: if any write failed and `raise_on_failure` is set
+        """
+        with self._lock:
+            creates, self._creates = self._creates, dict()
+            updates, self._updates = self._updates, dict()
+
+        failures = list()
+        for action, kind, writer in self._writers:
+            send = getattr(self, writer)
+            if action == "create":
+                failures.extend(self._write(creates.get(kind, list()), send))
+                continue
+
+            pending = updates.get(kind, dict())
+            failures.extend(
+                self._write(
+                    [
+                        (dict(data, id=pk), result)
+                        for pk, (_, data, result) in pending.items()
+                    ],
+                    send,
+                )
+            )
+            for obj, _, result in pending.values():
+                if result._exception is None and isinstance(obj, Base):
+                    if isinstance(result._value, Base) and result._value is not obj:
+                        obj.refresh(json=result._value._json_data)
+                    result._set_result(obj)
+
+        self.failures.extend(failures)
+        if failures and self.raise_on_failure:
+            raise APIError(
+                "Could not write {} object(s): {}".format(
+                    len(failures),
+                    "; ".join(
+                        (
+                            f"{f.kind} '{f.pk}': {f._exception}"
+                            if f.pk
+                            else f"{f.kind}: {f._exception}"
+                        )
+                        for f in failures
+                    ),
+                )
+            )
+
+    def _write(
+        self, items: List[Tuple[Dict, WriteResult]], send: Callable
+    ) -> List[WriteResult]:
+        """
+        Send the data of the items in chunks, resending the items of a failed chunk one by one.
+
+        :param items: the data and result of every write
+        :param send: function sending a list of data and returning the written objects in the same order
+        :return: the results of the failed writes
+        """
+        failures = list()
+        for chunk in get_in_chunks(items, self.chunk_size):
+            try:
+                values = send([data for data, _ in chunk])
+            except (APIError, IllegalArgumentError) as e:
+                if len(chunk) > 1:  # single out the failing objects
+                    for item in chunk:
+                        failures.extend(self._write([item], send))
+                else:
+                    chunk[0][1]._set_exception(e)
+                    failures.append(chunk[0][1])
+                continue
+            for (_, result), value in zip(chunk, values):
+                result._set_result(value)
+        return failures
+
+    def _create_parts(self, parts: List[Dict]) -> List["Part"]:
+        return list(self._client._create_parts_bulk(parts=parts))
+
+    def _create_widgets(self, widgets: List[Dict]) -> List["Widget"]:
+        return self._client.create_widgets(widgets=[dict(w) for w in widgets])
+
+    def _update_properties(self, properties: List[Dict]) -> List["Property"]:
+        updated = {
+            p.id: p
+            for p in self._client.update_properties(
+                properties=properties, chunk_size=self.chunk_size
+            )
+        }
+        return [updated.get(p["id"]) for p in properties]
+
+    def _update_widgets(self, widgets: List[Dict]) -> List["Widget"]:
+        updated = {w.id: w for w in self._client.update_widgets(widgets=widgets)}
+        return [updated.get(w["id"]) for w in widgets]
+
+    def _update_activities(self, activities: List[Dict]) -> List[None]:
+        self._client.update_activities(activities=activities)
+        return [None] * len(
+            activities
+        )  # KE-chain does not return the updated activities
+
+
+class PropertyUpdateBuffer:
+    """
+    Thread-safe buffer of updates of properties, to send them to KE-chain in bulk.
+
+    Multiple updates of the same property are merged into a single update. The updates are sent using
+    :func:`pykechain.Client.update_properties`, (at most) `chunk_size` properties per request, when the buffer
+    is flushed or as soon as it holds the updates of `flush_size` properties.
+
+    Use :func:`pykechain.Client.bulk_update_properties` to collect the updates of property values in a `with`
+    block. Every client also holds a buffer for the updates pending while `Property.set_bulk_update(True)` is
+    set, which is flushed with `Property.update_values()`.
+
+    .. versionadded:: 4.13
+    """
+
+    def __init__(
+        self,
+        client: "Client",
+        flush_size: Optional[int] = None,
+        chunk_size: int = PROPERTY_UPDATES_CHUNK_SIZE,
+    ) -> None:
+        """
+        Create an empty buffer.
+
+        :param client: the client to send the updates with
+        :param flush_size: (optional) number of properties at which the updates are sent, None to only send
+            the updates when flushed
+        :param chunk_size: (optional) maximum number of properties to update per request
+        """
+        self._client = client
+        self.flush_size = flush_size
+        self.chunk_size = chunk_size
+        self._updates: Dict[str, Dict] = dict()
+        self._previous: Optional[PropertyUpdateBuffer] = None
+        self._lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._updates)
+
+    def __getstate__(self) -> Dict:
+        state = self.__dict__.copy()
+        del state["_lock"], state["_flush_lock"]
+        return state
+
+    def __setstate__(self, state: Dict) -> None:
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+
+    def __repr__(self):  # pragma: no cover
+        return f"<pyke PropertyUpdateBuffer pending={len(self)}>"
+
+    def __enter__(self) -> "PropertyUpdateBuffer":
+        self._previous = getattr(self._client._local, "property_updates", None)
+        self._client._local.property_updates = self
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self._client._local.property_updates = self._previous
+        if exc_type is None:
+            self.flush()
+
+    def add(self, prop: Union["Property", str], **data) -> None:
+        """
+        Add an update of a property, eg. to set its value to 3 using `value=3`.
+
+        :param prop: the property or its id
+        :param data: the fields of the property to update
+        :raises APIError: if the buffer is full and the updates could not be sent
+        """
+        pk = str(check_uuid(getattr(prop, "id", prop)))
+        with self._lock:
+            self._updates.setdefault(pk, dict()).update(data)
+            full = self.flush_size is not None and len(self._updates) >= self.flush_size
+        if full:
+            self.flush()
+
+    def flush(self) -> None:
+        """
+        Send all pending updates to KE-chain.
+
+        :raises APIError: if the updates could not be sent
+        """
+        # updates are sent in the order they were flushed, a later update of a property is never overtaken
+        with self._flush_lock:
+            with self._lock:
+                updates, self._updates = self._updates, dict()
+            if updates:
+                self._client.update_properties(
+                    properties=[dict(data, id=pk) for pk, data in updates.items()],
+                    chunk_size=self.chunk_size,
+                    return_objects=False,
+                )
+
+    def clear(self) -> None:
+        """Discard all pending updates."""
+        with self._lock:
+            self._updates.clear()
+
+
+class AdaptiveRateLimiter:
+    """
+    Limiter of the number of requests in flight, adapting to the throttling of KE-chain.
+
+    The limiter follows an additive increase, multiplicative decrease (AIMD) strategy: every successful request
+    increases the allowed number of requests in flight by about one per "round" of requests, up to the maximum
+    concurrency. When KE-chain throttles a request (`429` or `503`), the allowed number is reduced by the
+    decrease factor and, if KE-chain provides a `Retry-After`, no new requests are started before then. The
+    limiter is thread-safe, hence it is shared by all threads (and by the tasks of the `AsyncClient`) using the
+    client.
+
+    .. versionadded:: 4.13
+
+    :ivar concurrency: the number of requests currently allowed in flight
+    :ivar in_flight: the number of requests in flight
+    """
+
+    def __init__(
+        self,
+        initial_concurrency: int = RATE_LIMITER_INITIAL_CONCURRENCY,
+        max_concurrency: int = RATE_LIMITER_MAX_CONCURRENCY,
+        decrease_factor: float = RATE_LIMITER_DECREASE_FACTOR,
+    ) -> None:
+        """
+        Create a rate limiter.
+
+        :param initial_concurrency: (optional) number of requests allowed in flight initially
+        :param max_concurrency: (optional) maximum number of requests allowed in flight
+        :param decrease_factor: (optional) factor to reduce the allowed number of requests when throttled
+        """
+        self.max_concurrency = max_concurrency
+        self.decrease_factor = decrease_factor
+        self.concurrency: float = min(initial_concurrency, max_concurrency)
+        self.in_flight = 0
+        self.throttled = 0
+        self._blocked_until = 0.0
+        self._condition = threading.Condition()
+
+    def __getstate__(self) -> Dict:
+        state = self.__dict__.copy()
+        del state["_condition"]
+        state["in_flight"] = 0
+        return state
+
+    def __setstate__(self, state: Dict) -> None:
+        self.__dict__.update(state)
+        self._condition = threading.Condition()
+
+    def __repr__(self):  # pragma: no cover
+        return f"<pyke AdaptiveRateLimiter concurrency={self.concurrency:.1f} in_flight={self.in_flight}>"
+
+    def __enter__(self) -> "AdaptiveRateLimiter":
+        self.acquire()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.release()
+
+    def acquire(self) -> None:
+        """Wait until a request is allowed to start."""
+        with self._condition:
+            while True:
+                wait = self._blocked_until - time.monotonic()
+                if wait <= 0 and self.in_flight < max(int(self.concurrency), 1):
+                    self.in_flight += 1
+                    return
+                self._condition.wait(timeout=wait if wait > 0 else None)
+
+    def release(self, throttled: bool = False, adapt: bool = True) -> None:
+        """
+        Mark a request as finished, adapting the allowed number of requests in flight.
+
+        :param throttled: (optional) whether KE-chain throttled the request
+        :param adapt: (optional) False to keep the allowed number of requests, eg. when the throttling of the
+            request was already reported with `throttle`
+        """
+        with self._condition:
+            self.in_flight -= 1
+            if not adapt:
+                pass
+            elif throttled:
+                self._decrease()
+            else:
+                self.concurrency = min(
+                    self.concurrency + 1 / max(self.concurrency, 1),
+                    self.max_concurrency,
+                )
+            self._condition.notify_all()
+
+    def throttle(self, retry_after: Optional[float] = None) -> None:
+        """
+        Reduce the allowed number of requests in flight, as KE-chain throttles the requests.
+
+        :param retry_after: (optional) number of seconds before new requests are allowed to start
+        """
+        with self._condition:
+            self._decrease()
+            if retry_after:
+                self._blocked_until = max(
+                    self._blocked_until, time.monotonic() + retry_after
+                )
+            self._condition.notify_all()
+
+    def _decrease(self) -> None:
+        self.throttled += 1
+        self.concurrency = max(self.concurrency * self.decrease_factor, 1)
+
+
+class JsonCodec:
+    """
+    Encoder and decoder of the json bodies of the requests and responses of the :class:`Client`.
+
+    By default the fastest json library that is installed is used: `orjson`, `ujson` or otherwise the `json`
+    module of the standard library. Subclass the codec to use another library.
+
+    .. versionadded:: 4.13
+
+    :ivar library: name of the json library used by the codec
+    :type library: str
+
+    Examples
+    --------
+    >>> client = Client(url="https://default.localhost:9443", json_codec=JsonCodec("json"))
+    >>> client.json_codec.library
+    'json'
+
+    """
+
+    def __init__(self, library: Optional[str] = None):
+        """
+        Create a codec with a json library.
+
+        :param library: (optional) name of the json library, one of `orjson`, `ujson` or `json`. Defaults to the
+            first of these that is installed.
+        :type library: str or None
+        :raises IllegalArgumentError: When the library is not supported or not installed
+        """
+        if library is not None and library not in JSON_LIBRARIES:
+            raise IllegalArgumentError(
+                f"The json library should be one of {JSON_LIBRARIES}, got '{library}'"
+            )
+        for name in [library] if library else JSON_LIBRARIES:
+            try:
+                self._module = importlib.import_module(name)
+            except ImportError:
+                continue
+            self.library: str = name
+            break
+        else:
+            raise IllegalArgumentError(f"The json library '{library}' is not installed")
+
+    def __getstate__(self) -> Dict:
+        return dict(library=self.library)
+
+    def __setstate__(self, state: Dict) -> None:
+        self.__init__(library=state["library"])
+
+    def __repr__(self):  # pragma: no cover
+        return f"<pyke JsonCodec '{self.library}'>"
+
+    def loads(self, data: Union[str, bytes]) -> Any:
+        """
+        Decode a json document.
+
+        :param data: the json document
+        :type data: str or bytes
+        :return: the decoded data
+        :raises ValueError: When the document is not valid json
+        """
+        return self._module.loads(data)
+
+    def dumps(self, data: Any) -> bytes:
+        """
+        Encode data as a UTF-8 encoded json document, like `requests` encodes the `json` of a request.
+
+        :param data: the data to encode
+        :return: the json document
+        :rtype: bytes
+        """
+        if self.library == "orjson":
+            return self._module.dumps(data, option=self._module.OPT_NON_STR_KEYS)
+        if self.library == "ujson":
+            return self._module.dumps(data, escape_forward_slashes=False).encode()
+        return json.dumps(data, allow_nan=False).encode()
+
+    def decode(self, response: requests.Response) -> Any:
+        """
+        Decode the json body of a response, replacing `response.json()`.
+
+        :param response: the response
+        :type response: requests.Response
+        :return: the decoded body
+        :raises json.JSONDecodeError: When the body is not valid json
+        """
+        if self.library == "json":
+            return response.json()
+        try:
+            return self.loads(response.content)
+        except ValueError as error:
+            raise json.JSONDecodeError(str(error), response.text, 0) from error
+
+
+@lru_cache(maxsize=None)
+def default_json_codec() -> JsonCodec:
+    """
+    Return the codec with the fastest json library that is installed, e.g. for responses without a `Client`.
+
+    .. versionadded:: 4.13
+    """
+    return JsonCodec()
@@ -22,6 +22,15 @@ RETRY_ON_READ_ERRORS = 2
 # A redirect is a HTTP response with a status code 301, 302, 303, 307 or 30
 RETRY_ON_REDIRECT_ERRORS = 1
 
+# How many times to retry on a response with a status code in `RETRY_ON_STATUS_CODES`.
+RETRY_ON_STATUS_ERRORS = 3
+
+# Status codes of responses with which KE-chain signals to retry the request later, because it is throttling
+# the requests (429 Too Many Requests) or is temporarily unavailable (503 Service Unavailable), honoring the
+# `Retry-After` header of the response. A throttled request is not processed, so it is retried for any method.
+# A 503 without `Retry-After` may come from a proxy after processing, so it is only retried for idempotent methods.
+RETRY_ON_STATUS_CODES = (429, 503)
+
 # Total number of retries to allow. Takes precedence over other counts
 RETRY_TOTAL = 10
 
@@ -34,6 +43,86 @@ RETRY_BACKOFF_FACTOR = 0.8
 # Batching of parts when a large number of parts are requested at once
 PARTS_BATCH_LIMIT = 100  # number of parts
 
+#
+# Configuration of the connection pool of the client session, see `requests.adapters.HTTPAdapter`.
+#
+
+# Number of connection pools to cache, one per host.
+POOL_CONNECTIONS = 10
+
+# Maximum number of connections to keep open per host. Set it to (at least) the number of threads
+# that use a single client at the same time, to prevent connections to be discarded and re-opened.
+POOL_MAXSIZE = 10
+
+# Whether to wait for a free connection when all connections of the pool are in use, instead of
+# opening a new connection that is discarded afterwards.
+POOL_BLOCK = False
+
+# Number of most recent requests per endpoint of which the latency is kept, to compute the percentiles
+# of the latency in the `Client.stats()`.
+METRICS_LATENCY_SAMPLES = 1000  # number of requests
+
+# Number of objects retrieved per request by the `BatchLoader` of `Client.batch()`.
+BATCH_LOADER_CHUNK_SIZE = 100  # number of objects
+
+# Number of objects written per request to a bulk endpoint by the `UnitOfWork` of `Client.unit_of_work()`.
+UNIT_OF_WORK_CHUNK_SIZE = 100  # number of objects
+
+# Number of properties updated per request when pending updates of properties are sent in bulk.
+PROPERTY_UPDATES_CHUNK_SIZE = 100  # number of properties
+
+# Number of properties with pending updates at which `Client.bulk_update_properties()` sends the updates.
+PROPERTY_UPDATES_FLUSH_SIZE = 1000  # number of properties
+
+#
+# Configuration of the (opt-in) adaptive rate limiter of the client, see `Client.enable_rate_limiter`.
+#
+
+# Number of requests the rate limiter allows in flight at the same time initially.
+RATE_LIMITER_INITIAL_CONCURRENCY = 4  # number of requests
+
+# Maximum number of requests the rate limiter allows in flight at the same time.
+RATE_LIMITER_MAX_CONCURRENCY = 32  # number of requests
+
+# Factor with which the number of requests in flight is reduced when KE-chain throttles the requests.
+RATE_LIMITER_DECREASE_FACTOR = 0.5
+
+# Number of requests the `AsyncClient` may have in flight at the same time. Aligned with the
+# default connection pool size of the client session.
+ASYNC_CLIENT_MAX_WORKERS = 10  # number of worker threads
+
+# Libraries to encode and decode the json bodies of requests and responses, in order of preference. The
+# first library that is installed is used, the `json` module of the standard library is always available.
+JSON_LIBRARIES = ("orjson", "ujson", "json")
+
+#
+# Configuration of the (opt-in) response cache of the client, see `Client.enable_cache`.
+#
+
+# Maximum number of responses to keep. The least recently used response is evicted first.
+CACHE_MAXSIZE = 1000  # number of responses
+
+# Number of seconds a cached response remains valid.
+CACHE_TTL = 60  # seconds
+
+# Cached responses of a collection that become stale when a collection is written to, next to the
+# cached responses of the collection itself. Parts embed their properties and property values are
+# also updated through the parts. A write to a collection that is not listed here invalidates all
+# cached responses, as its side effects are unknown (eg. cloning a scope or instantiating a form).
+CACHE_INVALIDATES = {
+    "parts": ("properties", "widgets"),
+    "properties": ("parts",),
+    "activities": ("widgets",),
+    "widgets": ("activities",),
+    "services": ("service_executions",),
+    "service_executions": ("services",),
+    "users": ("teams", "scopes"),
+    "teams": ("users", "scopes"),
+    "notifications": (),
+    "banners": (),
+    "downloads": (),
+}
+
 #
 # API Paths and API Extra Parameters
 #
@@ -163,6 +252,12 @@ API_PATH = {
 }
 
 API_QUERY_PARAM_ALL_FIELDS = {"fields": "__all__"}
+# Predefined projections of the fields to retrieve, to be used as `fields` of the retrieval methods of the `Client`
+# (eg. `client.parts(fields="lean")`). Only the fields that the endpoint provides by default are retrieved.
+API_FIELDS_PROFILES = {
+    "lean": ["id", "name", "parent_id", "model_id"],
+}
+
 API_EXTRA_PARAMS = {
     "activity": {
         "fields": ",".join(
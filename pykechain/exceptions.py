@@ -18,10 +18,16 @@ class APIError(Exception):
     def __init__(self, *args, **kwargs):
         """Initialise the `APIError` with `response`, `request`, `msg`, `traceback` and `detail`.
 
+        .. versionchanged:: 4.13
+            The json body of the response is decoded with the `json_codec`, by default with the fastest json library
+            that is installed.
+
         :param response:
+        :param json_codec: (optional) the :class:`pykechain.client_utils.JsonCodec` to decode the response with
         :param kwargs:
         """
         self.response = kwargs.pop("response", None)
+        json_codec = kwargs.pop("json_codec", None)
 
         if hasattr(self.response, "request"):
             self.request = self.response.request
@@ -41,8 +47,12 @@ class APIError(Exception):
         import json
 
         if self.response is not None and isinstance(self.response, Response):
+            if json_codec is None:
+                from pykechain.client_utils import default_json_codec
+
+                json_codec = default_json_codec()
             try:
-                response_json = self.response.json()
+                response_json = json_codec.decode(self.response)
             except json.decoder.JSONDecodeError:
                 response_json = None
 
@@ -118,6 +128,27 @@ class NotFoundError(APIError):
     pass
 
 
+class PropertiesUpdateError(APIError):
+    """
+    Some chunks of properties could not be updated, while the other chunks are updated in KE-chain.
+
+    .. versionadded:: 4.13
+
+    :ivar updated: the updated properties, empty if these were not requested with `return_objects`
+    :ivar updated_ids: the ids of the properties of the updated chunks
+    :ivar failed_ids: the ids of the properties of the failed chunks
+    """
+
+    def __init__(
+        self, *args, updated=None, updated_ids=None, failed_ids=None, **kwargs
+    ):
+        """Initialise the error with the updated properties and the ids of the updated and failed properties."""
+        self.updated = updated or list()
+        self.updated_ids = updated_ids or list()
+        self.failed_ids = failed_ids or list()
+        super().__init__(*args, **kwargs)
+
+
 class ClientError(APIError):
     """When instantiating the Client an Error occurred."""
 
@@ -121,12 +121,13 @@ def map_property_instances(original_part: Part, new_part: Part) -> None:
     mapping[original_part.id] = new_part
 
     # Do the same for each Property of original part instance, using the 'model' id and the get_mapping_dictionary
+    new_properties_by_model_id = dict()
+    for prop_new in new_part.properties:
+        new_properties_by_model_id.setdefault(prop_new.model_id, prop_new)
     for prop_original in original_part.properties:
-        mapping[prop_original.id] = [
-            prop_new
-            for prop_new in new_part.properties
-            if mapping[prop_original.model_id].id == prop_new.model_id
-        ][0]
+        mapping[prop_original.id] = new_properties_by_model_id[
+            mapping[prop_original.model_id].id
+        ]
 
 
 def relocate_model(
@@ -0,0 +1,183 @@
+import functools
+import math
+import re
+import threading
+from collections import Counter, deque
+from typing import Callable, Deque, Dict, List, Optional, Pattern, Tuple
+from urllib.parse import urlparse
+
+import requests
+
+from pykechain.defaults import API_PATH, METRICS_LATENCY_SAMPLES
+
+PreRequestHook = Callable[[str, str, Dict], None]
+PostRequestHook = Callable[[str, str, Optional[requests.Response], float], None]
+
+
+@functools.lru_cache(maxsize=None)
+def _compile_endpoints() -> List[Tuple[str, Pattern]]:
+    """
+    Compile a regular expression per API path, matching the path of an url to that endpoint.
+
+    The expressions are compiled on first use, as compiling them slows down `import pykechain` noticeably.
+    """
+    endpoints = []
+    for key, path in API_PATH.items():
+        pattern = "".join(
+            "[^/]+" if part.startswith("{") else re.escape(part)
+            for part in re.split(r"({[^}]+})", path.lstrip("/"))
+        )
+        endpoints.append((path.count("{"), key, re.compile(f"(?:^|/){pattern}$")))
+
+    # literal paths (eg. `api/v3/forms/bulk_delete`) take precedence over paths with an id (`api/v3/forms/{form_id}`)
+    return [(key, regex) for _, key, regex in sorted(endpoints, key=lambda e: e[0])]
+
+
+class EndpointStats:
+    """
+    Aggregated statistics of the requests to a single endpoint of the KE-chain API.
+
+    :ivar count: number of requests
+    :ivar errors: number of requests without a response, eg. due to a connection error
+    :ivar retries: number of retries of the requests
+    :ivar bytes_sent: total size of the request bodies in bytes
+    :ivar bytes_received: total size of the response bodies in bytes
+    :ivar status_codes: number of responses per HTTP status code
+    :ivar latencies: the durations of the most recent requests in seconds
+    """
+
+    def __init__(self, samples: int = METRICS_LATENCY_SAMPLES) -> None:
+        """Create empty statistics, keeping the latency of (at most) `samples` requests."""
+        self.count = 0
+        self.errors = 0
+        self.retries = 0
+        self.bytes_sent = 0
+        self.bytes_received = 0
+        self.total_time = 0.0
+        self.status_codes: Counter = Counter()
+        self.latencies: Deque[float] = deque(maxlen=samples)
+
+    def percentile(self, percentile: float) -> Optional[float]:
+        """
+        Return a percentile of the latencies in seconds, using the nearest rank.
+
+        :param percentile: percentile between 0 and 100
+        :return: the latency or None if there are no requests
+        """
+        if not self.latencies:
+            return None
+        latencies = sorted(self.latencies)
+        rank = max(math.ceil(percentile * len(latencies) / 100) - 1, 0)
+        return latencies[min(rank, len(latencies) - 1)]
+
+    def as_dict(self) -> Dict:
+        """Return the statistics as a dictionary."""
+        return dict(
+            count=self.count,
+            errors=self.errors,
+            retries=self.retries,
+            bytes_sent=self.bytes_sent,
+            bytes_received=self.bytes_received,
+            status_codes=dict(self.status_codes),
+            latency=dict(
+                mean=self.total_time / self.count if self.count else None,
+                p50=self.percentile(50),
+                p90=self.percentile(90),
+                p99=self.percentile(99),
+                max=max(self.latencies) if self.latencies else None,
+            ),
+        )
+
+
+class RequestMetrics:
+    """
+    Statistics of the requests of a client, aggregated per endpoint of the KE-chain API.
+
+    The endpoints are named after the keys of the `API_PATH` in :mod:`pykechain.defaults`, eg. `parts` or
+    `property`. Requests to other urls are aggregated under the endpoint `other`. The metrics are thread-safe.
+
+    .. versionadded:: 4.13
+    """
+
+    def __init__(self) -> None:
+        """Create empty request metrics."""
+        self._stats: Dict[str, EndpointStats] = dict()
+        self._lock = threading.Lock()
+
+    def __getstate__(self) -> Dict:
+        state = self.__dict__.copy()
+        del state["_lock"]
+        return state
+
+    def __setstate__(self, state: Dict) -> None:
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+
+    @classmethod
+    @functools.lru_cache(maxsize=1024)
+    def endpoint(cls, url: str) -> str:
+        """
+        Determine the endpoint of the KE-chain API of an url.
+
+        :param url: (absolute or relative) url of the request
+        :return: the key of the endpoint in `API_PATH`, or `other`
+        """
+        path = urlparse(url).path
+        for key, regex in _compile_endpoints():
+            if regex.search(path):
+                return key
+        return "other"
+
+    def record(
+        self,
+        endpoint: str,
+        elapsed: float,
+        status_code: Optional[int] = None,
+        bytes_sent: int = 0,
+        bytes_received: int = 0,
+    ) -> None:
+        """
+        Record a request.
+
+        :param endpoint: the endpoint of the request
+        :param elapsed: duration of the request in seconds
+        :param status_code: (optional) HTTP status code of the response, None if there is no response
+        :param bytes_sent: (optional) size of the request body in bytes
+        :param bytes_received: (optional) size of the response body in bytes
+        """
+        with self._lock:
+            stats = self._stats.setdefault(endpoint, EndpointStats())
+            stats.count += 1
+            stats.total_time += elapsed
+            stats.latencies.append(elapsed)
+            stats.bytes_sent += bytes_sent
+            stats.bytes_received += bytes_received
+            if status_code is None:
+                stats.errors += 1
+            else:
+                stats.status_codes[status_code] += 1
+
+    def record_retry(self, endpoint: str) -> None:
+        """
+        Record a retry of a request.
+
+        :param endpoint: the endpoint of the request
+        """
+        with self._lock:
+            self._stats.setdefault(endpoint, EndpointStats()).retries += 1
+
+    def snapshot(self) -> Dict[str, Dict]:
+        """
+        Return the statistics per endpoint.
+
+        :return: dictionary with the statistics (as a dictionary) per endpoint
+        """
+        with self._lock:
+            return {
+                endpoint: stats.as_dict() for endpoint, stats in self._stats.items()
+            }
+
+    def reset(self) -> None:
+        """Discard all statistics."""
+        with self._lock:
+            self._stats.clear()
@@ -1,42 +1,83 @@
 """All pykechain surrogate models based on KE-chain models."""
-from typing import Union
 
-# isort: off
-from .base import Base, BaseInScope
-from .notification import Notification
-from .scope import Scope
-from .scope2 import Scope2
-from .activity import Activity
-from .activity2 import Activity2
-from .association import Association
-from .part import Part
-from .part2 import Part2
-from .property import Property
-from .property_attachment import AttachmentProperty
-from .property_selectlist import SelectListProperty, MultiSelectListProperty
-from .property_multi_reference import MultiReferenceProperty
-from .property_datetime import DatetimeProperty
-from .property2 import Property2
-from .property2_attachment import AttachmentProperty2
-from .property2_selectlist import SelectListProperty2
-from .property2_multi_reference import MultiReferenceProperty2
-from .property2_datetime import DatetimeProperty2
-from .property_reference import (
-    ActivityReferencesProperty,
-    ContextReferencesProperty,
-    ScopeReferencesProperty,
-    StatusReferencesProperty,
-    StoredFilesReferencesProperty,
-    UserReferencesProperty,
-    FormReferencesProperty,
-)
-from .partset import PartSet
-from .service import Service, ServiceExecution
-from .team import Team
-from .user import User
-from .value_filter import PropertyValueFilter
-from ..enums import PropertyType
-# isort: on
+import importlib
+from typing import TYPE_CHECKING, Union
+
+if TYPE_CHECKING:
+    from .activity import Activity
+    from .activity2 import Activity2
+    from .association import Association
+    from .base import Base, BaseInScope
+    from .notification import Notification
+    from .part import Part
+    from .part2 import Part2
+    from .partset import PartSet
+    from .property import Property
+    from .property2 import Property2
+    from .property2_attachment import AttachmentProperty2
+    from .property2_datetime import DatetimeProperty2
+    from .property2_multi_reference import MultiReferenceProperty2
+    from .property2_selectlist import SelectListProperty2
+    from .property_attachment import AttachmentProperty
+    from .property_datetime import DatetimeProperty
+    from .property_multi_reference import MultiReferenceProperty
+    from .property_reference import (
+        ActivityReferencesProperty,
+        ContextReferencesProperty,
+        FormReferencesProperty,
+        ScopeReferencesProperty,
+        StatusReferencesProperty,
+        StoredFilesReferencesProperty,
+        UserReferencesProperty,
+    )
+    from .property_selectlist import (  # noqa: F401
+        MultiSelectListProperty,
+        SelectListProperty,
+    )
+    from .scope import Scope
+    from .scope2 import Scope2
+    from .service import Service, ServiceExecution
+    from .team import Team
+    from .user import User
+    from .value_filter import PropertyValueFilter
+
+# The models are imported on first access (PEP 562), so only the models that are used are imported.
+_LAZY_IMPORTS = {
+    "Base": ".base",
+    "BaseInScope": ".base",
+    "Notification": ".notification",
+    "Scope": ".scope",
+    "Scope2": ".scope2",
+    "Activity": ".activity",
+    "Activity2": ".activity2",
+    "Association": ".association",
+    "Part": ".part",
+    "Part2": ".part2",
+    "Property": ".property",
+    "AttachmentProperty": ".property_attachment",
+    "SelectListProperty": ".property_selectlist",
+    "MultiSelectListProperty": ".property_selectlist",
+    "MultiReferenceProperty": ".property_multi_reference",
+    "DatetimeProperty": ".property_datetime",
+    "Property2": ".property2",
+    "AttachmentProperty2": ".property2_attachment",
+    "SelectListProperty2": ".property2_selectlist",
+    "MultiReferenceProperty2": ".property2_multi_reference",
+    "DatetimeProperty2": ".property2_datetime",
+    "ActivityReferencesProperty": ".property_reference",
+    "ContextReferencesProperty": ".property_reference",
+    "ScopeReferencesProperty": ".property_reference",
+    "StatusReferencesProperty": ".property_reference",
+    "StoredFilesReferencesProperty": ".property_reference",
+    "UserReferencesProperty": ".property_reference",
+    "FormReferencesProperty": ".property_reference",
+    "PartSet": ".partset",
+    "Service": ".service",
+    "ServiceExecution": ".service",
+    "Team": ".team",
+    "User": ".user",
+    "PropertyValueFilter": ".value_filter",
+}
 
 
 AnyProperty = Union[
@@ -56,25 +97,51 @@ AnyProperty = Union[
     "FormReferencesProperty",
     "ContextReferencesProperty",
     "StatusReferencesProperty",
-    'StoredFilesReferencesProperty',
+    "StoredFilesReferencesProperty",
 ]
 
-# This map is used to identify the correct class for the (KE-chain provided) property type.
-property_type_to_class_map = {
-    PropertyType.ATTACHMENT_VALUE: AttachmentProperty,
-    PropertyType.SINGLE_SELECT_VALUE: SelectListProperty,
-    PropertyType.MULTI_SELECT_VALUE: MultiSelectListProperty,
-    PropertyType.REFERENCES_VALUE: MultiReferenceProperty,
-    PropertyType.DATETIME_VALUE: DatetimeProperty,
-    PropertyType.ACTIVITY_REFERENCES_VALUE: ActivityReferencesProperty,
-    PropertyType.SCOPE_REFERENCES_VALUE: ScopeReferencesProperty,
-    PropertyType.USER_REFERENCES_VALUE: UserReferencesProperty,
-    PropertyType.FORM_REFERENCES_VALUE: FormReferencesProperty,
-    PropertyType.CONTEXT_REFERENCES_VALUE: ContextReferencesProperty,
-    PropertyType.STATUS_REFERENCES_VALUE: StatusReferencesProperty,
-    PropertyType.STOREDFILE_REFERENCES_VALUE: StoredFilesReferencesProperty,
+# The classes of the (KE-chain provided) property types, see `property_type_to_class_map`.
+_PROPERTY_TYPE_CLASSES = {
+    "ATTACHMENT_VALUE": "AttachmentProperty",
+    "SINGLE_SELECT_VALUE": "SelectListProperty",
+    "MULTI_SELECT_VALUE": "MultiSelectListProperty",
+    "REFERENCES_VALUE": "MultiReferenceProperty",
+    "DATETIME_VALUE": "DatetimeProperty",
+    "ACTIVITY_REFERENCES_VALUE": "ActivityReferencesProperty",
+    "SCOPE_REFERENCES_VALUE": "ScopeReferencesProperty",
+    "USER_REFERENCES_VALUE": "UserReferencesProperty",
+    "FORM_REFERENCES_VALUE": "FormReferencesProperty",
+    "CONTEXT_REFERENCES_VALUE": "ContextReferencesProperty",
+    "STATUS_REFERENCES_VALUE": "StatusReferencesProperty",
+    "STOREDFILE_REFERENCES_VALUE": "StoredFilesReferencesProperty",
 }
 
+
+def __getattr__(name):
+    if name == "property_type_to_class_map":
+        # This map is used to identify the correct class for the (KE-chain provided) property type.
+        from ..enums import PropertyType
+
+        value = {
+            getattr(PropertyType, property_type): __getattr__(class_name)
+            for property_type, class_name in _PROPERTY_TYPE_CLASSES.items()
+        }
+    else:
+        try:
+            module = _LAZY_IMPORTS[name]
+        except KeyError:
+            raise AttributeError(
+                f"module '{__name__}' has no attribute '{name}'"
+            ) from None
+        value = getattr(importlib.import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
+
+
 __all__ = (
     "Base",
     "BaseInScope",
@@ -92,9 +92,13 @@ class Banner(Base):
         response = self._client._request("PUT", url, json=update_dict)
 
         if response.status_code != requests.codes.ok:  # pragma: no cover
-            raise APIError(f"Could not update Banner {self}", response=response)
+            raise APIError(
+                f"Could not update Banner {self}",
+                response=response,
+                json_codec=self._client.json_codec,
+            )
 
-        self.refresh(json=response.json().get("results")[0])
+        self.refresh(json=self._client.json_codec.decode(response).get("results")[0])
 
     def delete(self) -> bool:
         """Delete this banner."""
@@ -103,5 +107,9 @@ class Banner(Base):
         )
 
         if response.status_code != requests.codes.no_content:
-            raise APIError(f"Could not delete Banner: {self}", response=response)
+            raise APIError(
+                f"Could not delete Banner: {self}",
+                response=response,
+                json_codec=self._client.json_codec,
+            )
         return True
@@ -1,5 +1,8 @@
 import warnings
-from typing import Dict, List, Optional
+from abc import ABCMeta
+from functools import lru_cache
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple
 
 import requests
 
@@ -16,7 +19,133 @@ class TooManyArgumentsWarning(UserWarning):
     pass
 
 
-class Base:
+_MISSING = object()
+_DELETED = object()
+
+
+class JsonAttribute:
+    """
+    Attribute of a model that reads its value from the json data of the model.
+
+    The value is not copied onto the instance, which keeps the models small when many of them are loaded. The
+    attribute can be assigned and deleted like a regular instance attribute, which overrides the json data until
+    the model is constructed again.
+
+    .. versionadded:: 4.13
+
+    Example
+    -------
+    >>> class Property(Base):
+    ...     type = JsonAttribute("property_type")
+    ...     description = JsonAttribute(default="")
+
+    """
+
+    def __init__(self, key: Optional[str] = None, default: Any = None):
+        """
+        Declare the attribute.
+
+        :param key: (optional) key of the value in the json data, the name of the attribute by default
+        :type key: str or None
+        :param default: (optional) value when the key is absent from the json data, do not use mutable values
+        """
+        self.key = key
+        self.default = default
+
+    def __set_name__(self, owner, name):
+        self.name = name
+        self.key = self.key or name
+
+    def __get__(self, instance, owner=None):
+        if instance is None:
+            return self
+        value = instance.__dict__.get(self.name, _MISSING)
+        if value is _MISSING:
+            value = self.load(instance)
+        if value is _DELETED:
+            raise AttributeError(
+                f"'{type(instance).__name__}' object has no attribute '{self.name}'"
+            )
+        return value
+
+    def __set__(self, instance, value):
+        instance.__dict__[self.name] = value
+
+    def __delete__(self, instance):
+        instance.__dict__[self.name] = _DELETED
+
+    def load(self, instance) -> Any:
+        """Return the value of the attribute from the json data of the instance."""
+        return instance._json_data.get(self.key, self.default)
+
+    @staticmethod
+    def reset(instance) -> None:
+        """Discard the assigned values of the instance, e.g. when it is constructed again with new json data."""
+        for name in _json_attributes(type(instance)):
+            instance.__dict__.pop(name, None)
+
+
+class LazyDatetime(JsonAttribute):
+    """
+    Datetime attribute of a model, parsed from its json data on first access.
+
+    .. versionadded:: 4.13
+    """
+
+    def load(self, instance) -> Optional[datetime]:
+        """Parse the datetime from the json data of the instance and keep it on the instance."""
+        value = parse_datetime(instance._json_data.get(self.key))
+        instance.__dict__[self.name] = value
+        return value
+
+
+@lru_cache(maxsize=None)
+def _json_attributes(cls: type) -> Tuple[str, ...]:
+    """Return the names of the `JsonAttribute` attributes of a class."""
+    return tuple(
+        {
+            name
+            for klass in cls.__mro__
+            for name, value in vars(klass).items()
+            if isinstance(value, JsonAttribute)
+        }
+    )
+
+
+class ModelMeta(type):
+    """
+    Metaclass of the models, reusing the live model with the same id when the identity map of the client is enabled.
+
+    The model is constructed as usual and added to the identity map. When the identity map already holds a live
+    model of the same class and id, the live model is updated with the newly constructed model and returned
+    instead, see :func:`Base._update_from`. The live model is not constructed again, so its caches are kept.
+
+    .. versionadded:: 4.13
+    """
+
+    def __call__(cls, *args, **kwargs):
+        """Construct the model, or update and return the live model with the same id."""
+        obj = super().__call__(*args, **kwargs)
+        identity_map = getattr(getattr(obj, "_client", None), "identity_map", None)
+        json = getattr(obj, "_json_data", None)
+
+        if identity_map is not None and isinstance(json, dict) and json.get("id"):
+            live = identity_map.get_or_add(cls, json["id"], lambda: obj)
+            if live is not obj:
+                live._update_from(obj)
+            return live
+        return obj
+
+
+class AbstractModelMeta(ModelMeta, ABCMeta):
+    """
+    Metaclass of the models that are abstract base classes too, eg. :class:`TreeObject`.
+
+    .. versionadded:: 4.13
+    """
+
+
+class Base(metaclass=ModelMeta):
     """Base model connecting retrieved data to a KE-chain client.
 
     :ivar id: The UUID of the object (corresponds with the UUID in KE-chain).
@@ -27,18 +156,48 @@ class Base:
     :type created_at: datetime or None
     :ivar updated_at: the datetime when the object was last updated if available (otherwise None)
     :type updated_at: datetime or None
+
+    .. versionchanged:: 4.13
+        `id`, `name` and `ref` are read from the json data and `created_at` and `updated_at` are parsed from the
+        json data on first access, see :class:`JsonAttribute`.
     """
 
+    id = JsonAttribute()
+    name = JsonAttribute()
+    ref = JsonAttribute()
+    created_at = LazyDatetime()
+    updated_at = LazyDatetime()
+
+    # caches of a live model that are kept when it is updated by the identity map, see `_update_from`
+    _KEPT_ON_UPDATE: Tuple[str, ...] = ("_etag", "_last_modified")
+
     def __init__(self, json: Dict, client: "Client"):
         """Construct a model from provided json data."""
         self._json_data = json
         self._client: "Client" = check_client(client)
 
-        self.id = json.get("id")
-        self.name = json.get("name")
-        self.ref = json.get("ref")
-        self.created_at = parse_datetime(json.get("created_at"))
-        self.updated_at = parse_datetime(json.get("updated_at"))
+        JsonAttribute.reset(self)
+
+        # validators of the response to reload the object with a conditional request
+        self._etag: Optional[str] = None
+        self._last_modified: Optional[str] = None
+
+    def _update_from(self, other: "Base") -> None:
+        """
+        Update this live model in place with a newly constructed model of the same object.
+
+        The attributes are taken from the other model, except for the caches listed in `_KEPT_ON_UPDATE`.
+
+        :param other: the newly constructed model
+        """
+        kept = {
+            name: self.__dict__[name]
+            for name in self._KEPT_ON_UPDATE
+            if name in self.__dict__
+        }
+        JsonAttribute.reset(self)
+        self.__dict__.update(other.__dict__)
+        self.__dict__.update(kept)
 
     def __repr__(self):  # pragma: no cover
         return f"<pyke {self.__class__.__name__} '{self.name}' id {self.id[-8:]}>"
@@ -64,7 +223,8 @@ class Base:
         use it in an advance way, you may call it with a json response from the server or provide the url to
         refetch the object from the server if the url cant be determined from the object itself.
 
-        It is using the `Client.reload()` function to re-retrieve the object in a backend API call.
+        It is using the `Client.reload()` function to re-retrieve the object in a backend API call. When the object
+        is not modified in KE-chain, the object is left untouched.
 
         :param json: (optional) json dictionary from a response from the server, will re-init object
         :type json: None or dict
@@ -77,7 +237,9 @@ class Base:
             self.__init__(json=json, client=self._client)
         else:
             src = self._client.reload(self, url=url, extra_params=extra_params)
-            self.__dict__.update(src.__dict__)
+            if src is not self:
+                JsonAttribute.reset(self)
+                self.__dict__.update(src.__dict__)
 
 
 class CrudActionsMixin:
@@ -96,7 +258,11 @@ class CrudActionsMixin:
 
     @classmethod
     def list(cls, client: "Client", **kwargs) -> List["self"]:
-        """Retrieve a list of objects through the client."""
+        """Retrieve a list of objects through the client.
+
+        All batches of objects are retrieved. The `limit`, `batch` and `concurrency` keyword arguments
+        are used for the pagination, see :func:`pykechain.Client._paginate`.
+        """
         if not cls.url_list_name:
             raise NotImplementedError(
                 "This object type does not implement the list and get function on the object "
@@ -107,14 +273,11 @@ class CrudActionsMixin:
             )
 
         kwargs.update(API_EXTRA_PARAMS[cls.url_list_name])
-        response = client._request(
-            "GET", client._build_url(cls.url_list_name), params=kwargs
+        results = client._paginate(
+            client._build_url(cls.url_list_name), kwargs, description=cls.__name__
         )
 
-        if response.status_code != requests.codes.ok:  # pragma: no cover
-            raise NotFoundError(f"Could not retrieve {cls.__name__}", response=response)
-
-        return [cls(json=j, client=client) for j in response.json()["results"]]
+        return [cls(json=j, client=client) for j in results]
 
     @classmethod
     def get(cls, client: "Client", **kwargs) -> "self":
@@ -161,8 +324,12 @@ class CrudActionsMixin:
 
             response = client._request("GET", url, params=request_params)
             if response.status_code != requests.codes.ok:  # pragma: no cover
-                raise NotFoundError("Could not retrieve object", response=response)
-            return cls(response.json()["results"][0], client=client)
+                raise NotFoundError(
+                    "Could not retrieve object",
+                    response=response,
+                    json_codec=client.json_codec,
+                )
+            return cls(client.json_codec.decode(response)["results"][0], client=client)
 
         # otherwise do the normal singular retrieve
         return client._retrieve_singular(cls.list, client=client, **kwargs)
@@ -181,7 +348,11 @@ class CrudActionsMixin:
 
         response = self._client._request("DELETE", url)
         if response.status_code != requests.codes.no_content:
-            raise NotFoundError("Could not delete object", response=response)
+            raise NotFoundError(
+                "Could not delete object",
+                response=response,
+                json_codec=self._client.json_codec,
+            )
         # reset the id to None to feedback that the object is deleted in KE-chain
         self.id = None
         return None
@@ -195,6 +366,8 @@ class BaseInScope(Base):
     :type scope_id: str
     """
 
+    _KEPT_ON_UPDATE = Base._KEPT_ON_UPDATE + ("_scope",)
+
     def __init__(self, json, *args, **kwargs):
         """Append the scope ID to the attributes of the base object."""
         super().__init__(json, *args, **kwargs)
@@ -3,7 +3,7 @@ from typing import Any, List, Optional, Tuple, Union
 
 from pykechain.exceptions import IllegalArgumentError
 from pykechain.models import Base, Property
-from pykechain.models.base import BaseInScope
+from pykechain.models.base import AbstractModelMeta, BaseInScope
 from pykechain.models.input_checks import check_base, check_list_of_base
 from pykechain.models.value_filter import BaseFilter
 
@@ -131,7 +131,7 @@ class _ReferenceProperty(Property):
         raise NotImplementedError(f"Method not (yet) implemented for {self.__class__}")
 
 
-class _ReferencePropertyInScope(_ReferenceProperty, ABC):
+class _ReferencePropertyInScope(_ReferenceProperty, ABC, metaclass=AbstractModelMeta):
     """
     Private base class for the KE-chain reference properties pointing to objects confined to a scope.
 
@@ -130,9 +130,15 @@ class Context(
         response = self._client._request("PUT", url, json=update_dict)
 
         if response.status_code != requests.codes.ok:  # pragma: no cover
-            raise APIError(f"Could not update Context: {self}", response=response)
+            raise APIError(
+                f"Could not update Context: {self}",
+                response=response,
+                json_codec=self._client.json_codec,
+            )
 
-        return self.refresh(json=response.json().get("results")[0])
+        return self.refresh(
+            json=self._client.json_codec.decode(response).get("results")[0]
+        )
 
     def link_activities(
         self, activities: Optional[List[Union["Activity", ObjectIDs]]] = empty, **kwargs
@@ -155,9 +161,15 @@ class Context(
         response = self._client._request("POST", url, json=update_dict)
 
         if response.status_code != requests.codes.ok:  # pragma: no cover
-            raise APIError(f"Could not update Context: {self}", response=response)
+            raise APIError(
+                f"Could not update Context: {self}",
+                response=response,
+                json_codec=self._client.json_codec,
+            )
 
-        return self.refresh(json=response.json().get("results")[0])
+        return self.refresh(
+            json=self._client.json_codec.decode(response).get("results")[0]
+        )
 
     def unlink_activities(
         self, activities: Optional[List[Union["Activity", ObjectIDs]]] = empty, **kwargs
@@ -180,9 +192,15 @@ class Context(
         response = self._client._request("POST", url, json=update_dict)
 
         if response.status_code != requests.codes.ok:  # pragma: no cover
-            raise APIError(f"Could not update Context: {self}", response=response)
-
-        return self.refresh(json=response.json().get("results")[0])
+            raise APIError(
+                f"Could not update Context: {self}",
+                response=response,
+                json_codec=self._client.json_codec,
+            )
+
+        return self.refresh(
+            json=self._client.json_codec.decode(response).get("results")[0]
+        )
 
     def delete(self):
         """Delete the Context."""
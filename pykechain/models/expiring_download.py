@@ -44,6 +44,7 @@ class ExpiringDownload(Base):
             raise APIError(
                 f"Could not download file from Expiring download {self}",
                 response=response,
+                json_codec=self._client.json_codec,
             )
 
         with open(full_path, "w+b") as f:
@@ -61,7 +62,9 @@ class ExpiringDownload(Base):
 
         if response.status_code != requests.codes.no_content:  # pragma: no cover
             raise APIError(
-                f"Could not delete Expiring Download {self}", response=response
+                f"Could not delete Expiring Download {self}",
+                response=response,
+                json_codec=self._client.json_codec,
             )
 
     def edit(
@@ -98,10 +101,12 @@ class ExpiringDownload(Base):
 
         if response.status_code != requests.codes.ok:  # pragma: no cover
             raise APIError(
-                f"Could not update Expiring Download {self}", response=response
+                f"Could not update Expiring Download {self}",
+                response=response,
+                json_codec=self._client.json_codec,
             )
 
-        self.refresh(json=response.json()["results"][0])
+        self.refresh(json=self._client.json_codec.decode(response)["results"][0])
 
     def upload(self, content_path):
         """
@@ -134,7 +139,9 @@ class ExpiringDownload(Base):
             requests.codes.ok,
         ):  # pragma: no cover
             raise APIError(
-                f"Could not upload  file to Expiring Download {self}", response=response
+                f"Could not upload  file to Expiring Download {self}",
+                response=response,
+                json_codec=self._client.json_codec,
             )
 
-        self.refresh(json=response.json()["results"][0])
+        self.refresh(json=self._client.json_codec.decode(response)["results"][0])
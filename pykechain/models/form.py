@@ -133,9 +133,13 @@ class Form(BaseInScope, CrudActionsMixin, TagsMixin, NameDescriptionTranslationM
         )
 
         if response.status_code != requests.codes.created:  # pragma: no cover
-            raise APIError(f"Could not create {cls.__name__}", response=response)
+            raise APIError(
+                f"Could not create {cls.__name__}",
+                response=response,
+                json_codec=client.json_codec,
+            )
 
-        return cls(json=response.json()["results"][0], client=client)
+        return cls(json=client.json_codec.decode(response)["results"][0], client=client)
 
     #
     # Concepts underneath the Form
@@ -231,9 +235,13 @@ class Form(BaseInScope, CrudActionsMixin, TagsMixin, NameDescriptionTranslationM
             raise ForbiddenError("A form model with instances created cannot be edited")
 
         if response.status_code != requests.codes.ok:  # pragma: no cover
-            raise APIError(f"Could not update Form {self}", response=response)
+            raise APIError(
+                f"Could not update Form {self}",
+                response=response,
+                json_codec=self._client.json_codec,
+            )
 
-        self.refresh(json=response.json().get("results")[0])
+        self.refresh(json=self._client.json_codec.decode(response).get("results")[0])
 
     def delete(self) -> None:
         """Delete this Form.
@@ -245,7 +253,11 @@ class Form(BaseInScope, CrudActionsMixin, TagsMixin, NameDescriptionTranslationM
         )
 
         if response.status_code != requests.codes.no_content:  # pragma: no cover
-            raise APIError(f"Could not delete Form {self}", response=response)
+            raise APIError(
+                f"Could not delete Form {self}",
+                response=response,
+                json_codec=self._client.json_codec,
+            )
 
     def instantiate(self, name: Optional[str], **kwargs) -> "Form":
         """Create a new Form instance based on a model."""
@@ -269,10 +281,14 @@ class Form(BaseInScope, CrudActionsMixin, TagsMixin, NameDescriptionTranslationM
 
         if response.status_code != requests.codes.created:
             raise APIError(
-                f"Could not instantiate this Form: {self}", response=response
+                f"Could not instantiate this Form: {self}",
+                response=response,
+                json_codec=self._client.json_codec,
             )
 
-        instantiated_form = Form(response.json()["results"][0], client=self._client)
+        instantiated_form = Form(
+            self._client.json_codec.decode(response)["results"][0], client=self._client
+        )
         return instantiated_form
 
     def clone(
@@ -313,9 +329,15 @@ class Form(BaseInScope, CrudActionsMixin, TagsMixin, NameDescriptionTranslationM
             )
 
         if response.status_code != requests.codes.created:
-            raise APIError(f"Could not clone this Form: {self}", response=response)
+            raise APIError(
+                f"Could not clone this Form: {self}",
+                response=response,
+                json_codec=self._client.json_codec,
+            )
 
-        return Form(response.json()["results"][0], client=self._client)
+        return Form(
+            self._client.json_codec.decode(response)["results"][0], client=self._client
+        )
 
     def activate(self):
         """Put the form to active.
@@ -327,7 +349,11 @@ class Form(BaseInScope, CrudActionsMixin, TagsMixin, NameDescriptionTranslationM
             url = self._client._build_url("form_activate", form_id=self.id)
             response = self._client._request("PUT", url=url)
             if response.status_code != requests.codes.ok:  # pragma: no cover
-                raise APIError("Could not activate the form", response=response)
+                raise APIError(
+                    "Could not activate the form",
+                    response=response,
+                    json_codec=self._client.json_codec,
+                )
 
             # we need to do a full refresh here from the server as the
             # API of form/<id>/activate does not return the full object as response.
@@ -346,7 +372,11 @@ class Form(BaseInScope, CrudActionsMixin, TagsMixin, NameDescriptionTranslationM
             url = self._client._build_url("form_deactivate", form_id=self.id)
             response = self._client._request("PUT", url=url)
             if response.status_code != requests.codes.ok:  # pragma: no cover
-                raise APIError("Could not activate the form", response=response)
+                raise APIError(
+                    "Could not activate the form",
+                    response=response,
+                    json_codec=self._client.json_codec,
+                )
 
             # we need to do a full refresh here from the server as the
             # API of form/<id>/deactivate does not return the full object as response.
@@ -372,8 +402,9 @@ class Form(BaseInScope, CrudActionsMixin, TagsMixin, NameDescriptionTranslationM
             raise APIError(
                 "Could not link the specific contexts to the form",
                 response=response,
+                json_codec=self._client.json_codec,
             )
-        self.refresh(json=response.json()["results"][0])
+        self.refresh(json=self._client.json_codec.decode(response)["results"][0])
 
     def unlink_contexts(self, contexts: List[Union[Context, ObjectID]]):
         """
@@ -392,8 +423,9 @@ class Form(BaseInScope, CrudActionsMixin, TagsMixin, NameDescriptionTranslationM
             raise APIError(
                 "Could not unlink the specific contexts from the form",
                 response=response,
+                json_codec=self._client.json_codec,
             )
-        self.refresh(json=response.json()["results"][0])
+        self.refresh(json=self._client.json_codec.decode(response)["results"][0])
 
     def set_status_assignees(self, statuses: List[dict]):
         """
@@ -441,8 +473,9 @@ class Form(BaseInScope, CrudActionsMixin, TagsMixin, NameDescriptionTranslationM
             raise APIError(
                 "Could not set the list of status assignees to the form",
                 response=response,
+                json_codec=self._client.json_codec,
             )
-        self.refresh(json=response.json()["results"][0])
+        self.refresh(json=self._client.json_codec.decode(response)["results"][0])
 
     def possible_transitions(self) -> List[Transition]:
         """Retrieve the possible transitions that may be applied on the Form.
@@ -488,8 +521,9 @@ class Form(BaseInScope, CrudActionsMixin, TagsMixin, NameDescriptionTranslationM
             raise APIError(
                 "Could not transition the form",
                 response=response,
+                json_codec=self._client.json_codec,
             )
-        self.refresh(json=response.json()["results"][0])
+        self.refresh(json=self._client.json_codec.decode(response)["results"][0])
 
     def has_part(self, part: Part) -> bool:
         """Return boolean if given Part is part of the Form tree.
@@ -510,8 +544,9 @@ class Form(BaseInScope, CrudActionsMixin, TagsMixin, NameDescriptionTranslationM
             raise APIError(
                 f"Could not process whether `Form` {self.id} has part {part_id}",
                 response=response,
+                json_codec=self._client.json_codec,
             )
-        return response.json()["results"][0]["has_part"]
+        return self._client.json_codec.decode(response)["results"][0]["has_part"]
 
     def set_prefill_parts(self, prefill_parts: dict) -> None:
         """Set the prefill_parts on the Form.
@@ -570,8 +605,9 @@ class Form(BaseInScope, CrudActionsMixin, TagsMixin, NameDescriptionTranslationM
             raise APIError(
                 "Could not update the prefill_parts dictionary on the form collection",
                 response=response,
+                json_codec=self._client.json_codec,
             )
-        self.refresh(json=response.json()["results"][0])
+        self.refresh(json=self._client.json_codec.decode(response)["results"][0])
 
     def workflows_compatible_with_scope(self, scope: Scope):
         """Return workflows from target scope that are compatible with source workflow.
@@ -591,5 +627,6 @@ class Form(BaseInScope, CrudActionsMixin, TagsMixin, NameDescriptionTranslationM
             raise APIError(
                 "Could not retrieve the compatible workflows",
                 response=response,
+                json_codec=self._client.json_codec,
             )
-        return response.json()["results"]
+        return self._client.json_codec.decode(response)["results"]
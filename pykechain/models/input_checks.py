@@ -5,8 +5,6 @@ from datetime import date, datetime, time
 from enum import Enum
 from typing import Any, Callable, Dict, Iterable, List, Optional, Union
 
-import jsonschema
-
 from pykechain.exceptions import IllegalArgumentError
 from pykechain.utils import (
     Empty,
@@ -343,6 +341,8 @@ def check_json(
     :raises jsonschema.SchemaError: When the schema is incorrect.
     """
     if not isinstance(value, (type(None), Empty)):
+        import jsonschema  # imported on use, as it is slow to import
+
         jsonschema.validate(value, schema)
     return value
 
@@ -172,6 +172,10 @@ class Notification(Base):
         response = self._client._request("PUT", url, json=update_dict)
 
         if response.status_code != requests.codes.ok:  # pragma: no cover
-            raise APIError(f"Could not update Notification {self}", response=response)
+            raise APIError(
+                f"Could not update Notification {self}",
+                response=response,
+                json_codec=self._client.json_codec,
+            )
 
-        self.refresh(json=response.json().get("results")[0])
+        self.refresh(json=self._client.json_codec.decode(response).get("results")[0])
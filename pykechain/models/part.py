@@ -1,8 +1,12 @@
-from typing import Any, Dict, List, Optional, Tuple, Union  # noqa: F401
+from typing import Any, Dict, Iterator, List, Optional, Tuple, Union  # noqa: F401
 
 import requests
 
-from pykechain.defaults import API_EXTRA_PARAMS, PARTS_BATCH_LIMIT
+from pykechain.defaults import (
+    API_EXTRA_PARAMS,
+    BATCH_LOADER_CHUNK_SIZE,
+    PARTS_BATCH_LIMIT,
+)
 from pykechain.enums import Category, Classification, Multiplicity, PropertyType
 from pykechain.exceptions import (
     APIError,
@@ -10,6 +14,7 @@ from pykechain.exceptions import (
     MultipleFoundError,
     NotFoundError,
 )
+from pykechain.models.base import JsonAttribute
 from pykechain.models.input_checks import (
     check_list_of_base,
     check_list_of_dicts,
@@ -18,7 +23,14 @@ from pykechain.models.input_checks import (
 )
 from pykechain.models.property import Property
 from pykechain.models.tree_traversal import TreeObject
-from pykechain.utils import Empty, clean_empty_values, empty, find, find_obj_in_list
+from pykechain.utils import (
+    Empty,
+    clean_empty_values,
+    empty,
+    find,
+    find_obj_in_list,
+    get_in_chunks,
+)
 
 
 class Part(TreeObject):
@@ -47,8 +59,10 @@ class Part(TreeObject):
     :type multiplicity: basestring
     :ivar scope_id: scope UUID of the Part
     :type scope_id: basestring
-    :ivar properties: the list of properties of this part
+    :ivar properties: the list of properties of this part, created on first access
     :type properties: List[AnyProperty]
+    :cvar lazy_properties: flag to create the properties of a part only when these are accessed
+    :type lazy_properties: bool
 
     Examples
     --------
@@ -79,6 +93,14 @@ class Part(TreeObject):
 
     """
 
+    _LAZY_PROPERTIES = True
+
+    model_id: str = JsonAttribute()
+    category: Category = JsonAttribute()
+    description: str = JsonAttribute()
+    multiplicity: str = JsonAttribute()
+    classification: Classification = JsonAttribute()
+
     def __init__(self, json: Dict, **kwargs):
         """Construct a part from a KE-chain 2 json response.
 
@@ -88,25 +110,88 @@ class Part(TreeObject):
         # we need to run the init of 'Base' instead of 'Part' as we do not need the instantiation of properties
         super().__init__(json, **kwargs)
 
-        self.ref: str = json.get("ref")
-        self.model_id: str = json.get("model_id")
-        self.category: Category = json.get("category")
-        self.description: str = json.get("description")
-        self.multiplicity: str = json.get("multiplicity")
-        self.classification: Classification = json.get("classification")
-
-        sorted_properties: List[Dict] = sorted(
-            json["properties"], key=lambda p: p.get("order", 0)
-        )
-        self.properties: List[Property] = [
-            Property.create(p, client=self._client) for p in sorted_properties
-        ]
+        self._properties: Optional[List[Property]] = None
+        self._property_index: Optional[Tuple] = None
+        if not self._LAZY_PROPERTIES:
+            self._properties = self._create_properties()
 
         proxy_data: Optional[Dict] = json.get("proxy_source_id_name", dict())
         self._proxy_model_id: Optional[str] = (
             proxy_data.get("id") if proxy_data else None
         )
 
+    @property
+    def properties(self) -> List["AnyProperty"]:
+        """
+        Retrieve the properties of this part, ordered by their order.
+
+        The properties are created from the json of the part on first access, as creating them is relatively
+        expensive while these are often not used, eg. when listing many parts for their names.
+        """
+        if self._properties is None:
+            self._properties = self._create_properties()
+        return self._properties
+
+    @properties.setter
+    def properties(self, value: List["AnyProperty"]) -> None:
+        self._properties = value
+        self._property_index = None
+
+    @classmethod
+    def set_lazy_properties(cls, value: bool) -> None:
+        """
+        Set global class attribute to toggle creating the properties of parts only on first access.
+
+        .. versionadded:: 4.13
+
+        :param value: False to create the properties when a part is created, defaults to True
+        :type value: bool
+        """
+        check_type(value, bool, "value")
+        cls._LAZY_PROPERTIES = value
+
+    def _create_properties(self) -> List["AnyProperty"]:
+        sorted_properties: List[Dict] = sorted(
+            self._json_data.get("properties") or list(),
+            key=lambda p: p.get("order", 0),
+        )
+        return [Property.create(p, client=self._client) for p in sorted_properties]
+
+    def _property_indexes(self) -> Tuple[Dict, Dict, Dict]:
+        """
+        Return the positions of the properties of this part indexed on their id, lowercased name and ref.
+
+        The indexes are built on first use and rebuilt when the list of properties is replaced or its length
+        changes, eg. when a property is added or removed. The properties found at these positions are checked by
+        the lookups, as the properties might be replaced or renamed since.
+        """
+        properties = self.properties
+        index = self._property_index
+        if index is None or index[0] is not properties or index[1] != len(properties):
+            by_id, by_name, by_ref = dict(), dict(), dict()
+            for position, prop in enumerate(properties):
+                by_id[prop.id] = position
+                by_name.setdefault((prop.name or "").lower(), []).append(position)
+                by_ref.setdefault(prop.ref, []).append(position)
+            index = self._property_index = (
+                properties,
+                len(properties),
+                by_id,
+                by_name,
+                by_ref,
+            )
+        return index[2:]
+
+    def _update_from(self, other: "Part") -> None:
+        properties = self._properties
+        super()._update_from(other)
+        if properties is not None and self._properties is None:
+            if "properties" in self._json_data:
+                # the properties are recreated as the live properties, updated in place by the identity map
+                self.properties = self._create_properties()
+            else:
+                self.properties = properties
+
     def __call__(self, *args, **kwargs) -> "Part":
         """Short-hand version of the `child` method."""
         return self.child(*args, **kwargs)
@@ -121,7 +206,8 @@ class Part(TreeObject):
         if extra_params is None:
             extra_params = {}
         extra_params.update(API_EXTRA_PARAMS["part"])
-        existing_properties = {p.id: p for p in self.properties}
+        existing_json = self._json_data
+        existing_properties = {p.id: p for p in self._properties or list()}
 
         super().refresh(
             json=json,
@@ -129,6 +215,10 @@ class Part(TreeObject):
             extra_params=extra_params,
         )
 
+        if self._json_data is existing_json or not existing_properties:
+            # not modified in KE-chain or the properties were not created yet, hence these are up to date
+            return
+
         # The properties have been recreated anew when refreshing the part, but should be refreshed in-place.
         new_properties = list(self.properties)
         self.properties = []
@@ -167,7 +257,29 @@ class Part(TreeObject):
         >>> gears.value
         6
 
+        .. versionchanged:: 4.13
+            The property is found with the indexes of the properties of this part instead of a scan of the
+            properties.
+
         """
+        if isinstance(name, str):
+            by_id, by_name, by_ref = self._property_indexes()
+            properties = self.properties
+            if name in by_id:
+                matches = [properties[by_id[name]]]
+                found = matches[0].id == name
+            elif name.lower() in by_name:
+                matches = [properties[position] for position in by_name[name.lower()]]
+                found = all((p.name or "").lower() == name.lower() for p in matches)
+            else:
+                matches = [properties[position] for position in by_ref.get(name, [])]
+                found = bool(matches) and all(p.ref == name for p in matches)
+            # the property might have been replaced or renamed since the indexes were built
+            if found and len(matches) == 1:
+                return matches[0]
+
+        # not found, found multiple or out of date: scan the properties to raise the right error
+        self._property_index = None
         return find_obj_in_list(name, iterable=self.properties)
 
     def scope(self) -> "Scope":
@@ -288,7 +400,9 @@ class Part(TreeObject):
             raise NotFoundError(f"{self} has no matching child.{criteria}")
         return part
 
-    def populate_descendants(self, batch: int = PARTS_BATCH_LIMIT) -> None:
+    def populate_descendants(
+        self, batch: int = PARTS_BATCH_LIMIT, concurrency: Optional[int] = None
+    ) -> None:
         """
         Retrieve the descendants of a specific part in a list of dicts and populate the :func:`Part.children()` method.
 
@@ -300,8 +414,14 @@ class Part(TreeObject):
 
         .. versionchanged:: 3.3.2 now populates child parts instead of this part
 
+        .. versionchanged:: 4.13
+            added `concurrency` to retrieve the batches in parallel. The tree is linked in linear time.
+
         :param batch: Number of Parts to be retrieved in a batch
         :type batch: int (defaults to 100)
+        :param concurrency: (optional) number of batches to retrieve in parallel after the first batch,
+            defaults to retrieving the batches one after the other.
+        :type concurrency: int or None
         :returns: None
         :raises APIError: if you cannot create the children tree.
 
@@ -310,24 +430,83 @@ class Part(TreeObject):
         >>> bike = project.part('Bike')
         >>> bike.populate_descendants(batch=150)
 
+        Populate a large product tree, retrieving 8 batches in parallel
+
+        >>> product_root.populate_descendants(batch=500, concurrency=8)
+
         """
-        all_descendants = list(
-            self._client.parts(
-                category=self.category,
-                batch=batch,
-                descendants=self.id,
-            )
+        all_descendants = self._client.parts(
+            category=self.category,
+            batch=batch,
+            concurrency=concurrency,
+            descendants=self.id,
         )
-        try:
-            all_descendants.remove(
-                self
-            )  # remove the part itself because it is not needed for the direct descendants
-        except ValueError:
-            pass
         self._populate_cached_children(all_descendants=all_descendants, overwrite=True)
 
         return None
 
+    def iter_descendant_levels(
+        self,
+        batch: int = PARTS_BATCH_LIMIT,
+        concurrency: Optional[int] = None,
+        chunk_size: int = BATCH_LOADER_CHUNK_SIZE,
+    ) -> Iterator[List["Part"]]:
+        """
+        Retrieve the descendants of this part level by level, populating the :func:`Part.children()` method.
+
+        Every depth level of the part tree is yielded as soon as it is retrieved, so the traversal of the tree can
+        start before the whole tree is loaded. The children of the parts of a level are retrieved with
+        `parent_id__in` requests of (at most) `chunk_size` parents each. The children of the yielded parts are
+        populated when the next level is retrieved; until then :func:`Part.children()` retrieves them on the go.
+        When the iteration is exhausted, the whole tree is populated as with :func:`Part.populate_descendants`.
+
+        .. versionadded:: 4.13
+
+        :param batch: Number of Parts to be retrieved in a batch
+        :type batch: int (defaults to 100)
+        :param concurrency: (optional) number of batches to retrieve in parallel after the first batch,
+            defaults to retrieving the batches one after the other.
+        :type concurrency: int or None
+        :param chunk_size: maximum number of parents per request (defaults to 100)
+        :type chunk_size: int
+        :return: generator of the lists of parts per depth level, starting with the children of this part
+        :raises APIError: if you cannot create the children tree.
+
+        Example
+        -------
+        >>> for depth, parts in enumerate(product_root.iter_descendant_levels(concurrency=8), start=1):
+        ...     print(depth, len(parts))
+
+        """
+        parents = [self]
+        while parents:
+            parent_by_id = dict()
+            for parent in parents:
+                parent._cached_children = []
+                parent_by_id[parent.id] = parent
+
+            level = []
+            for parent_ids in get_in_chunks(
+                lst=list(parent_by_id), chunk_size=chunk_size
+            ):
+                level.extend(
+                    self._client.parts(
+                        category=self.category,
+                        batch=batch,
+                        concurrency=concurrency,
+                        parent_id__in=",".join(parent_ids),
+                    )
+                )
+
+            for part in level:
+                parent = parent_by_id[part.parent_id]
+                part._parent = parent
+                parent._cached_children.append(part)
+
+            if level:
+                yield level
+            parents = level
+
     def all_children(self) -> List["Part"]:
         """
         Retrieve a flat list of all descendants, sorted depth-first. Also populates all descendants.
@@ -462,7 +641,7 @@ class Part(TreeObject):
         if response.status_code != requests.codes.ok:  # pragma: no cover
             raise NotFoundError("Could not retrieve Parts instances")
 
-        count = response.json()["count"]
+        count = self._client.json_codec.decode(response)["count"]
 
         return count
 
@@ -544,9 +723,13 @@ class Part(TreeObject):
         )
 
         if response.status_code != requests.codes.ok:  # pragma: no cover
-            raise APIError(f"Could not update Part {self}", response=response)
+            raise APIError(
+                f"Could not update Part {self}",
+                response=response,
+                json_codec=self._client.json_codec,
+            )
 
-        self.refresh(json=response.json().get("results")[0])
+        self.refresh(json=self._client.json_codec.decode(response).get("results")[0])
 
     def proxy_model(self) -> "Part":
         """
@@ -854,10 +1037,14 @@ class Part(TreeObject):
         )
 
         if response.status_code != requests.codes.created:  # pragma: no cover
-            raise APIError(f"Could not add to Part {self}", response=response)
+            raise APIError(
+                f"Could not add to Part {self}",
+                response=response,
+                json_codec=self._client.json_codec,
+            )
 
         new_part_instance: Part = Part(
-            response.json()["results"][0], client=self._client
+            self._client.json_codec.decode(response)["results"][0], client=self._client
         )
 
         # ensure that cached children are updated
@@ -1078,7 +1265,10 @@ class Part(TreeObject):
         if name:
             payload_json.update(name=name)
 
-        if Property._USE_BULK_UPDATE and not (name or kwargs):
+        if not (name or kwargs) and (
+            self._client._pending_property_updates() is not None
+            or self._client._active_unit_of_work() is not None
+        ):
             # Send updates to the property value in case of bulk updates while no part update is required
             for prop in self.properties:
                 if prop.id in update_dict:
@@ -1092,10 +1282,14 @@ class Part(TreeObject):
             )
 
             if response.status_code != requests.codes.ok:  # pragma: no cover
-                raise APIError(f"Could not update Part {self}", response=response)
+                raise APIError(
+                    f"Could not update Part {self}",
+                    response=response,
+                    json_codec=self._client.json_codec,
+                )
 
             # update local properties (without a call)
-            self.refresh(json=response.json()["results"][0])
+            self.refresh(json=self._client.json_codec.decode(response)["results"][0])
 
         # If any values can not be set via the json, set them individually
         for exception_fvalue in exception_fvalues:
@@ -1112,7 +1306,11 @@ class Part(TreeObject):
         )
 
         if response.status_code != requests.codes.no_content:  # pragma: no cover
-            raise APIError(f"Could not delete Part {self}", response=response)
+            raise APIError(
+                f"Could not delete Part {self}",
+                response=response,
+                json_codec=self._client.json_codec,
+            )
 
     def order_properties(
         self, property_list: Optional[List[Union["AnyProperty", str]]] = None
@@ -1172,7 +1370,9 @@ class Part(TreeObject):
 
         if response.status_code != requests.codes.ok:  # pragma: no cover
             raise APIError(
-                f"Could not reorder Properties of Part {self}", response=response
+                f"Could not reorder Properties of Part {self}",
+                response=response,
+                json_codec=self._client.json_codec,
             )
 
         return
@@ -1,12 +1,12 @@
 from typing import Any, Dict, Iterable, List, Optional, Tuple, TypeVar, Union
 
 import requests
-from jsonschema import validate
 
 from pykechain.defaults import API_EXTRA_PARAMS
 from pykechain.enums import Category
 from pykechain.exceptions import APIError, IllegalArgumentError
 from pykechain.models import Base, BaseInScope
+from pykechain.models.base import JsonAttribute
 from pykechain.models.input_checks import check_text, check_type
 from pykechain.models.representations.component import RepresentationsComponent
 from pykechain.models.validators import PropertyValidator
@@ -49,36 +49,33 @@ class Property(BaseInScope):
     """
 
     _USE_BULK_UPDATE = False
-    _update_package = dict()
+
+    output: bool = JsonAttribute()
+    model_id: Optional[str] = JsonAttribute()
+    part_id: Optional[str] = JsonAttribute()
+    type: str = JsonAttribute("property_type")
+    category: str = JsonAttribute()
+    description: Optional[str] = JsonAttribute()
+    unit: Optional[str] = JsonAttribute()
+    order: Optional[int] = JsonAttribute()
+
+    # results of the last validation, see `validate`
+    _validation_results: Iterable = ()
+    _validation_reasons: Iterable = ()
+
+    _KEPT_ON_UPDATE = BaseInScope._KEPT_ON_UPDATE + ("_part", "_model")
 
     def __init__(self, json, **kwargs):
         """Construct a Property from a json object."""
         super().__init__(json, **kwargs)
 
-        self.output: bool = json.get("output")
-        self.model_id: Optional[str] = json.get("model_id")
-        self.part_id = json.get("part_id")
-        self.ref = json.get("ref")
-        self.type = json.get("property_type")
-        self.category = json.get("category")
-        self.description = json.get("description", None)
-        self.unit = json.get("unit", None)
-        self.order = json.get("order")
-
         # Create protected variables
         self._value: Any = json.get("value")
         self._options: Dict = json.get("value_options", {})
         self._part: Optional["Part"] = None
         self._model: Optional["Property"] = None
         self._validators: List[PropertyValidator] = []
-        self._validation_results: List = []
-        self._validation_reasons: List = []
-
-        self._representations_container = RepresentationsComponent(
-            self,
-            self._options.get("representations", {}),
-            self._save_representations,
-        )
+        self._representations_component: Optional[RepresentationsComponent] = None
 
         if "validators" in self._options:
             self._parse_validators()
@@ -92,6 +89,8 @@ class Property(BaseInScope):
         :raises jsonschema.exceptions.SchemaError: if the JSON schema of the options is invalid
         :returns: Boolean True if valid
         """
+        from jsonschema import validate
+
         validate(self._options, options_json_schema)
         return True
 
@@ -127,9 +126,15 @@ class Property(BaseInScope):
 
     @property
     def use_bulk_update(self):
-        """Set or get the toggle to asynchronously update property values."""
-        # set the class attribute to make this value a singleton
-        return self.__class__._USE_BULK_UPDATE
+        """Set or get the toggle to asynchronously update property values.
+
+        Property values are always updated asynchronously inside a `with client.unit_of_work()` or a
+        `with client.bulk_update_properties()` block.
+        """
+        return (
+            self._client._active_unit_of_work() is not None
+            or self._client._pending_property_updates() is not None
+        )
 
     @use_bulk_update.setter
     def use_bulk_update(self, value):
@@ -169,7 +174,10 @@ class Property(BaseInScope):
     @classmethod
     def update_values(cls, client: "Client", use_bulk_update: bool = False) -> None:
         """
-        Perform the bulk update of property values using the stored values in the `Property` class.
+        Perform the bulk update of property values using the values stored in the client.
+
+        .. versionchanged:: 4.13
+           The values are stored per client and sent in chunks of 100 properties.
 
         :param client: Client object
         :type client: Client
@@ -178,20 +186,19 @@ class Property(BaseInScope):
         :return: None
         """
         if cls._USE_BULK_UPDATE:
-            properties = [
-                dict(id=key, **values) for key, values in cls._update_package.items()
-            ]
-            client.update_properties(properties=properties)
-            cls._update_package = dict()
+            client._property_updates.flush()
         cls.set_bulk_update(use_bulk_update)
 
     def _pend_update(self, data):
-        """Store the value to be send at a later point in time using `update_values`."""
-        existing_data = self.__class__._update_package.get(self.id, None)
-        if existing_data:
-            existing_data.update(data)
+        """Store the value to be send at a later point in time using `update_values` or the unit of work."""
+        unit_of_work = self._client._active_unit_of_work()
+        if unit_of_work is not None:
+            unit_of_work.update_property(self, **data)
         else:
-            self.__class__._update_package[self.id] = data
+            buffer = self._client._pending_property_updates()
+            if buffer is None:
+                buffer = self._client._property_updates
+            buffer.add(self, **data)
 
     def _put_value(self, value):
         """Send the value to KE-chain."""
@@ -202,9 +209,13 @@ class Property(BaseInScope):
         )
 
         if response.status_code != requests.codes.ok:  # pragma: no cover
-            raise APIError(f"Could not update Property {self}", response=response)
+            raise APIError(
+                f"Could not update Property {self}",
+                response=response,
+                json_codec=self._client.json_codec,
+            )
 
-        self.refresh(json=response.json()["results"][0])
+        self.refresh(json=self._client.json_codec.decode(response)["results"][0])
 
     def serialize_value(self, value: [T]) -> T:
         """
@@ -292,6 +303,8 @@ class Property(BaseInScope):
 
     def _dump_validators(self):
         """Dump the validators as json inside the _options dictionary with the key `validators`."""
+        from jsonschema import validate
+
         validators_json = []
         for validator in self._validators:
             if isinstance(validator, PropertyValidator):
@@ -366,6 +379,17 @@ class Property(BaseInScope):
         else:
             return self._validation_results
 
+    @property
+    def _representations_container(self) -> RepresentationsComponent:
+        # created on first use, as the representations of most properties are never inspected
+        if self._representations_component is None:
+            self._representations_component = RepresentationsComponent(
+                self,
+                self._options.get("representations", {}),
+                self._save_representations,
+            )
+        return self._representations_component
+
     @property
     def representations(self):
         """Get and set the property representations."""
@@ -481,9 +505,13 @@ class Property(BaseInScope):
             )
 
             if response.status_code != requests.codes.ok:  # pragma: no cover
-                raise APIError(f"Could not update Property {self}", response=response)
+                raise APIError(
+                    f"Could not update Property {self}",
+                    response=response,
+                    json_codec=self._client.json_codec,
+                )
 
-            self.refresh(json=response.json()["results"][0])
+            self.refresh(json=self._client.json_codec.decode(response)["results"][0])
 
     def delete(self) -> None:
         """Delete this property.
@@ -496,7 +524,11 @@ class Property(BaseInScope):
         )
 
         if response.status_code != requests.codes.no_content:  # pragma: no cover
-            raise APIError(f"Could not delete Property {self}", response=response)
+            raise APIError(
+                f"Could not delete Property {self}",
+                response=response,
+                json_codec=self._client.json_codec,
+            )
 
     def copy(self, target_part: "Part", name: Optional[str] = None) -> "Property":
         """Copy a property model or instance.
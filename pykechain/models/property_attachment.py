@@ -69,7 +69,7 @@ class AttachmentProperty(Property):
         >>> deserialised_json = json_attachment.json_load()
 
         """
-        return self._download().json()
+        return self._client.json_codec.decode(self._download())
 
     def upload(self, data: Any, **kwargs: Any) -> None:
         """Upload a file to the attachment property.
@@ -143,7 +143,11 @@ class AttachmentProperty(Property):
         response = self._client._request("GET", url, params=request_params)
 
         if response.status_code != requests.codes.ok:  # pragma: no cover
-            raise APIError("Could not download property value.", response=response)
+            raise APIError(
+                "Could not download property value.",
+                response=response,
+                json_codec=self._client.json_codec,
+            )
 
         return response
 
@@ -158,4 +162,8 @@ class AttachmentProperty(Property):
         )
 
         if response.status_code != requests.codes.ok:  # pragma: no cover
-            raise APIError("Could not upload attachment", response=response)
+            raise APIError(
+                "Could not upload attachment",
+                response=response,
+                json_codec=self._client.json_codec,
+            )
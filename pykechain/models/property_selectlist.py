@@ -2,8 +2,6 @@ from abc import abstractmethod
 from copy import deepcopy
 from typing import Any, Iterable
 
-from jsonschema import validate
-
 from pykechain.enums import Category
 from pykechain.exceptions import APIError, IllegalArgumentError
 from pykechain.models.property import Property
@@ -127,6 +125,8 @@ class _SelectListProperty(Property):
         :param new_options: list of options to set.
         :raises APIError: when unable to update the options
         """
+        from jsonschema import validate
+
         validate(new_options, options_json_schema)
 
         url = self._client._build_url("property", property_id=self.id)
@@ -136,7 +136,9 @@ class _SelectListProperty(Property):
 
         if response.status_code != 200:  # pragma: no cover
             raise APIError(
-                f"Could not update options of Property {self}", response=response
+                f"Could not update options of Property {self}",
+                response=response,
+                json_codec=self._client.json_codec,
             )
         else:
             self._options = new_options  # save the new options as the options
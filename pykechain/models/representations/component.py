@@ -1,6 +1,5 @@
 from typing import Any, Callable, Dict, List
 
-from jsonschema import validate
 
 from pykechain.enums import PropertyType, _AllRepresentations
 from pykechain.exceptions import IllegalArgumentError
@@ -88,6 +87,8 @@ class RepresentationsComponent:
 
     def _dump_representations(self):
         """Dump the representations as json inside the _repr_options dictionary."""
+        from jsonschema import validate
+
         representations_json = []
         for r in self._representations:
             json_format = r.as_json()
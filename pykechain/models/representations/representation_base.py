@@ -2,7 +2,6 @@ import warnings
 from abc import abstractmethod
 from typing import Any, Dict
 
-from jsonschema import validate
 
 from pykechain.models.validators.validator_schemas import representation_jsonschema_stub
 
@@ -61,6 +60,8 @@ class BaseRepresentation:
 
     def validate_json(self) -> Any:
         """Validate the json representation of the validator against the validator jsonschema."""
+        from jsonschema import validate
+
         return validate(self._json, self.jsonschema)
 
     @classmethod
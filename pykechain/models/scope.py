@@ -17,7 +17,7 @@ from pykechain.enums import (
 )
 from pykechain.exceptions import APIError, IllegalArgumentError, NotFoundError
 from pykechain.models.activity import Activity
-from pykechain.models.base import Base
+from pykechain.models.base import Base, LazyDatetime
 from pykechain.models.context import Context
 from pykechain.models.input_checks import (
     check_base,
@@ -39,7 +39,7 @@ from pykechain.models.team import Team
 from pykechain.models.validators.validator_schemas import scope_project_info_jsonschema
 from pykechain.models.workflow import Workflow
 from pykechain.typing import ObjectID
-from pykechain.utils import Empty, clean_empty_values, empty, find, is_uuid, parse_datetime
+from pykechain.utils import Empty, clean_empty_values, empty, find, is_uuid
 
 
 class Scope(Base, TagsMixin):
@@ -67,6 +67,9 @@ class Scope(Base, TagsMixin):
     url_list_name = "scopes"
     url_pk_name = "scope_id"
 
+    start_date = LazyDatetime()
+    due_date = LazyDatetime()
+
     def __init__(self, json: Dict, **kwargs) -> None:
         """Construct a scope from provided json data."""
         super().__init__(json, **kwargs)
@@ -92,12 +95,9 @@ class Scope(Base, TagsMixin):
         self._tags = json.get("tags")
         self._project_info = json.get("project_info")
 
-        self.start_date = parse_datetime(json.get("start_date"))
-        self.due_date = parse_datetime(json.get("due_date"))
-
         self._representations_container = RepresentationsComponent(
             self,
-            self.options.get("representations", {}),
+            (self.options or dict()).get("representations", {}),
             self._save_representations,
         )
 
@@ -240,9 +240,13 @@ class Scope(Base, TagsMixin):
         )
 
         if response.status_code != requests.codes.ok:  # pragma: no cover
-            raise APIError(f"Could not {action} {role} in Scope", response=response)
+            raise APIError(
+                f"Could not {action} {role} in Scope",
+                response=response,
+                json_codec=self._client.json_codec,
+            )
 
-        self.refresh(json=response.json().get("results")[0])
+        self.refresh(json=self._client.json_codec.decode(response).get("results")[0])
 
     def get_project_info(self):
         """
@@ -297,8 +301,9 @@ class Scope(Base, TagsMixin):
             raise APIError(
                 "Could not update the prefill_parts dictionary on the form collection",
                 response=response,
+                json_codec=self._client.json_codec,
             )
-        self.refresh(json=response.json()["results"][0])
+        self.refresh(json=self._client.json_codec.decode(response)["results"][0])
 
     def edit(
         self,
@@ -405,9 +410,13 @@ class Scope(Base, TagsMixin):
         )
 
         if response.status_code != requests.codes.ok:  # pragma: no cover
-            raise APIError(f"Could not update Scope {self}", response=response)
+            raise APIError(
+                f"Could not update Scope {self}",
+                response=response,
+                json_codec=self._client.json_codec,
+            )
 
-        self.refresh(json=response.json().get("results")[0])
+        self.refresh(json=self._client.json_codec.decode(response).get("results")[0])
 
         # TODO tags that are set are not in response
         if tags is not None and not isinstance(tags, Empty):
@@ -477,6 +486,26 @@ class Scope(Base, TagsMixin):
         """
         return self._client.model(*args, scope_id=self.id, **kwargs)
 
+    def snapshot(self, *args, **kwargs) -> "ScopeSnapshot":
+        """Retrieve an in-memory snapshot of the parts, properties and activities of this scope.
+
+        The snapshot answers lookups by id, name, ref, model and path locally, instead of with a request.
+
+        .. versionadded:: 4.13
+
+        See :class:`pykechain.models.scope_snapshot.ScopeSnapshot` for available parameters.
+
+        Example
+        -------
+        >>> snapshot = project.snapshot(concurrency=4)
+        >>> wheel = snapshot.part(path="Product/Bike/Wheel")
+        >>> diameter = snapshot.property("Diameter", part=wheel)
+
+        """
+        from pykechain.models.scope_snapshot import ScopeSnapshot
+
+        return ScopeSnapshot(self, *args, **kwargs)
+
     def create_model(self, parent, name, multiplicity=Multiplicity.ZERO_MANY) -> "Part":
         """Create a single part model in this scope.
 
@@ -0,0 +1,648 @@
+from datetime import datetime
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+)
+
+from pykechain.defaults import PARTS_BATCH_LIMIT
+from pykechain.enums import Category
+from pykechain.exceptions import IllegalArgumentError, MultipleFoundError, NotFoundError
+from pykechain.models.activity import Activity
+from pykechain.models.base import Base
+from pykechain.models.input_checks import check_enum, check_uuid
+from pykechain.models.part import Part
+from pykechain.models.property import Property
+from pykechain.utils import is_uuid, parse_datetime
+
+if TYPE_CHECKING:
+    from pykechain.models import AnyProperty, Scope
+
+PATH_SEPARATOR = "/"
+
+
+def _append(index: Dict[Any, List], key: Any, obj: Base) -> None:
+    """Add the object to the list of objects of the key in the index."""
+    objects = index.get(key)
+    if objects is None:
+        index[key] = [obj]
+    else:
+        objects.append(obj)
+
+
+def _single(matches: List[Base], kind: str, criteria: Dict) -> Base:
+    """Return the single match, raising the appropriate errors."""
+    if not matches:
+        raise NotFoundError(f"No {kind} fit criteria: {criteria}")
+    if len(matches) != 1:
+        raise MultipleFoundError(f"Multiple {kind} fit criteria: {criteria}")
+    return matches[0]
+
+
+def _watermark(
+    objects: Iterable[Base], watermark: Optional[datetime] = None
+) -> Optional[datetime]:
+    """Return the latest `updated_at` of the objects, or the current watermark if it is later."""
+    for obj in objects:
+        updated_at = parse_datetime(obj._json_data.get("updated_at"))
+        if updated_at is not None and (watermark is None or updated_at > watermark):
+            watermark = updated_at
+    return watermark
+
+
+def _fields(json: Dict) -> Dict:
+    """Return the fields of the json of an object, without its embedded properties."""
+    return {k: v for k, v in json.items() if k != "properties"}
+
+
+def _changed(before: Dict, after: Dict) -> bool:
+    """Return whether the fields of an object changed, ignoring a copy of the same version of the object."""
+    updated_at = before.get("updated_at")
+    if updated_at is not None and updated_at == after.get("updated_at"):
+        return False
+    return _fields(before) != _fields(after)
+
+
+def _pk(obj: Union[Base, str], kind: str) -> str:
+    """Return the id of the object or the id itself."""
+    if isinstance(obj, Base):
+        return obj.id
+    return check_uuid(obj, key=kind)
+
+
+class ScopeSnapshot:
+    """
+    In-memory snapshot of the part models, part instances, properties and activities of a scope.
+
+    The snapshot is retrieved in a few paginated requests and indexes the objects by id, name, ref, model and
+    path, so the lookups are answered locally in constant time instead of with a request or a linear scan. The
+    `children()` and `parent()` of the parts and activities in the snapshot are populated as well.
+
+    Lookups by name and ref are exact, except for the properties of a part, which are looked up the same way
+    as :func:`Part.property`: by id, by name (case insensitive) or by ref.
+
+    The snapshot is not updated when the scope changes in KE-chain. Use :func:`ScopeSnapshot.sync` to retrieve
+    only the changes since the last retrieval, or :func:`ScopeSnapshot.refresh` to retrieve it again completely.
+    Create a snapshot with :func:`Scope.snapshot`.
+
+    .. versionadded:: 4.13
+
+    :ivar scope: the scope of the snapshot
+    :type scope: Scope
+    :ivar watermark: the latest `updated_at` of the objects in the snapshot, from where the next sync continues
+    :type watermark: datetime or None
+    """
+
+    def __init__(
+        self,
+        scope: "Scope",
+        batch: int = PARTS_BATCH_LIMIT,
+        concurrency: Optional[int] = None,
+        activities: bool = True,
+    ) -> None:
+        """
+        Retrieve the snapshot of the scope.
+
+        :param scope: the scope to retrieve the snapshot of
+        :type scope: Scope
+        :param batch: (optional) number of objects per batch, defaults to 100
+        :type batch: int
+        :param concurrency: (optional) number of batches to retrieve in parallel after the first batch,
+            defaults to retrieving the batches one after the other.
+        :type concurrency: int or None
+        :param activities: (optional) include the activities of the scope, defaults to True
+        :type activities: bool
+        :raises NotFoundError: if the objects of the scope could not be retrieved
+        """
+        self.scope = scope
+        self._client = scope._client
+        self.batch = batch
+        self.concurrency = concurrency
+        self.include_activities = activities
+        self.watermark: Optional[datetime] = None
+
+        self._objects: Dict[str, Base] = dict()
+        self._parts_by_name: Dict[Tuple[str, str], List[Part]] = dict()
+        self._parts_by_ref: Dict[Tuple[str, str], List[Part]] = dict()
+        self._parts_by_path: Dict[Tuple[str, Tuple[str, ...]], List[Part]] = dict()
+        self._instances_by_model_id: Dict[str, List[Part]] = dict()
+        self._activities_by_name: Dict[str, List[Activity]] = dict()
+        self._activities_by_ref: Dict[str, List[Activity]] = dict()
+        self._children_by_parent_id: Dict[Optional[str], List[Base]] = dict()
+        self._property_names_by_part_id: Dict[str, Dict[str, List]] = dict()
+        self._property_refs_by_part_id: Dict[str, Dict[str, List]] = dict()
+        self.refresh()
+
+    def __repr__(self):  # pragma: no cover
+        return f"<pyke ScopeSnapshot '{self.scope.name}' size={len(self)}>"
+
+    def __len__(self) -> int:
+        return len(self._objects)
+
+    def __contains__(self, obj: Union[Base, str]) -> bool:
+        return (obj.id if isinstance(obj, Base) else obj) in self._objects
+
+    def refresh(self) -> None:
+        """
+        Retrieve the part models, part instances, properties and activities of the scope again.
+
+        :raises NotFoundError: if the objects of the scope could not be retrieved
+        """
+        parts = self._retrieve("parts")
+        activities = self._retrieve("activities") if self.include_activities else []
+
+        self._index(parts=parts, activities=activities)
+        self.watermark = _watermark(self._objects.values())
+
+    def sync(self, deletions: bool = True) -> "SyncResult":
+        """
+        Retrieve the changes of the scope since the last retrieval and apply them to the snapshot.
+
+        Only the parts, properties and activities that are updated since the :attr:`watermark` are retrieved, using
+        the `updated_at__gte` filter of KE-chain. The objects in the snapshot are updated in place, so references
+        to them remain valid. Objects that are retrieved again with the same `updated_at` are not updated. Deleted
+        objects are detected by comparing the ids in the snapshot with the ids in KE-chain, which are retrieved with
+        requests for the `id` field only.
+
+        :param deletions: (optional) detect the deleted objects, defaults to True
+        :type deletions: bool
+        :return: the created, updated and deleted objects
+        :rtype: SyncResult
+        :raises NotFoundError: if the objects of the scope could not be retrieved
+
+        Example
+        -------
+        >>> snapshot = project.snapshot()
+        >>> ...
+        >>> changes = snapshot.sync()
+        >>> changes.updated
+        [<pyke Property 'Diameter' id 1b2c3d4e>]
+
+        """
+        if self.watermark is None:
+            self.refresh()
+            return SyncResult(created=list(self._objects.values()))
+
+        # the json of the objects is kept to report the changes afterwards, as the parts patch their properties
+        # and the identity map of the client may have updated the objects already
+        objects_before = dict(self._objects)
+        json_before = {pk: obj._json_data for pk, obj in objects_before.items()}
+
+        since = dict(updated_at__gte=self.watermark.isoformat())
+        changed_parts = self._retrieve("parts", **since)
+        changed_properties = self._retrieve("properties", **since)
+        changed_activities = list()
+        if self.include_activities:
+            changed_activities = self._retrieve("activities", **since)
+
+        existing_ids = None
+        if deletions:
+            existing_ids = self._scan_ids("parts") | self._scan_ids("properties")
+            if self.include_activities:
+                existing_ids |= self._scan_ids("activities")
+
+        parts = {pk: obj for pk, obj in self._objects.items() if isinstance(obj, Part)}
+        activities = {
+            pk: obj for pk, obj in self._objects.items() if isinstance(obj, Activity)
+        }
+        self._apply(parts, changed_parts)
+        self._apply(activities, changed_activities)
+
+        properties = {p.id: p for part in parts.values() for p in part.properties}
+        parts_with_new_properties = set()
+        for prop in changed_properties:
+            existing = properties.get(prop.id)
+            if existing is not None:
+                if existing is not prop and _changed(
+                    existing._json_data, prop._json_data
+                ):
+                    existing.refresh(json=prop._json_data)
+            elif prop.part_id in parts:
+                parts[prop.part_id].properties.append(prop)
+                parts_with_new_properties.add(prop.part_id)
+        for part_id in parts_with_new_properties:
+            parts[part_id].properties.sort(key=lambda p: p.order or 0)
+
+        if existing_ids is not None:
+            for objects in (parts, activities):
+                for pk in [pk for pk in objects if pk not in existing_ids]:
+                    del objects[pk]
+            for part in parts.values():
+                if any(p.id not in existing_ids for p in part.properties):
+                    part.properties = [
+                        p for p in part.properties if p.id in existing_ids
+                    ]
+
+        self._index(parts=parts.values(), activities=activities.values())
+        self.watermark = _watermark(
+            [*changed_parts, *changed_properties, *changed_activities], self.watermark
+        )
+
+        result = SyncResult()
+        for pk, obj in self._objects.items():
+            before = json_before.get(pk)
+            if before is None:
+                result.created.append(obj)
+            elif before is not obj._json_data and _changed(before, obj._json_data):
+                result.updated.append(obj)
+        result.deleted.extend(
+            obj for pk, obj in objects_before.items() if pk not in self._objects
+        )
+        return result
+
+    @staticmethod
+    def _apply(objects: Dict[str, Base], changed: Iterable[Base]) -> None:
+        """Update the objects in place with the changed objects, or add these."""
+        for obj in changed:
+            existing = objects.get(obj.id)
+            if existing is None:
+                objects[obj.id] = obj
+            elif existing is not obj and _changed(existing._json_data, obj._json_data):
+                existing.refresh(json=obj._json_data)
+
+    def _filters(self, resource: str) -> List[Dict]:
+        """Return the filters of the requests for the parts, properties or activities of the snapshot."""
+        if resource == "activities":
+            return [dict(scope=self.scope.id)]
+        return [
+            dict(scope_id=self.scope.id, category=category)
+            for category in (Category.MODEL, Category.INSTANCE)
+        ]
+
+    def _retrieve(self, resource: str, **kwargs) -> List[Base]:
+        """Retrieve the parts, properties or activities of the snapshot."""
+        method = getattr(self._client, resource)
+        objects = list()
+        for filters in self._filters(resource):
+            objects.extend(
+                method(
+                    batch=self.batch, concurrency=self.concurrency, **filters, **kwargs
+                )
+            )
+        return objects
+
+    def _scan_ids(self, resource: str) -> set:
+        """Retrieve the ids of all objects of the snapshot, requesting only their `id` field."""
+        request_params = getattr(self._client, f"_{resource}_request_params")
+        ids = set()
+        for filters in self._filters(resource):
+            results = self._client._paginate(
+                self._client._build_url(resource),
+                request_params(**filters, fields="id"),
+                batch=self.batch,
+                concurrency=self.concurrency,
+                description=resource.capitalize(),
+            )
+            ids.update(r["id"] for r in results)
+        return ids
+
+    def _index(self, parts: Iterable[Part], activities: Iterable[Activity]) -> None:
+        """Replace the indexes with the parts, their properties and the activities."""
+        objects = dict()
+        parts_by_name = dict()
+        parts_by_ref = dict()
+        instances_by_model_id = dict()
+        children_by_parent_id = dict()
+        property_names_by_part_id = dict()
+        property_refs_by_part_id = dict()
+
+        for part in parts:
+            objects[part.id] = part
+            _append(parts_by_name, (part.category, part.name), part)
+            _append(parts_by_ref, (part.category, part.ref), part)
+            _append(children_by_parent_id, part.parent_id, part)
+            if part.category == Category.INSTANCE and part.model_id:
+                _append(instances_by_model_id, part.model_id, part)
+
+            property_names, property_refs = dict(), dict()
+            for prop in part.properties:
+                objects[prop.id] = prop
+                _append(property_names, (prop.name or "").lower(), prop)
+                _append(property_refs, prop.ref, prop)
+            property_names_by_part_id[part.id] = property_names
+            property_refs_by_part_id[part.id] = property_refs
+
+        activities_by_name = dict()
+        activities_by_ref = dict()
+        for activity in activities:
+            objects[activity.id] = activity
+            _append(activities_by_name, activity.name, activity)
+            _append(activities_by_ref, activity.ref, activity)
+            _append(children_by_parent_id, activity.parent_id, activity)
+
+        # Populate the parent and children of the parts and activities, and the path of the parts
+        parts_by_path = dict()
+        roots = children_by_parent_id.get(None, [])
+        stack = [(root, ()) for root in reversed(roots)]
+        for pk, obj in objects.items():
+            if isinstance(obj, (Part, Activity)):
+                obj._cached_children = children_by_parent_id.get(pk, [])
+                obj._parent = objects.get(obj.parent_id)
+        while stack:
+            obj, parent_path = stack.pop()
+            if isinstance(obj, Part):
+                path = parent_path + (obj.name,)
+                _append(parts_by_path, (obj.category, path), obj)
+                stack.extend((child, path) for child in reversed(obj._cached_children))
+
+        self._objects = objects
+        self._parts_by_name = parts_by_name
+        self._parts_by_ref = parts_by_ref
+        self._parts_by_path = parts_by_path
+        self._instances_by_model_id = instances_by_model_id
+        self._activities_by_name = activities_by_name
+        self._activities_by_ref = activities_by_ref
+        self._children_by_parent_id = children_by_parent_id
+        self._property_names_by_part_id = property_names_by_part_id
+        self._property_refs_by_part_id = property_refs_by_part_id
+
+    def get(self, pk: str) -> Base:
+        """
+        Retrieve a part, property or activity of the snapshot by its id.
+
+        :param pk: id of the object
+        :type pk: str
+        :return: the part, property or activity
+        :raises NotFoundError: if the object is not part of the snapshot
+        """
+        try:
+            return self._objects[pk]
+        except KeyError:
+            raise NotFoundError(f"Could not find object with id '{pk}' in the snapshot")
+
+    def parts(
+        self,
+        name: Optional[str] = None,
+        ref: Optional[str] = None,
+        path: Optional[Union[str, Sequence[str]]] = None,
+        model: Optional[Union[Part, str]] = None,
+        parent: Optional[Union[Part, str]] = None,
+        category: Optional[Union[Category, str]] = Category.INSTANCE,
+    ) -> List[Part]:
+        """
+        Retrieve the parts of the snapshot.
+
+        The first of `name`, `ref`, `path`, `model` and `parent` that is provided selects the index to look up the
+        parts with, the others filter the results.
+
+        :param name: (optional) exact name of the parts
+        :type name: str or None
+        :param ref: (optional) ref of the parts
+        :type ref: str or None
+        :param path: (optional) names of the part and its ancestors starting with the root, either as a
+            sequence or as a string separated by `/`, eg. `Product/Bike/Wheel`
+        :type path: str or sequence of str or None
+        :param model: (optional) model of the part instances
+        :type model: Part or str or None
+        :param parent: (optional) parent of the parts
+        :type parent: Part or str or None
+        :param category: (optional) category of the parts, defaults to INSTANCE. Use None for models and instances.
+        :type category: Category or str or None
+        :return: list of parts
+        :raises IllegalArgumentError: if the arguments are of the wrong type
+        """
+        category = check_enum(category, Category, "category")
+        categories = (category,) if category else Category.values()
+
+        if name is not None:
+            parts = self._lookup(self._parts_by_name, categories, name)
+        elif ref is not None:
+            parts = self._lookup(self._parts_by_ref, categories, ref)
+        elif path is not None:
+            parts = self._lookup(self._parts_by_path, categories, self._path(path))
+        elif model is not None:
+            parts = self._instances_by_model_id.get(_pk(model, "model"), [])
+        elif parent is not None:
+            parts = self._children_by_parent_id.get(_pk(parent, "parent"), [])
+        else:
+            parts = [obj for obj in self._objects.values() if isinstance(obj, Part)]
+
+        filters = [
+            ("name", name),
+            ("ref", ref),
+            ("model_id", model if model is None else _pk(model, "model")),
+            ("parent_id", parent if parent is None else _pk(parent, "parent")),
+        ]
+        filters = [(attr, value) for attr, value in filters if value is not None]
+        return [
+            p
+            for p in parts
+            if p.category in categories
+            and all(getattr(p, attr) == value for attr, value in filters)
+        ]
+
+    def part(self, *args, **kwargs) -> Part:
+        """
+        Retrieve a single part of the snapshot, by its id or see :func:`ScopeSnapshot.parts` for the arguments.
+
+        :param pk: (optional) id of the part
+        :type pk: str or None
+        :return: a single part
+        :raises NotFoundError: if no part fits the criteria
+        :raises MultipleFoundError: if multiple parts fit the criteria
+        """
+        pk = kwargs.pop("pk", None)
+        if pk is not None:
+            matches = [obj for obj in [self._objects.get(pk)] if isinstance(obj, Part)]
+        else:
+            matches = self.parts(*args, **kwargs)
+        return _single(matches, "parts", dict(kwargs, pk=pk))
+
+    def model(self, *args, **kwargs) -> Part:
+        """
+        Retrieve a single part model of the snapshot, see :func:`ScopeSnapshot.part` for the arguments.
+
+        :return: a single part model
+        :raises NotFoundError: if no part model fits the criteria
+        :raises MultipleFoundError: if multiple part models fit the criteria
+        """
+        kwargs["category"] = Category.MODEL
+        return self.part(*args, **kwargs)
+
+    def instances(self, model: Union[Part, str]) -> List[Part]:
+        """
+        Retrieve the part instances of a part model.
+
+        :param model: the part model or its id
+        :type model: Part or str
+        :return: list of part instances
+        """
+        return self._instances_by_model_id.get(_pk(model, "model"), [])
+
+    def children(
+        self, parent: Union[Part, Activity, str]
+    ) -> List[Union[Part, Activity]]:
+        """
+        Retrieve the children of a part or activity of the snapshot.
+
+        :param parent: the part or activity or its id
+        :type parent: Part or Activity or str
+        :return: list of parts or activities
+        :raises NotFoundError: if the parent is not part of the snapshot
+        """
+        parent_id = _pk(parent, "parent")
+        if parent_id not in self._objects:
+            raise NotFoundError(
+                f"Could not find parent with id '{parent_id}' in the snapshot"
+            )
+        return self._children_by_parent_id.get(parent_id, [])
+
+    def child(
+        self,
+        parent: Union[Part, Activity, str],
+        name: Optional[str] = None,
+        pk: Optional[str] = None,
+    ) -> Union[Part, Activity]:
+        """
+        Retrieve a single child of a part or activity of the snapshot.
+
+        :param parent: the part or activity or its id
+        :type parent: Part or Activity or str
+        :param name: (optional) name of the child
+        :type name: str or None
+        :param pk: (optional) id of the child
+        :type pk: str or None
+        :return: a single part or activity
+        :raises IllegalArgumentError: if neither the name nor the id are provided
+        :raises NotFoundError: if the parent is not part of the snapshot or no child fits the criteria
+        :raises MultipleFoundError: if multiple children fit the criteria
+        """
+        if not (name or pk):
+            raise IllegalArgumentError('You need to provide either "name" or "pk".')
+        parent_id = _pk(parent, "parent")
+        if pk:
+            child = self._objects.get(pk)
+            matches = (
+                [child] if child is not None and child.parent_id == parent_id else []
+            )
+        else:
+            matches = [c for c in self.children(parent_id) if c.name == name]
+        return _single(matches, "children", dict(parent=parent_id, name=name, pk=pk))
+
+    def property(
+        self, name: str, part: Optional[Union[Part, str]] = None
+    ) -> "AnyProperty":
+        """
+        Retrieve a single property of the snapshot by its id, or by its name or ref within its part.
+
+        :param name: id of the property, or name (case insensitive) or ref of the property of the part
+        :type name: str
+        :param part: (optional) the part of the property or its id, required to look up a name or ref
+        :type part: Part or str or None
+        :return: a single property
+        :raises IllegalArgumentError: if a name or ref is provided without a part
+        :raises NotFoundError: if no property fits the criteria
+        :raises MultipleFoundError: if multiple properties fit the criteria
+        """
+        if is_uuid(name):
+            matches = [p for p in [self._objects.get(name)] if isinstance(p, Property)]
+            if part is not None:
+                matches = [p for p in matches if p.part_id == _pk(part, "part")]
+        elif part is None:
+            raise IllegalArgumentError(
+                "Provide the `part` to look up a property by its name or ref."
+            )
+        else:
+            part_id = _pk(part, "part")
+            matches = self._property_names_by_part_id.get(part_id, {}).get(name.lower())
+            if not matches:
+                matches = self._property_refs_by_part_id.get(part_id, {}).get(name, [])
+        return _single(matches, "properties", dict(name=name, part=part))
+
+    def activities(
+        self, name: Optional[str] = None, ref: Optional[str] = None
+    ) -> List[Activity]:
+        """
+        Retrieve the activities of the snapshot.
+
+        :param name: (optional) exact name of the activities
+        :type name: str or None
+        :param ref: (optional) ref of the activities
+        :type ref: str or None
+        :return: list of activities
+        """
+        if name is not None:
+            activities = self._activities_by_name.get(name, [])
+            return [a for a in activities if ref is None or a.ref == ref]
+        elif ref is not None:
+            return self._activities_by_ref.get(ref, [])
+        return [obj for obj in self._objects.values() if isinstance(obj, Activity)]
+
+    def activity(
+        self,
+        name: Optional[str] = None,
+        ref: Optional[str] = None,
+        pk: Optional[str] = None,
+    ) -> Activity:
+        """
+        Retrieve a single activity of the snapshot.
+
+        :param name: (optional) exact name of the activity
+        :type name: str or None
+        :param ref: (optional) ref of the activity
+        :type ref: str or None
+        :param pk: (optional) id of the activity
+        :type pk: str or None
+        :return: a single activity
+        :raises NotFoundError: if no activity fits the criteria
+        :raises MultipleFoundError: if multiple activities fit the criteria
+        """
+        if pk is not None:
+            matches = [a for a in [self._objects.get(pk)] if isinstance(a, Activity)]
+        else:
+            matches = self.activities(name=name, ref=ref)
+        return _single(matches, "activities", dict(name=name, ref=ref, pk=pk))
+
+    @staticmethod
+    def _lookup(index: Dict, categories: Iterable[str], key: Any) -> List[Part]:
+        matches = list()
+        for category in categories:
+            matches.extend(index.get((category, key), []))
+        return matches
+
+    @staticmethod
+    def _path(path: Union[str, Sequence[str]]) -> Tuple[str, ...]:
+        if isinstance(path, str):
+            return tuple(path.strip(PATH_SEPARATOR).split(PATH_SEPARATOR))
+        return tuple(path)
+
+
+class SyncResult:
+    """
+    Result of :func:`ScopeSnapshot.sync`, listing the parts, properties and activities that changed.
+
+    .. versionadded:: 4.13
+
+    :ivar created: the objects that are added to the snapshot
+    :type created: list
+    :ivar updated: the objects of the snapshot that are updated in place
+    :type updated: list
+    :ivar deleted: the objects that are removed from the snapshot
+    :type deleted: list
+    """
+
+    def __init__(
+        self,
+        created: Optional[List[Base]] = None,
+        updated: Optional[List[Base]] = None,
+        deleted: Optional[List[Base]] = None,
+    ) -> None:
+        """Create a result of a sync."""
+        self.created = created if created is not None else list()
+        self.updated = updated if updated is not None else list()
+        self.deleted = deleted if deleted is not None else list()
+
+    def __bool__(self) -> bool:
+        return bool(self.created or self.updated or self.deleted)
+
+    def __repr__(self):  # pragma: no cover
+        return (
+            f"<pyke SyncResult created={len(self.created)} updated={len(self.updated)} "
+            f"deleted={len(self.deleted)}>"
+        )
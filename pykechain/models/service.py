@@ -95,11 +95,16 @@ class Service(BaseInScope):
             raise APIError(
                 f"Conflict: Could not execute Service {self} as it is already running.",
                 response=response,
+                json_codec=self._client.json_codec,
             )
         elif response.status_code != requests.codes.accepted:  # pragma: no cover
-            raise APIError(f"Could not execute Service {self}", response=response)
+            raise APIError(
+                f"Could not execute Service {self}",
+                response=response,
+                json_codec=self._client.json_codec,
+            )
 
-        data = response.json()
+        data = self._client.json_codec.decode(response)
         return ServiceExecution(json=data.get("results")[0], client=self._client)
 
     def edit(
@@ -174,9 +179,13 @@ class Service(BaseInScope):
         )
 
         if response.status_code != requests.codes.ok:  # pragma: no cover
-            raise APIError(f"Could not update Service {self}", response=response)
+            raise APIError(
+                f"Could not update Service {self}",
+                response=response,
+                json_codec=self._client.json_codec,
+            )
 
-        self.refresh(json=response.json()["results"][0])
+        self.refresh(json=self._client.json_codec.decode(response)["results"][0])
 
     def delete(self) -> None:
         """Delete this service.
@@ -188,7 +197,11 @@ class Service(BaseInScope):
         )
 
         if response.status_code != requests.codes.no_content:  # pragma: no cover
-            raise APIError(f"Could not delete Service {self}", response=response)
+            raise APIError(
+                f"Could not delete Service {self}",
+                response=response,
+                json_codec=self._client.json_codec,
+            )
 
     def upload(self, pkg_path):
         """
@@ -218,9 +231,10 @@ class Service(BaseInScope):
             raise APIError(
                 f"Could not upload script file (or kecpkg) to Service {self}",
                 response=response,
+                json_codec=self._client.json_codec,
             )
 
-        self.refresh(json=response.json()["results"][0])
+        self.refresh(json=self._client.json_codec.decode(response)["results"][0])
 
     def save_as(self, target_dir=None):
         """
@@ -241,7 +255,9 @@ class Service(BaseInScope):
         response = self._client._request("GET", url)
         if response.status_code != requests.codes.ok:  # pragma: no cover
             raise APIError(
-                f"Could not download script file from Service {self}", response=response
+                f"Could not download script file from Service {self}",
+                response=response,
+                json_codec=self._client.json_codec,
             )
 
         with open(full_path, "w+b") as f:
@@ -331,7 +347,11 @@ class ServiceExecution(Base):
         response = self._client._request("GET", url, params=dict(format="json"))
 
         if response.status_code != requests.codes.accepted:  # pragma: no cover
-            raise APIError(f"Could not terminate Service {self}", response=response)
+            raise APIError(
+                f"Could not terminate Service {self}",
+                response=response,
+                json_codec=self._client.json_codec,
+            )
 
     def get_log(self, target_dir=None, log_filename="log.txt"):
         """
@@ -354,7 +374,9 @@ class ServiceExecution(Base):
         response = self._client._request("GET", url)
         if response.status_code != requests.codes.ok:  # pragma: no cover
             raise APIError(
-                f"Could not download execution log of Service {self}", response=response
+                f"Could not download execution log of Service {self}",
+                response=response,
+                json_codec=self._client.json_codec,
             )
 
         with open(full_path, "w+b") as f:
@@ -377,9 +399,11 @@ class ServiceExecution(Base):
 
         if response.status_code != requests.codes.ok:
             raise APIError(
-                f"Could not retrieve notebook url of Service {self}", response=response
+                f"Could not retrieve notebook url of Service {self}",
+                response=response,
+                json_codec=self._client.json_codec,
             )
 
-        data = response.json()
+        data = self._client.json_codec.decode(response)
         url = data.get("results")[0].get("url")
         return url
@@ -94,8 +94,12 @@ class StoredFile(
             json=clean_empty_values(data, nones=True),
         )
         if response.status_code != requests.codes.ok:  # pragma: no cover
-            raise APIError("Could not edit the stored file", response=response)
-        self.refresh(json=response.json()["results"][0])
+            raise APIError(
+                "Could not edit the stored file",
+                response=response,
+                json_codec=self._client.json_codec,
+            )
+        self.refresh(json=self._client.json_codec.decode(response)["results"][0])
 
     @classmethod
     def list(cls, client: "Client", **kwargs) -> List["StoredFile"]:
@@ -156,9 +160,13 @@ class StoredFile(
         )
 
         if response.status_code != requests.codes.created:  # pragma: no cover
-            raise APIError(f"Could not create {cls.__name__}", response=response)
+            raise APIError(
+                f"Could not create {cls.__name__}",
+                response=response,
+                json_codec=client.json_codec,
+            )
 
-        return cls(json=response.json()["results"][0], client=client)
+        return cls(json=client.json_codec.decode(response)["results"][0], client=client)
 
     def delete(self):
         """Delete StoredFile."""
@@ -229,8 +237,12 @@ class StoredFile(
             files=files,
         )
         if response.status_code != requests.codes.ok:  # pragma: no cover
-            raise APIError("Could not upload file", response=response)
-        self.refresh(json=response.json()["results"][0])
+            raise APIError(
+                "Could not upload file",
+                response=response,
+                json_codec=self._client.json_codec,
+            )
+        self.refresh(json=self._client.json_codec.decode(response)["results"][0])
 
     def save_as(
         self,
@@ -263,6 +275,10 @@ class StoredFile(
         response = requests.get(url)
 
         if response.status_code != requests.codes.ok:  # pragma: no cover
-            raise APIError("Could not download property value.", response=response)
+            raise APIError(
+                "Could not download property value.",
+                response=response,
+                json_codec=self._client.json_codec,
+            )
 
         return response
@@ -33,9 +33,13 @@ class Team(Base):
         response = self._client._request("PUT", url, json=update_dict, params=params)
 
         if response.status_code != requests.codes.ok:  # pragma: no cover
-            raise APIError(f"Could not update Team {self}", response=response)
+            raise APIError(
+                f"Could not update Team {self}",
+                response=response,
+                json_codec=self._client.json_codec,
+            )
 
-        self.refresh(json=response.json().get("results")[0])
+        self.refresh(json=self._client.json_codec.decode(response).get("results")[0])
 
     def edit(
         self,
@@ -86,7 +90,11 @@ class Team(Base):
         response = self._client._request("DELETE", url=url)
 
         if response.status_code != requests.codes.no_content:  # pragma: no cover
-            raise APIError(f"Could not delete Team {self}", response=response)
+            raise APIError(
+                f"Could not delete Team {self}",
+                response=response,
+                json_codec=self._client.json_codec,
+            )
 
     def members(self, role: Optional[Union[TeamRoles, str]] = None) -> List[Dict]:
         """Members of the team.
@@ -5,13 +5,18 @@ import requests
 
 from pykechain.exceptions import NotFoundError
 from pykechain.models import BaseInScope
+from pykechain.models.base import AbstractModelMeta, JsonAttribute
 
 T = TypeVar("T")
 
 
-class TreeObject(BaseInScope, ABC):
+class TreeObject(BaseInScope, ABC, metaclass=AbstractModelMeta):
     """Object class to include methods used to traverse a tree-structure."""
 
+    parent_id: Optional[str] = JsonAttribute()
+
+    _KEPT_ON_UPDATE = BaseInScope._KEPT_ON_UPDATE + ("_cached_children", "_parent")
+
     def __init__(self, json, **kwargs):
         """
         Initialize the object with attributes related to a tree-structure.
@@ -20,10 +25,15 @@ class TreeObject(BaseInScope, ABC):
         """
         super().__init__(json=json, **kwargs)
 
-        self.parent_id: Optional[str] = json.get("parent_id", None)
         self._parent: Optional[T] = None
         self._cached_children: Optional[List[T]] = None
 
+    def _update_from(self, other: "TreeObject") -> None:
+        parent_id = self.parent_id
+        super()._update_from(other)
+        if self.parent_id != parent_id:
+            self._parent = None  # moved to another parent
+
     def __call__(self: T, *args, **kwargs) -> T:
         """Short-hand version of the `child` method."""
         return self.child(*args, **kwargs)
@@ -108,7 +118,7 @@ class TreeObject(BaseInScope, ABC):
         if response.status_code != requests.codes.ok:  # pragma: no cover
             raise NotFoundError(f"Could not retrieve {method}")
 
-        count = response.json()["count"]
+        count = self._client.json_codec.decode(response)["count"]
 
         return count
 
@@ -120,31 +130,41 @@ class TreeObject(BaseInScope, ABC):
         """
         Fill the `_cached_children` attribute with a list of descendants.
 
+        Whenever this object itself is part of the descendants, eg. when these are retrieved with the `descendants`
+        filter of KE-chain or for a whole scope, it takes the place of its copy in the tree.
+
+        .. versionchanged:: 4.13
+            links the descendants without copying the list and replaces the copy of this object itself.
+
         :param all_descendants: list of TreeObject objects of possible descendants of this TreeObject.
         :type all_descendants: list
         :param overwrite: whether to remove existing cached children, defaults to False
         :type overwrite: bool
         :return: None
         """
-        # Create mapping table from a parent ID to its children
+        # Create mapping tables from an ID to its object and from a parent ID to its children
+        self_id = self.id
+        object_by_id = dict()
         children_by_parent_id = dict()
         for descendant in all_descendants:
-            if descendant.parent_id in children_by_parent_id:
-                children_by_parent_id[descendant.parent_id].append(descendant)
+            pk = descendant.id
+            if pk == self_id:
+                descendant = self
             else:
-                children_by_parent_id[descendant.parent_id] = [descendant]
-
-        # Populate every descendant with its children
-        for descendant in all_descendants:
-            if descendant.id in children_by_parent_id:
-                descendant._cached_children = children_by_parent_id[descendant.id]
+                object_by_id[pk] = descendant
+            parent_id = descendant.parent_id
+            children = children_by_parent_id.get(parent_id)
+            if children is None:
+                children_by_parent_id[parent_id] = [descendant]
             else:
-                descendant._cached_children = []
-
-        # Populate every descendant with its parent
-        object_by_id = {c.id: c for c in all_descendants + [self]}
-        for descendant in all_descendants:
-            descendant._parent = object_by_id.get(descendant.parent_id)
+                children.append(descendant)
+
+        # Populate every descendant with its children and its parent
+        parents_by_id = dict(object_by_id)
+        parents_by_id[self_id] = self
+        for pk, descendant in object_by_id.items():
+            descendant._cached_children = children_by_parent_id.get(pk, [])
+            descendant._parent = parents_by_id.get(descendant.parent_id)
 
         this_children = children_by_parent_id.get(self.id, list())
         if self._cached_children and not overwrite:
@@ -94,6 +94,7 @@ class User(Base):
             raise APIError(
                 f"Could not request a reset password link for '{self}'",
                 response=response,
+                json_codec=self._client.json_codec,
             )
 
     def now_in_my_timezone(self) -> datetime.datetime:
@@ -7,7 +7,6 @@ from typing import (  # noqa: F401 # pylint: disable=unused-import
     Union,
 )
 
-from jsonschema import validate
 
 from pykechain.enums import PropertyVTypes, ValidatorEffectTypes
 from pykechain.models.validators.validator_schemas import (
@@ -43,6 +42,8 @@ class BaseValidator:
 
     def validate_json(self) -> Any:
         """Validate the json representation of the validator against the validator jsonschema."""
+        from jsonschema import validate
+
         return validate(self._json, self.jsonschema)
 
     @classmethod
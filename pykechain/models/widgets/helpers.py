@@ -15,7 +15,6 @@ from pykechain.enums import (
 )
 from pykechain.exceptions import IllegalArgumentError
 from pykechain.models.input_checks import check_base, check_enum
-from pykechain.models.value_filter import PropertyValueFilter
 from pykechain.models.widgets.enums import AssociatedObjectId, MetaWidget
 from pykechain.utils import camelcase, is_uuid, snakecase
 
@@ -401,7 +400,7 @@ def _initiate_meta(kwargs, activity, ignores=()):
 
 def _check_prefilters(
     part_model: "Part", prefilters: Union[Dict, List]
-) -> List[PropertyValueFilter]:  # noqa: F821
+) -> List["PropertyValueFilter"]:  # noqa: F821
     """
     Check the format of the pre-filters.
 
@@ -411,6 +410,8 @@ def _check_prefilters(
     :rtype list
     :raises IllegalArgumentError: when the type of the input is provided incorrect.
     """
+    from pykechain.models.value_filter import PropertyValueFilter
+
     if isinstance(prefilters, dict):
         property_models: List[Property, str] = prefilters.get(
             MetaWidget.PROPERTY_MODELS, []
@@ -4,7 +4,6 @@ from typing import Any, Callable, Dict, List, Optional, Tuple, Union
 
 import pytz
 import requests
-from jsonschema import validate
 
 from pykechain.defaults import API_EXTRA_PARAMS
 from pykechain.enums import Category, WidgetTitleValue, WidgetTypes
@@ -46,11 +45,17 @@ class Widget(BaseInScope):
         self.manager = manager
 
         self.widget_type = json.get("widget_type")
-        # set schema
-        if self._client:
+        # set schema, unless the widget type is not retrieved (eg. using `fields`)
+        self.schema = None
+        if self._client and self.widget_type:
             self.schema = self._client.widget_schema(self.widget_type)
 
-        self.meta = self.validate_meta(json.get("meta"))
+        meta = json.get("meta")
+        self.meta = (
+            self.validate_meta(meta)
+            if meta is not None and self.schema is not None
+            else meta
+        )
         self.order = json.get("order")
         self._activity_id = json.get("activity_id")
         self._parent_id = json.get("parent_id")
@@ -155,6 +160,8 @@ class Widget(BaseInScope):
         :return meta: if the meta is validated correctly
         :raise: `ValidationError`
         """
+        from jsonschema import validate
+
         return validate(meta, self.schema) is None and meta
 
     @classmethod
@@ -368,15 +375,24 @@ class Widget(BaseInScope):
         if kwargs:  # pragma: no cover
             update_dict.update(**kwargs)
 
+        unit_of_work = self._client._active_unit_of_work()
+        if unit_of_work is not None:
+            unit_of_work.update_widget(self, **update_dict)
+            return
+
         url = self._client._build_url("widget", widget_id=self.id)
         response = self._client._request(
             "PUT", url, params=API_EXTRA_PARAMS["widgets"], json=update_dict
         )
 
         if response.status_code != requests.codes.ok:  # pragma: no cover
-            raise APIError(f"Could not update Widget {self}", response=response)
+            raise APIError(
+                f"Could not update Widget {self}",
+                response=response,
+                json_codec=self._client.json_codec,
+            )
 
-        self.refresh(json=response.json().get("results")[0])
+        self.refresh(json=self._client.json_codec.decode(response).get("results")[0])
 
     def delete(self) -> bool:
         """Delete the widget.
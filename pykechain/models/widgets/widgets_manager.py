@@ -1,5 +1,5 @@
 import warnings
-from typing import Any, Dict, Iterable, List, Optional, Union
+from typing import TYPE_CHECKING, Any, Dict, Iterable, List, Optional, Union
 
 from pykechain.enums import (
     ActivityClassification,
@@ -25,7 +25,6 @@ from pykechain.models.input_checks import (
     check_text,
     check_type,
 )
-from pykechain.models.value_filter import PropertyValueFilter
 from pykechain.models.widgets import Widget
 from pykechain.models.widgets.enums import (
     AssociatedObjectId,
@@ -52,6 +51,9 @@ from pykechain.models.widgets.helpers import (
 )
 from pykechain.utils import find, is_url, is_uuid, snakecase
 
+if TYPE_CHECKING:
+    from pykechain.models.value_filter import PropertyValueFilter
+
 
 class WidgetsManager(Iterable):
     """Manager for Widgets.
@@ -416,7 +418,7 @@ class WidgetsManager(Iterable):
         all_readable: Optional[bool] = False,
         all_writable: Optional[bool] = False,
         excluded_propmodels: Optional[List[Union["AnyProperty", str]]] = None,
-        prefilters: Optional[Union[List[PropertyValueFilter], Dict]] = None,
+        prefilters: Optional[Union[List["PropertyValueFilter"], Dict]] = None,
         **kwargs,
     ) -> Widget:
         """
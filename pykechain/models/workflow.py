@@ -142,8 +142,12 @@ class Workflow(
             json=clean_empty_values(data, nones=False),
         )
         if response.status_code != requests.codes.ok:  # pragma: no cover
-            raise APIError("Could not edit the workflow", response=response)
-        self.refresh(json=response.json()["results"][0])
+            raise APIError(
+                "Could not edit the workflow",
+                response=response,
+                json_codec=self._client.json_codec,
+            )
+        self.refresh(json=self._client.json_codec.decode(response)["results"][0])
 
     @classmethod
     def list(cls, client: "Client", **kwargs) -> List["Workflow"]:
@@ -201,9 +205,13 @@ class Workflow(
         )
 
         if response.status_code != requests.codes.created:  # pragma: no cover
-            raise APIError(f"Could not create {cls.__name__}", response=response)
+            raise APIError(
+                f"Could not create {cls.__name__}",
+                response=response,
+                json_codec=client.json_codec,
+            )
 
-        return cls(json=response.json()["results"][0], client=client)
+        return cls(json=client.json_codec.decode(response)["results"][0], client=client)
 
     @property
     def status_order(self) -> List[Status]:
@@ -226,9 +234,11 @@ class Workflow(
         response = self._client._request("PUT", url=url, json=data)
         if response.status_code != requests.codes.ok:  # pragma: no cover
             raise APIError(
-                "Could not alter the order of the statuses", response=response
+                "Could not alter the order of the statuses",
+                response=response,
+                json_codec=self._client.json_codec,
             )
-        self.refresh(json=response.json()["results"][0])
+        self.refresh(json=self._client.json_codec.decode(response)["results"][0])
 
     #
     # Subclass finders and managers.
@@ -304,7 +314,11 @@ class Workflow(
             url = self._client._build_url("workflow_activate", workflow_id=self.id)
             response = self._client._request("PUT", url=url)
             if response.status_code != requests.codes.ok:  # pragma: no cover
-                raise APIError("Could not activate the workflow", response=response)
+                raise APIError(
+                    "Could not activate the workflow",
+                    response=response,
+                    json_codec=self._client.json_codec,
+                )
 
             # we need to do a full refresh here from the server as the
             # API of workflow/<id>/activate does not return the full object as response.
@@ -319,7 +333,11 @@ class Workflow(
             url = self._client._build_url("workflow_deactivate", workflow_id=self.id)
             response = self._client._request("PUT", url=url)
             if response.status_code != requests.codes.ok:  # pragma: no cover
-                raise APIError("Could not activate the workflow", response=response)
+                raise APIError(
+                    "Could not activate the workflow",
+                    response=response,
+                    json_codec=self._client.json_codec,
+                )
 
             # we need to do a full refresh here from the server as the
             # API of workflow/<id>/deactivate does not return the full object as response.
@@ -361,8 +379,15 @@ class Workflow(
             json=clean_empty_values(data, nones=False),
         )
         if response.status_code != requests.codes.created:  # pragma: no cover
-            raise APIError("Could not clone the workflow", response=response)
-        return Workflow(json=response.json()["results"][0], client=self._client)
+            raise APIError(
+                "Could not clone the workflow",
+                response=response,
+                json_codec=self._client.json_codec,
+            )
+        return Workflow(
+            json=self._client.json_codec.decode(response)["results"][0],
+            client=self._client,
+        )
 
     def update_transition(
         self,
@@ -396,10 +421,11 @@ class Workflow(
                 f"Could not update the specific transition '{transition}' in the "
                 "workflow",
                 response=response,
+                json_codec=self._client.json_codec,
             )
         # an updated transition will be altered, so we want to refresh the workflow.
         self.refresh()
-        return Transition(json=response.json()["results"][0])
+        return Transition(json=self._client.json_codec.decode(response)["results"][0])
 
     def delete_transition(self, transition: Union[Transition, ObjectID]) -> None:
         """Remove Transition from the current Workflow and delete it.
@@ -422,6 +448,7 @@ class Workflow(
                 f"Could not delete the specific transition '{transition}' from the "
                 "workflow",
                 response=response,
+                json_codec=self._client.json_codec,
             )
         # a deleted transition will be unlinked, so we want to refresh the workflow.
         self.refresh()
@@ -461,10 +488,14 @@ class Workflow(
             raise APIError(
                 "Could not create the specific transition in the " "workflow",
                 response=response,
+                json_codec=self._client.json_codec,
             )
         # a new transition will be linked to the workflow, so we want to refresh the workflow.
         self.refresh()
-        return Transition(json=response.json()["results"][0], client=self._client)
+        return Transition(
+            json=self._client.json_codec.decode(response)["results"][0],
+            client=self._client,
+        )
 
     def create_status(
         self,
@@ -498,11 +529,15 @@ class Workflow(
                 "Could not create the specific status, a global transition and"
                 "link it to the workflow",
                 response=response,
+                json_codec=self._client.json_codec,
             )
         # a new status will create a new global transition to that status,
         # so we want to update the current workflow.
         self.refresh()
-        return Status(json=response.json()["results"][0], client=self._client)
+        return Status(
+            json=self._client.json_codec.decode(response)["results"][0],
+            client=self._client,
+        )
 
     def link_transitions(self, transitions: List[Union[Transition, ObjectID]]):
         """
@@ -521,8 +556,9 @@ class Workflow(
                 "Could not create the specific status, a global transition and"
                 "link it to the workflow",
                 response=response,
+                json_codec=self._client.json_codec,
             )
-        self.refresh(json=response.json()["results"][0])
+        self.refresh(json=self._client.json_codec.decode(response)["results"][0])
 
     def unlink_transitions(
         self, transitions: List[Union[Transition, ObjectID]]
@@ -545,5 +581,6 @@ class Workflow(
                 "Could not create the specific status, a global transition and"
                 "link it to the workflow",
                 response=response,
+                json_codec=self._client.json_codec,
             )
-        self.refresh(json=response.json()["results"][0])
+        self.refresh(json=self._client.json_codec.decode(response)["results"][0])
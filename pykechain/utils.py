@@ -3,6 +3,7 @@ import re
 import unicodedata
 from contextlib import contextmanager
 from datetime import date, datetime, time, timedelta, timezone
+from functools import lru_cache
 from typing import (
     Any,
     Callable,
@@ -230,6 +231,64 @@ def temp_chdir(cwd: Optional[str] = None):
             os.chdir(origin)
 
 
+DATETIME_REGEX = re.compile(
+    r"(?P<year>\d{4})-(?P<month>\d{1,2})-(?P<day>\d{1,2})"
+    r"[T ](?P<hour>\d{1,2}):(?P<minute>\d{1,2})"
+    r"(?::(?P<second>\d{1,2})(?:\.(?P<microsecond>\d{1,6})\d{0,6})?)?"
+    r"(?P<tzinfo>Z|[+-]\d{2}(?::?\d{2})?)?$"
+)
+
+
+@lru_cache(maxsize=None)
+def _get_fixed_timezone(offset: Union[int, timedelta]) -> timezone:
+    """Return a tzinfo instance with a fixed offset from UTC."""
+    if isinstance(offset, timedelta):
+        offset = offset.total_seconds() // 60
+    sign = "-" if offset < 0 else "+"
+    hhmm = "%02d%02d" % divmod(abs(offset), 60)
+    name = sign + hhmm
+    return timezone(timedelta(minutes=offset), name)
+
+
+def _parse_isoformat(value: str) -> Optional[datetime]:
+    """
+    Convert a datetime string in the ISO 8601 format of the KE-chain API using `datetime.fromisoformat`.
+
+    Only strings like `2020-01-31T12:30:59.123456+00:00` (or `...Z`) are handled, as the formats accepted by
+    `fromisoformat` differ between Python versions. Returns None when the string is not handled, so the regular
+    expression of `parse_datetime` can be used instead.
+    """
+    if not (
+        len(value) >= 19
+        and value[4] == "-"
+        and value[7] == "-"
+        and value[10] in "T "
+        and value[13] == ":"
+        and value[16] == ":"
+        and value[19:20] in ("", ".", "Z", "+", "-")
+    ):
+        return None
+
+    # only the fractions and offsets the regular expression allows, so both give the same result
+    zulu = value[-1] == "Z"
+    sign = max(value.rfind("+"), value.rfind("-", 19))
+    end = sign if sign != -1 else len(value) - zulu
+    if end - 20 > 12 or (sign != -1 and len(value) - sign > 6):
+        return None
+
+    try:
+        result = datetime.fromisoformat(value[:-1] if zulu else value)
+    except ValueError:
+        return None
+
+    if zulu:
+        return result.replace(tzinfo=pytz.UTC) if result.tzinfo is None else None
+    offset = result.utcoffset()
+    if offset is not None:
+        result = result.replace(tzinfo=_get_fixed_timezone(offset // timedelta(minutes=1)))
+    return result
+
+
 def parse_datetime(value: Optional[str]) -> Optional[datetime]:
     """
     Convert datetime string to datetime object.
@@ -246,6 +305,10 @@ def parse_datetime(value: Optional[str]) -> Optional[datetime]:
 
     ..versionadded 2.5:
 
+    .. versionchanged:: 4.13
+        The ISO 8601 strings of the KE-chain API are parsed with `datetime.fromisoformat` and the timezones with a
+        fixed offset are cached.
+
     :param value: datetime string
     :type value: str or None
     :return: datetime of the value is well formatted. Otherwise (including if value is None) returns None
@@ -256,23 +319,11 @@ def parse_datetime(value: Optional[str]) -> Optional[datetime]:
         # do not process the value
         return None
 
-    def _get_fixed_timezone(offset):
-        """Return a tzinfo instance with a fixed offset from UTC."""
-        if isinstance(offset, timedelta):
-            offset = offset.total_seconds() // 60
-        sign = "-" if offset < 0 else "+"
-        hhmm = "%02d%02d" % divmod(abs(offset), 60)
-        name = sign + hhmm
-        return timezone(timedelta(minutes=offset), name)
-
-    datetime_re = re.compile(
-        r"(?P<year>\d{4})-(?P<month>\d{1,2})-(?P<day>\d{1,2})"
-        r"[T ](?P<hour>\d{1,2}):(?P<minute>\d{1,2})"
-        r"(?::(?P<second>\d{1,2})(?:\.(?P<microsecond>\d{1,6})\d{0,6})?)?"
-        r"(?P<tzinfo>Z|[+-]\d{2}(?::?\d{2})?)?$"
-    )
+    result = _parse_isoformat(value)
+    if result is not None:
+        return result
 
-    match = datetime_re.match(value)
+    match = DATETIME_REGEX.match(value)
     if match:
         kw = match.groupdict()
         if kw["microsecond"]:
@@ -92,6 +92,10 @@ setup(
         "semver>=2.10.0",
         "pytz",
     ],
+    extras_require={
+        # faster encoding and decoding of the json bodies of requests and responses
+        "fastjson": ["orjson"],
+    },
     setup_requires=["pytest-runner", "wheel"],
     tests_require=["pytest", "betamax"],
     python_requires=">=3.7",
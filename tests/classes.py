@@ -1,7 +1,12 @@
 import collections
 import datetime
+import json
 import os
+import threading
+import uuid
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 from unittest import TestCase
+from urllib.parse import parse_qsl, urlencode, urlparse
 
 import pytz
 from betamax import Betamax
@@ -127,3 +132,162 @@ class EnvironmentVarGuard(collections.abc.MutableMapping):
             else:
                 self._environ[k] = v
         os.environ = self._environ
+
+
+#
+# Local stand-in for a KE-chain server, used to test the client machinery (pagination,
+# concurrency, caching, ...) without depending on recorded cassettes.
+#
+class StubRequest:
+    """A request as received by the `StubServer`."""
+
+    def __init__(self, method, path, params, headers, body):
+        self.method = method
+        self.path = path
+        self.params = params
+        self.headers = headers
+        self.body = body
+
+    @property
+    def json(self):
+        return json.loads(self.body) if self.body else None
+
+
+class StubRequestHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def _handle(self):
+        parsed = urlparse(self.path)
+        length = int(self.headers.get("Content-Length") or 0)
+        request = StubRequest(
+            method=self.command,
+            path=parsed.path,
+            params=dict(parse_qsl(parsed.query)),
+            headers=dict(self.headers),
+            body=self.rfile.read(length) if length else b"",
+        )
+        with self.server.lock:
+            self.server.requests.append(request)
+        handler = self.server.routes.get((self.command, parsed.path))
+        if handler is None:
+            status, payload, headers = 404, {"results": []}, {}
+        else:
+            status, payload, headers = handler(request)
+
+        content = json.dumps(payload).encode() if payload is not None else b""
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(content)))
+        for key, value in (headers or {}).items():
+            self.send_header(key, value)
+        self.end_headers()
+        self.wfile.write(content)
+
+    do_GET = do_POST = do_PUT = do_PATCH = do_DELETE = _handle
+
+    def log_message(self, *args):
+        pass
+
+
+class StubServer(ThreadingHTTPServer):
+    """A tiny threaded HTTP server answering with canned KE-chain-like responses."""
+
+    daemon_threads = True
+
+    def __init__(self):
+        super().__init__(("127.0.0.1", 0), StubRequestHandler)
+        self.routes = dict()
+        self.requests = list()
+        self.lock = threading.Lock()
+        self._thread = threading.Thread(target=self.serve_forever, daemon=True)
+
+    @property
+    def url(self):
+        return "http://{}:{}/".format(*self.server_address)
+
+    def start(self):
+        self._thread.start()
+
+    def stop(self):
+        self.shutdown()
+        self.server_close()
+
+    def add_route(self, method, path, handler):
+        """Register a handler `(request) -> (status, json, headers)` for a method and path."""
+        self.routes[(method, "/" + path.lstrip("/"))] = handler
+
+    def add_json_route(self, method, path, payload, status=200, headers=None):
+        self.add_route(method, path, lambda request: (status, payload, headers))
+
+    def add_list_route(self, path, results, page_size=100):
+        """Serve `results` as a KE-chain paginated list endpoint (limit/offset with `next`)."""
+
+        def handler(request):
+            limit = int(request.params.get("limit", page_size))
+            offset = int(request.params.get("offset", 0))
+            page = results[offset : offset + limit]
+            next_url = None
+            if offset + limit < len(results):
+                params = dict(request.params, limit=limit, offset=offset + limit)
+                next_url = f"{self.url}{path.lstrip('/')}?{urlencode(params)}"
+            return 200, dict(count=len(results), next=next_url, results=page), None
+
+        self.add_route("GET", path, handler)
+
+    def requests_to(self, path, method="GET"):
+        path = "/" + path.lstrip("/")
+        return [r for r in self.requests if r.path == path and r.method == method]
+
+
+class TestStubServer(TestCase):
+    """Test case providing a `Client` connected to a local `StubServer`."""
+
+    def setUp(self):
+        self.server = StubServer()
+        self.server.start()
+        self.client = Client(url=self.server.url)
+
+    def tearDown(self):
+        self.server.stop()
+        del self.client
+
+
+def property_json(name="Property", **kwargs):
+    """Return the json of a property as retrieved from KE-chain, with a new id and the `kwargs` as fields."""
+    return dict(
+        dict(
+            id=str(uuid.uuid4()),
+            name=name,
+            ref=name.lower().replace(" ", "-"),
+            property_type="CHAR_VALUE",
+            category="INSTANCE",
+            value=None,
+        ),
+        **kwargs,
+    )
+
+
+def part_json(name="Part", properties=(), **kwargs):
+    """
+    Return the json of a part as retrieved from KE-chain, with a new id and the `kwargs` as fields.
+
+    The `properties` are the json or the names of the properties of the part, ordered as listed.
+    """
+    part = dict(
+        dict(
+            id=str(uuid.uuid4()),
+            name=name,
+            ref=name.lower().replace(" ", "-"),
+            category="INSTANCE",
+        ),
+        **kwargs,
+    )
+    part["properties"] = [
+        prop
+        if isinstance(prop, dict)
+        else property_json(
+            prop, category=part["category"], part_id=part["id"], order=order
+        )
+        for order, prop in enumerate(properties)
+    ]
+    return part
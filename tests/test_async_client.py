@@ -0,0 +1,113 @@
+import asyncio
+import threading
+import uuid
+
+from pykechain import AsyncClient
+from pykechain.client_utils import PykeRetry
+from pykechain.models import Part, Scope
+from tests.classes import TestStubServer, part_json
+
+
+class TestAsyncClient(TestStubServer):
+    def setUp(self):
+        super().setUp()
+        self.async_client = AsyncClient(client=self.client)
+
+    def tearDown(self):
+        self.async_client.close()
+        super().tearDown()
+
+    def test_retrieves_the_same_models(self):
+        self.server.add_list_route("api/v3/parts.json", [part_json("Bike")])
+
+        parts = asyncio.run(self.async_client.parts(name="Bike"))
+
+        self.assertEqual(len(parts), 1)
+        self.assertIsInstance(parts[0], Part)
+        self.assertIs(parts[0]._client, self.client)
+
+    def test_gather_overlaps_requests(self):
+        barrier = threading.Barrier(2, timeout=5)
+        scope_json = dict(id=str(uuid.uuid4()), name="Bike Project", scope_options={})
+
+        def parts_handler(request):
+            barrier.wait()  # only passes when both requests are in flight simultaneously
+            return (
+                200,
+                dict(next=None, results=[part_json(request.params["name"])]),
+                None,
+            )
+
+        def scopes_handler(request):
+            barrier.wait()
+            return 200, dict(next=None, results=[scope_json]), None
+
+        self.server.add_route("GET", "api/v3/parts.json", parts_handler)
+        self.server.add_route("GET", "api/v3/scopes.json", scopes_handler)
+
+        async def gather():
+            return await asyncio.gather(
+                self.async_client.parts(name="Wheel"),
+                self.async_client.scopes(),
+            )
+
+        parts, scopes = asyncio.run(gather())
+
+        self.assertEqual(parts[0].name, "Wheel")
+        self.assertIsInstance(scopes[0], Scope)
+
+    def test_run_blocking_model_method(self):
+        bike = part_json("Bike")
+        wheel = part_json("Wheel", parent_id=bike["id"])
+        self.server.add_list_route("api/v3/parts.json", [wheel])
+
+        bike = Part(bike, client=self.client)
+        children = asyncio.run(self.async_client.run(bike.children))
+
+        self.assertEqual([c.name for c in children], ["Wheel"])
+
+    def test_keeps_retry_semantics(self):
+        adapter = self.async_client.client.session.get_adapter(self.server.url)
+
+        self.assertIsInstance(adapter.max_retries, PykeRetry)
+
+    def test_async_context_manager_and_login(self):
+        self.server.add_list_route("api/v3/scopes.json", [])
+
+        async def use():
+            async with AsyncClient(url=self.server.url) as client:
+                client.login(token="123123")
+                await client.scopes()
+                return client
+
+        client = asyncio.run(use())
+
+        self.assertEqual(client.api_root, self.server.url)
+        self.assertEqual(
+            self.server.requests[-1].headers["Authorization"], "Token 123123"
+        )
+
+    def test_exit_does_not_block_the_event_loop(self):
+        released = threading.Event()
+        waited = []
+
+        def parts_handler(request):
+            waited.append(released.wait(timeout=2))
+            return 200, dict(next=None, results=[]), None
+
+        self.server.add_route("GET", "api/v3/parts.json", parts_handler)
+
+        async def release():
+            await asyncio.sleep(0.2)
+            released.set()
+
+        async def exit_with_call_in_flight():
+            releaser = asyncio.ensure_future(release())
+            async with self.async_client as client:
+                parts = asyncio.ensure_future(client.parts())
+                await asyncio.sleep(0.05)  # the request is in flight
+            await releaser
+            return await parts
+
+        self.assertEqual(len(asyncio.run(exit_with_call_in_flight())), 0)
+        self.assertEqual(waited, [True])
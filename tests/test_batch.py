@@ -0,0 +1,68 @@
+import uuid
+
+from pykechain.exceptions import NotFoundError
+from pykechain.models import Part, User
+from tests.classes import TestStubServer, part_json
+
+
+class TestBatchLoader(TestStubServer):
+    def setUp(self):
+        super().setUp()
+        self.parts = [part_json(f"Part {i}") for i in range(250)]
+        self.users = [dict(pk=i, username=f"user{i}") for i in range(3)]
+        self.add_id_in_route("api/v3/parts.json", self.parts)
+        self.add_id_in_route("api/users.json", self.users)
+
+    def add_id_in_route(self, path, objects):
+        def handler(request):
+            ids = request.params.get("id__in", "").split(",")
+            results = [o for o in objects if str(o.get("id", o.get("pk"))) in ids]
+            return 200, dict(results=results, next=None), None
+
+        self.server.add_route("GET", path, handler)
+
+    def test_lookups_are_batched(self):
+        with self.client.batch() as batch:
+            lookups = [batch.part(p["id"]) for p in self.parts]
+
+        self.assertTrue(all(lookup.done() for lookup in lookups))
+        self.assertEqual(
+            [lookup.result().id for lookup in lookups], [p["id"] for p in self.parts]
+        )
+        self.assertIsInstance(lookups[0].result(), Part)
+        requests = self.server.requests_to("api/v3/parts.json")
+        self.assertEqual(len(requests), 3)
+        self.assertNotIn("category", requests[0].params)
+
+    def test_duplicate_lookups(self):
+        with self.client.batch(chunk_size=10) as batch:
+            first = batch.part(self.parts[0]["id"])
+            second = batch.part(self.parts[0]["id"])
+
+        self.assertIs(first, second)
+
+    def test_result_loads_pending_lookups(self):
+        with self.client.batch() as batch:
+            first = batch.part(self.parts[0]["id"])
+            second = batch.part(self.parts[1]["id"])
+
+            self.assertEqual(first.result().name, "Part 0")
+            self.assertTrue(second.done())
+
+        self.assertEqual(len(self.server.requests_to("api/v3/parts.json")), 1)
+
+    def test_not_found(self):
+        with self.client.batch() as batch:
+            missing = batch.part(str(uuid.uuid4()))
+
+        with self.assertRaises(NotFoundError):
+            missing.result()
+
+    def test_kinds_are_retrieved_separately(self):
+        with self.client.batch() as batch:
+            part = batch.part(self.parts[0]["id"])
+            user = batch.user(2)
+
+        self.assertIsInstance(user.result(), User)
+        self.assertEqual(user.result().username, "user2")
+        self.assertEqual(part.result().name, "Part 0")
@@ -0,0 +1,139 @@
+import time
+import uuid
+from unittest import TestCase
+
+import requests
+
+from pykechain.client_utils import ResponseCache
+from tests.classes import TestStubServer
+
+
+def response(url):
+    resp = requests.Response()
+    resp.status_code = requests.codes.ok
+    resp.url = url
+    return resp
+
+
+class TestResponseCache(TestCase):
+    def test_collection(self):
+        self.assertEqual(
+            ResponseCache.collection("https://ke-chain.com/api/v3/parts/1234.json"),
+            "parts",
+        )
+        self.assertEqual(
+            ResponseCache.collection("https://ke-chain.com/api/activities.json?id=1"),
+            "activities",
+        )
+        self.assertEqual(
+            ResponseCache.collection(
+                "https://ke-chain.com/api/v3/properties/bulk_update"
+            ),
+            "properties",
+        )
+        self.assertIsNone(ResponseCache.collection("https://ke-chain.com/accounts/"))
+
+    def test_hits_and_misses(self):
+        cache = ResponseCache()
+        url = "http://localhost/api/v3/parts.json"
+
+        self.assertIsNone(cache.get(url))
+        cache.set(url, response(url))
+        self.assertIsNotNone(cache.get(url))
+
+        self.assertEqual(cache.stats()["hits"], 1)
+        self.assertEqual(cache.stats()["misses"], 1)
+
+    def test_ttl(self):
+        cache = ResponseCache(ttl=0.01)
+        url = "http://localhost/api/v3/parts.json"
+        cache.set(url, response(url))
+
+        time.sleep(0.02)
+
+        self.assertIsNone(cache.get(url))
+        self.assertEqual(len(cache), 0)
+
+    def test_least_recently_used_is_evicted(self):
+        cache = ResponseCache(maxsize=2)
+        urls = [f"http://localhost/api/v3/parts/{i}.json" for i in range(3)]
+
+        cache.set(urls[0], response(urls[0]))
+        cache.set(urls[1], response(urls[1]))
+        cache.get(urls[0])
+        cache.set(urls[2], response(urls[2]))
+
+        self.assertIsNotNone(cache.get(urls[0]))
+        self.assertIsNone(cache.get(urls[1]))
+        self.assertIsNotNone(cache.get(urls[2]))
+
+    def test_invalidate_dependent_collections(self):
+        cache = ResponseCache()
+        part_url = "http://localhost/api/v3/parts/1.json"
+        user_url = "http://localhost/api/users.json"
+        cache.set(part_url, response(part_url))
+        cache.set(user_url, response(user_url))
+
+        cache.invalidate("http://localhost/api/v3/properties/bulk_update")
+
+        self.assertIsNone(cache.get(part_url))
+        self.assertIsNotNone(cache.get(user_url))
+
+    def test_invalidate_unknown_collection_clears(self):
+        cache = ResponseCache()
+        user_url = "http://localhost/api/users.json"
+        cache.set(user_url, response(user_url))
+
+        cache.invalidate("http://localhost/api/v3/scopes/clone")
+
+        self.assertEqual(len(cache), 0)
+
+
+class TestClientCache(TestStubServer):
+    def setUp(self):
+        super().setUp()
+        self.part_id = str(uuid.uuid4())
+        self.part_path = f"api/v3/parts/{self.part_id}.json"
+        self.server.add_json_route(
+            "GET",
+            self.part_path,
+            dict(results=[dict(id=self.part_id, name="Bike", properties=[])]),
+        )
+
+    def test_disabled_by_default(self):
+        self.client.part(pk=self.part_id)
+        self.client.part(pk=self.part_id)
+
+        self.assertIsNone(self.client.cache)
+        self.assertEqual(len(self.server.requests_to(self.part_path)), 2)
+
+    def test_repeated_retrieval_is_cached(self):
+        cache = self.client.enable_cache()
+
+        first = self.client.part(pk=self.part_id)
+        second = self.client.part(pk=self.part_id)
+
+        self.assertEqual(first.name, second.name)
+        self.assertEqual(len(self.server.requests_to(self.part_path)), 1)
+        self.assertEqual((cache.hits, cache.misses), (1, 1))
+
+    def test_write_invalidates(self):
+        self.client.enable_cache()
+        self.server.add_json_route(
+            "POST", "api/v3/properties/bulk_update", dict(results=[])
+        )
+
+        self.client.part(pk=self.part_id)
+        self.client.update_properties([dict(id=str(uuid.uuid4()), value=1)])
+        self.client.part(pk=self.part_id)
+
+        self.assertEqual(len(self.server.requests_to(self.part_path)), 2)
+
+    def test_login_clears_cache(self):
+        self.client.enable_cache()
+
+        self.client.part(pk=self.part_id)
+        self.client.login(token="123123")
+        self.client.part(pk=self.part_id)
+
+        self.assertEqual(len(self.server.requests_to(self.part_path)), 2)
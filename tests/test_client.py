@@ -1,11 +1,15 @@
+import copy
 import datetime
+import threading
 import time
 import warnings
+from concurrent.futures import ThreadPoolExecutor
 from unittest import TestCase
 
 import pytz
 
 from pykechain.client import Client
+from pykechain.client_utils import PykeRetry
 from pykechain.enums import ScopeStatus
 from pykechain.exceptions import (
     APIError,
@@ -16,7 +20,7 @@ from pykechain.exceptions import (
 )
 from pykechain.models import Base, Team
 from pykechain.models.scope import Scope
-from tests.classes import EnvironmentVarGuard, TestBetamax
+from tests.classes import EnvironmentVarGuard, TestBetamax, TestStubServer
 
 
 class TestClient(TestCase):
@@ -424,3 +428,44 @@ class TestClientAppVersions(TestBetamax):
             self.assertFalse(
                 self.client.match_app_version(app="nonexistingapp", version=">0.0.0")
             )
+
+
+class TestThreadSafeClient(TestStubServer):
+    def test_connection_pool_settings(self):
+        client = Client(
+            url=self.server.url, pool_connections=2, pool_maxsize=32, pool_block=True
+        )
+
+        adapter = client.session.get_adapter(self.server.url)
+
+        self.assertEqual(adapter._pool_connections, 2)
+        self.assertEqual(adapter._pool_maxsize, 32)
+        self.assertTrue(adapter._pool_block)
+        self.assertIsInstance(adapter.max_retries, PykeRetry)
+
+    def test_last_request_is_kept_per_thread(self):
+        self.server.add_list_route("api/v3/scopes.json", [])
+        barrier = threading.Barrier(8, timeout=5)
+
+        def retrieve(index):
+            self.client.scopes(name=f"Scope {index}")
+            barrier.wait()  # all threads performed their request before reading it back
+            return self.client.last_url, self.client.last_response.request
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            results = list(executor.map(retrieve, range(8)))
+
+        for index, (last_url, last_request) in enumerate(results):
+            self.assertIn(f"name=Scope+{index}", last_url)
+            self.assertIn(f"name=Scope+{index}", last_request.url)
+        self.assertIsNone(self.client.last_response)
+
+    def test_deepcopy(self):
+        self.client.enable_cache()
+        self.client.login(token="123123")
+
+        client = copy.deepcopy(self.client)
+
+        self.assertEqual(client.headers, self.client.headers)
+        self.assertIsNone(client.last_response)
+        self.assertEqual(len(client.cache), 0)
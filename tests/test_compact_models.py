@@ -0,0 +1,177 @@
+import gc
+import tracemalloc
+import uuid
+from unittest import TestCase, skipUnless
+
+from pykechain import Client
+from pykechain.models import Activity, Part, Property
+from pykechain.models.base import LazyDatetime, _json_attributes
+from tests.classes import part_json, property_json
+from tests.utils import TEST_BENCHMARKS
+
+
+def activity_json(index):
+    return dict(
+        id=str(uuid.uuid4()),
+        name=f"Activity {index}",
+        ref=f"activity-{index}",
+        status="OPEN",
+        classification="WORKFLOW",
+        activity_type="TASK",
+        description="",
+        assignees_ids=[],
+        activity_options={},
+        tags=[],
+        parent_id=str(uuid.uuid4()),
+        scope_id=str(uuid.uuid4()),
+    )
+
+
+class TestJsonAttributes(TestCase):
+    def setUp(self):
+        self.json = property_json("Property 1")
+        self.prop = Property.create(self.json, client=Client())
+
+    def test_read_from_the_json(self):
+        self.assertEqual(self.prop.name, "Property 1")
+        self.assertEqual(self.prop.type, "CHAR_VALUE")
+        self.assertNotIn("name", vars(self.prop))
+        self.assertNotIn("type", vars(self.prop))
+
+    def test_assign(self):
+        self.prop.name = "Renamed"
+        self.assertEqual(self.prop.name, "Renamed")
+        self.assertEqual(self.json["name"], "Property 1")
+
+        self.prop.refresh(json=dict(self.json, name="Refreshed"))
+        self.assertEqual(self.prop.name, "Refreshed")
+
+    def test_delete(self):
+        del self.prop.unit
+
+        self.assertFalse(hasattr(self.prop, "unit"))
+        with self.assertRaises(AttributeError):
+            self.prop.unit
+
+
+class TestCompactObjects(TestCase):
+    """Attributes of the models are read from the json data instead of being kept on every object."""
+
+    def setUp(self):
+        self.client = Client()
+
+    def assertCompact(self, factory, json):
+        obj = factory(json, client=self.client)
+
+        names = _json_attributes(type(obj))
+        self.assertIn("name", names)
+        self.assertIn("description", names)
+        for name in names:
+            with self.subTest(name):
+                self.assertNotIn(name, vars(obj))
+                descriptor = getattr(type(obj), name)
+                if not isinstance(descriptor, LazyDatetime):
+                    value = getattr(obj, name)
+                    self.assertEqual(
+                        value, json.get(descriptor.key, descriptor.default)
+                    )
+                    self.assertNotIn(name, vars(obj))
+        self.assertIsNone(getattr(obj, "_representations_component", None))
+
+    def test_property(self):
+        self.assertCompact(
+            Property.create,
+            property_json(
+                "Diameter",
+                description="Diameter of the wheel",
+                unit="mm",
+                order=1,
+                output=False,
+                model_id=str(uuid.uuid4()),
+                updated_at="2024-07-02T10:20:30.123456Z",
+            ),
+        )
+
+    def test_part(self):
+        self.assertCompact(
+            Part,
+            part_json(
+                "Wheel",
+                description="",
+                classification="PRODUCT",
+                multiplicity="ONE",
+                model_id=str(uuid.uuid4()),
+            ),
+        )
+
+    def test_activity(self):
+        self.assertCompact(Activity, activity_json(1))
+
+
+@skipUnless(TEST_BENCHMARKS, "set TEST_BENCHMARKS=1 to run the benchmarks")
+class TestMemoryPerObject(TestCase):
+    """
+    Memory benchmark of the models, as allocated per object on top of the json data of the response.
+
+    Traced with `tracemalloc` over 5000 objects, a `Property` allocates about 310 bytes on top of its json data
+    (860 bytes in pykechain 4.12), a `Part` without properties 240 bytes (310) and an `Activity` 280 bytes (590).
+    Run with `pytest -s` to print the measurements, the results are listed in `docs/api/models_base.rst`.
+    """
+
+    count = 5000
+
+    def setUp(self):
+        self.client = Client()
+
+    def bytes_per_object(self, factory, json_factory):
+        factory(json_factory(-1), client=self.client)  # imports the modules used on first creation
+        jsons = [json_factory(index) for index in range(self.count)]
+        gc.collect()
+
+        tracemalloc.start()
+        try:
+            objects = [factory(json, client=self.client) for json in jsons]
+            allocated, _ = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+
+        self.assertEqual(len(objects), self.count)
+        allocated /= self.count
+        print(f"{factory.__qualname__}: {allocated:.0f} bytes per object")  # with pytest -s
+        return allocated
+
+    def test_property(self):
+        def json_factory(index):
+            return property_json(
+                f"Property {index}",
+                value="value",
+                value_options={},
+                description="",
+                unit="",
+                order=index,
+                output=False,
+                model_id=str(uuid.uuid4()),
+                part_id=str(uuid.uuid4()),
+                scope_id=str(uuid.uuid4()),
+                created_at="2024-07-02T10:20:30.123456Z",
+                updated_at="2024-07-02T10:20:30.123456Z",
+            )
+
+        self.assertLess(self.bytes_per_object(Property.create, json_factory), 450)
+
+    def test_part(self):
+        def json_factory(index):
+            return part_json(
+                f"Part {index}",
+                classification="PRODUCT",
+                multiplicity="ONE",
+                description="",
+                model_id=str(uuid.uuid4()),
+                parent_id=str(uuid.uuid4()),
+                scope_id=str(uuid.uuid4()),
+            )
+
+        self.assertLess(self.bytes_per_object(Part, json_factory), 300)
+
+    def test_activity(self):
+        self.assertLess(self.bytes_per_object(Activity, activity_json), 400)
@@ -0,0 +1,164 @@
+import time
+import uuid
+from urllib.parse import urlencode
+
+from pykechain.models import Activity, Part
+from tests.classes import TestStubServer, part_json
+
+
+def tree_json(depth, width):
+    """Create the json of a tree of parts, with `width` children per part, in depth-first order."""
+    root = part_json("Root", parent_id=None)
+    descendants = []
+
+    def add_children(parent, level):
+        if level == depth:
+            return
+        for index in range(width):
+            child = part_json(f"{parent['name']}.{index}", parent_id=parent["id"])
+            descendants.append(child)
+            add_children(child, level + 1)
+
+    add_children(root, 0)
+    return root, descendants
+
+
+def paginate(request, url, results):
+    """Answer the request as a KE-chain paginated list endpoint (limit/offset with `next`)."""
+    limit = int(request.params.get("limit", 100))
+    offset = int(request.params.get("offset", 0))
+    next_url = None
+    if offset + limit < len(results):
+        next_params = dict(request.params, limit=limit, offset=offset + limit)
+        next_url = f"{url}?{urlencode(next_params)}"
+    page = results[offset : offset + limit]
+    return 200, dict(count=len(results), next=next_url, results=page), None
+
+
+class TestPartDescendants(TestStubServer):
+    def setUp(self):
+        super().setUp()
+        self.root_json, self.descendants_json = tree_json(depth=3, width=5)
+        self.root = Part(self.root_json, client=self.client)
+        self.server.add_route("GET", "api/v3/parts.json", self.parts_handler)
+
+    def parts_handler(self, request):
+        """Serve the parts filtered on `descendants` or `parent_id__in`, as a paginated list endpoint."""
+        params = request.params
+        if "descendants" in params:
+            # KE-chain includes the part itself in its descendants
+            results = [self.root_json] + self.descendants_json
+        else:
+            parent_ids = params["parent_id__in"].split(",")
+            results = [p for p in self.descendants_json if p["parent_id"] in parent_ids]
+
+        return paginate(request, f"{self.server.url}api/v3/parts.json", results)
+
+    def assertPopulated(self, root):
+        self.assertEqual(
+            [p.name for p in root.all_children()],
+            [p["name"] for p in self.descendants_json],
+        )
+        for part in root.all_children():
+            self.assertTrue(any(c is part for c in part._parent.children()))
+        self.assertEqual(len(self.server.requests), self.requests_count)
+
+    def test_populate_descendants(self):
+        self.root.populate_descendants(batch=40, concurrency=4)
+        self.requests_count = len(self.server.requests)
+
+        self.assertEqual(self.requests_count, 4)
+        self.assertEqual(
+            [c.name for c in self.root.children()], [f"Root.{i}" for i in range(5)]
+        )
+        self.assertPopulated(self.root)
+        self.assertTrue(all(c._parent is self.root for c in self.root.children()))
+
+    def test_iter_descendant_levels(self):
+        levels = self.root.iter_descendant_levels(chunk_size=10)
+
+        first_level = next(levels)
+        self.assertEqual([p.name for p in first_level], [f"Root.{i}" for i in range(5)])
+        self.assertIs(self.root.children(), self.root._cached_children)
+        self.assertIsNone(first_level[0]._cached_children)
+
+        remaining_levels = list(levels)
+        self.requests_count = len(self.server.requests)
+
+        self.assertEqual([len(level) for level in remaining_levels], [25, 125])
+        # the children of the root, 1 + 3 chunks of parents and 13 chunks of parts without children
+        self.assertEqual(self.requests_count, 1 + 1 + 3 + 13)
+        self.assertEqual([len(p.children()) for p in remaining_levels[-1]], [0] * 125)
+        self.assertPopulated(self.root)
+
+    def test_link_large_tree(self):
+        root_json, descendants_json = tree_json(depth=6, width=6)
+        root = Part(root_json, client=self.client)
+        descendants = [root] + [
+            Part(json, client=self.client) for json in descendants_json
+        ]
+
+        start = time.perf_counter()
+        root._populate_cached_children(descendants)
+        duration = time.perf_counter() - start
+
+        self.assertEqual(len(descendants), 55987)
+        self.assertEqual(len(root.children()), 6)
+        self.assertLess(duration, 1.0)
+
+
+class TestActivityDescendants(TestStubServer):
+    def setUp(self):
+        super().setUp()
+        self.scope_id = str(uuid.uuid4())
+        root_json, descendants_json = tree_json(depth=3, width=4)
+        self.activities_json = [root_json] + descendants_json
+        for json in self.activities_json:
+            is_task = json["name"].count(".") == 3
+            json.update(
+                activity_type="TASK" if is_task else "PROCESS",
+                classification="WORKFLOW",
+                scope_id=self.scope_id,
+            )
+        self.server.add_route(
+            "GET",
+            "api/activities.json",
+            lambda request: paginate(
+                request, f"{self.server.url}api/activities.json", self.activities_json
+            ),
+        )
+        self.root = Activity(root_json, client=self.client)
+
+    def test_populate_descendants(self):
+        self.root.populate_descendants(batch=20, concurrency=4)
+
+        requests = self.server.requests_to("api/activities.json")
+        self.assertEqual(len(requests), 5)
+        self.assertEqual(requests[0].params["scope_id"], self.scope_id)
+
+        subprocess = self.root.children()[1]
+        self.assertIs(subprocess._parent, self.root)
+        self.assertEqual(
+            [c.name for c in subprocess.children()], [f"Root.1.{i}" for i in range(4)]
+        )
+        self.assertIs(subprocess.children()[0].parent(), subprocess)
+        self.assertEqual(len(self.server.requests), 5)
+
+    def test_all_children(self):
+        self.root.populate_descendants()
+        all_children = self.root.all_children()
+
+        self.assertEqual(
+            [a.name for a in all_children],
+            [a["name"] for a in self.activities_json[1:]],
+        )
+        self.assertEqual(len([a for a in all_children if a.is_task()]), 64)
+        self.assertEqual(len(self.server.requests), 1)
+
+    def test_populate_subprocess(self):
+        subprocess = Activity(self.activities_json[1], client=self.client)
+
+        subprocess.populate_descendants()
+
+        self.assertEqual(len(subprocess.all_children()), 4 + 16)
+        self.assertIs(subprocess.children()[0]._parent, subprocess)
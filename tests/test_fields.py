@@ -0,0 +1,85 @@
+import uuid
+
+from pykechain.defaults import API_EXTRA_PARAMS
+from pykechain.exceptions import IllegalArgumentError
+from pykechain.models import Part, Scope
+from pykechain.models.widgets import Widget
+from tests.classes import TestStubServer
+
+
+class TestFieldProjection(TestStubServer):
+    def setUp(self):
+        super().setUp()
+        self.part_json = dict(id=str(uuid.uuid4()), name="Bike", parent_id=None)
+        self.server.add_list_route("api/v3/parts.json", [self.part_json])
+
+    def requested_fields(self, path="api/v3/parts.json"):
+        return self.server.requests_to(path)[-1].params["fields"].split(",")
+
+    def test_default_fields(self):
+        self.client.parts()
+
+        self.assertEqual(
+            self.server.requests_to("api/v3/parts.json")[0].params["fields"],
+            API_EXTRA_PARAMS["parts"]["fields"],
+        )
+
+    def test_lean_profile(self):
+        (part,) = self.client.parts(fields="lean")
+
+        self.assertEqual(
+            self.requested_fields(), ["id", "name", "parent_id", "model_id"]
+        )
+        self.assertIsInstance(part, Part)
+        self.assertEqual(part.properties, [])
+        self.assertIsNone(part.category)
+
+    def test_fields(self):
+        self.client.parts(fields=["name", "ref"])
+        self.assertEqual(self.requested_fields(), ["id", "name", "ref"])
+
+        self.client.parts(fields="name,category")
+        self.assertEqual(self.requested_fields(), ["id", "name", "category"])
+
+    def test_only_and_defer(self):
+        default_fields = API_EXTRA_PARAMS["parts"]["fields"].split(",")
+
+        self.client.parts(defer=["properties"])
+        self.assertEqual(
+            self.requested_fields(), [f for f in default_fields if f != "properties"]
+        )
+
+        self.client.parts(only="name,ref,not_a_default_field")
+        self.assertEqual(self.requested_fields(), ["id", "name", "ref"])
+
+    def test_invalid_fields(self):
+        with self.assertRaises(IllegalArgumentError):
+            self.client.parts(fields=[1, 2])
+
+    def test_part_detail(self):
+        self.server.add_json_route(
+            "GET",
+            f"api/v3/parts/{self.part_json['id']}.json",
+            dict(results=[self.part_json]),
+        )
+
+        part = self.client.part(pk=self.part_json["id"], fields="lean")
+
+        self.assertEqual(part.name, "Bike")
+        self.assertEqual(
+            self.requested_fields(f"api/v3/parts/{self.part_json['id']}.json"),
+            ["id", "name", "parent_id", "model_id"],
+        )
+
+    def test_lean_scopes_and_widgets(self):
+        lean = dict(id=str(uuid.uuid4()), name="Lean")
+        self.server.add_list_route("api/v3/scopes.json", [lean])
+        self.server.add_list_route("api/widgets.json", [lean])
+
+        (scope,) = self.client.scopes(fields="lean")
+        (widget,) = self.client.widgets(fields="lean")
+
+        self.assertIsInstance(scope, Scope)
+        self.assertIsInstance(widget, Widget)
+        self.assertIsNone(widget.meta)
+        self.assertEqual(self.requested_fields("api/v3/scopes.json"), ["id", "name"])
@@ -0,0 +1,89 @@
+import copy
+import gc
+
+from pykechain.models import Part, Property
+from tests.classes import TestStubServer, part_json, property_json
+
+
+class TestIdentityMap(TestStubServer):
+    def setUp(self):
+        super().setUp()
+        self.bike = part_json(
+            "Bike",
+            properties=[property_json("Gears", property_type="INT_VALUE", value=6)],
+        )
+        self.wheel = part_json("Wheel", parent_id=self.bike["id"])
+        self.server.add_list_route("api/v3/parts.json", [self.wheel])
+        self.identity_map = self.client.enable_identity_map()
+
+    def test_disabled_by_default(self):
+        self.client.disable_identity_map()
+
+        self.assertIsNot(
+            Part(self.bike, client=self.client), Part(self.bike, client=self.client)
+        )
+
+    def test_same_object_is_reused_and_updated(self):
+        bike = Part(self.bike, client=self.client)
+
+        renamed = Part(dict(self.bike, name="Racing bike"), client=self.client)
+
+        self.assertIs(renamed, bike)
+        self.assertEqual(bike.name, "Racing bike")
+        self.assertIn(bike, self.identity_map)
+
+    def test_properties_are_reused(self):
+        bike = Part(self.bike, client=self.client)
+        gears = bike.property("Gears")
+
+        Part(self.bike, client=self.client)
+
+        self.assertIs(bike.property("Gears"), gears)
+        self.assertIs(
+            Property.create(self.bike["properties"][0], client=self.client), gears
+        )
+
+    def test_retrieved_children_are_reused(self):
+        bike = Part(self.bike, client=self.client)
+        wheel = Part(self.wheel, client=self.client)
+
+        self.assertIs(bike.children()[0], wheel)
+
+    def test_caches_are_kept(self):
+        bike = Part(self.bike, client=self.client)
+        wheel = bike.children()[0]
+        gears = bike.property("Gears")
+        bike._etag = '"1"'
+
+        retrieved = Part(dict(self.bike, name="Racing bike"), client=self.client)
+
+        self.assertIs(retrieved, bike)
+        self.assertEqual(bike.name, "Racing bike")
+        self.assertIs(bike.children()[0], wheel)
+        self.assertIs(bike.property("Gears"), gears)
+        self.assertEqual(bike._etag, '"1"')
+        self.assertEqual(len(self.server.requests), 1)
+
+    def test_retrieved_parent_is_kept(self):
+        bike = Part(self.bike, client=self.client)
+        wheel = bike.children()[0]
+
+        self.client.parts(parent_id=bike.id)
+
+        self.assertIs(wheel.parent(), bike)
+        self.assertIs(bike.children()[0], wheel)
+        self.assertEqual(len(self.server.requests), 2)
+
+    def test_models_are_released(self):
+        Part(self.bike, client=self.client)
+        gc.collect()
+
+        self.assertEqual(len(self.identity_map), 0)
+
+    def test_deepcopy(self):
+        bike = Part(self.bike, client=self.client)
+
+        bike_copy = copy.deepcopy(bike)
+
+        self.assertIsNot(bike_copy, bike)
+        self.assertEqual(bike_copy.id, bike.id)
@@ -0,0 +1,97 @@
+import json
+import subprocess
+import sys
+from unittest import TestCase, skipUnless
+
+from tests.utils import TEST_BENCHMARKS
+
+HEAVY_MODULES = (
+    "pykechain.client",
+    "pykechain.models.part",
+    "pykechain.models.widgets",
+    "jsonschema",
+    "asyncio",
+)
+
+# imports the modules that `import pykechain` imported in pykechain 4.12
+EAGER_IMPORT = (
+    "import jsonschema, pykechain.client, pykechain.helpers, pykechain.models.widgets\n"
+    "import pykechain.models.banner, pykechain.models.expiring_download\n"
+    "from pykechain.models import *"
+)
+
+
+def run_import(statement, modules=HEAVY_MODULES):
+    """Run the import statement in a fresh interpreter and return its duration and the loaded `modules`."""
+    script = (
+        "import json, sys, time\n"
+        "start = time.perf_counter()\n"
+        f"{statement}\n"
+        "duration = time.perf_counter() - start\n"
+        f"print(json.dumps([duration, [m for m in {list(modules)!r} if m in sys.modules]]))\n"
+    )
+    output = subprocess.run(
+        [sys.executable, "-c", script], check=True, capture_output=True, text=True
+    ).stdout
+    return json.loads(output.splitlines()[-1])
+
+
+class TestLazyImports(TestCase):
+    def test_import_pykechain(self):
+        _, loaded = run_import("import pykechain")
+        self.assertEqual(loaded, [])
+
+    def test_import_client(self):
+        _, loaded = run_import("from pykechain import Client")
+        self.assertEqual(loaded, ["pykechain.client"])
+
+    def test_import_models(self):
+        _, loaded = run_import("from pykechain.models import Part")
+        self.assertNotIn("pykechain.client", loaded)
+        self.assertNotIn("jsonschema", loaded)
+
+    def test_lazy_attributes(self):
+        import pykechain
+        import pykechain.models
+        from pykechain.async_client import AsyncClient
+        from pykechain.models.property_selectlist import SelectListProperty
+
+        self.assertIs(pykechain.AsyncClient, AsyncClient)
+        self.assertIn("Client", dir(pykechain))
+        self.assertIs(pykechain.models.SelectListProperty, SelectListProperty)
+        self.assertIs(
+            pykechain.models.property_type_to_class_map["SINGLE_SELECT_VALUE"],
+            SelectListProperty,
+        )
+        with self.assertRaises(AttributeError):
+            pykechain.models.NotAModel
+
+
+@skipUnless(TEST_BENCHMARKS, "set TEST_BENCHMARKS=1 to run the benchmarks")
+class TestImportTime(TestCase):
+    """
+    Import time of pykechain, compared with importing the modules that pykechain 4.12 imported eagerly.
+
+    `import pykechain` typically takes about 1 ms (500 ms in pykechain 4.12) and `from pykechain import Client`
+    about 85 ms on top of importing `requests` (275 ms), as the models are imported when they are first used.
+    Run with `pytest -s` to print the measurements.
+    """
+
+    @classmethod
+    def setUpClass(cls):
+        cls.eager = min(run_import(EAGER_IMPORT)[0] for _ in range(3))
+        cls.requests = min(run_import("import requests")[0] for _ in range(3))
+
+    def test_import_time(self):
+        duration = min(run_import("import pykechain")[0] for _ in range(3))
+        print(
+            f"import pykechain: {duration * 1e3:.0f} ms, 4.12: {self.eager * 1e3:.0f} ms"
+        )
+        self.assertLess(duration, self.eager / 10)
+
+    def test_import_client_time(self):
+        client = min(run_import("from pykechain import Client")[0] for _ in range(3))
+        print(
+            f"from pykechain import Client: {client * 1e3:.0f} ms, 4.12: {self.eager * 1e3:.0f} ms"
+        )
+        self.assertLess(client - self.requests, (self.eager - self.requests) / 2)
@@ -0,0 +1,160 @@
+import importlib.util
+import json
+import pickle
+import uuid
+from unittest import TestCase, mock, skipUnless
+
+from pykechain import Client
+from pykechain.client_utils import JsonCodec, default_json_codec
+from pykechain.exceptions import APIError, IllegalArgumentError
+from pykechain.models import Part
+from tests.classes import TestStubServer, part_json
+
+HAS_ORJSON = importlib.util.find_spec("orjson") is not None
+HAS_UJSON = importlib.util.find_spec("ujson") is not None
+
+
+class CountingCodec(JsonCodec):
+    def __init__(self, library="json"):
+        super().__init__(library)
+        self.encoded = 0
+        self.decoded = 0
+
+    def dumps(self, data):
+        self.encoded += 1
+        return super().dumps(data)
+
+    def loads(self, data):
+        self.decoded += 1
+        return super().loads(data)
+
+
+class TestJsonCodec(TestCase):
+    data = dict(name="Bike / wheel", order=1, value=None, options={"ø": [1.5, True]})
+
+    def test_fastest_library_by_default(self):
+        expected = "orjson" if HAS_ORJSON else "ujson" if HAS_UJSON else "json"
+        self.assertEqual(JsonCodec().library, expected)
+        self.assertEqual(Client().json_codec.library, expected)
+
+    def test_libraries(self):
+        libraries = ["json"] + [
+            name
+            for name, installed in [("orjson", HAS_ORJSON), ("ujson", HAS_UJSON)]
+            if installed
+        ]
+        for library in libraries:
+            with self.subTest(library):
+                codec = JsonCodec(library)
+
+                encoded = codec.dumps(self.data)
+                self.assertIsInstance(encoded, bytes)
+                self.assertEqual(json.loads(encoded), self.data)
+                self.assertEqual(codec.loads(json.dumps(self.data).encode()), self.data)
+
+    def test_stdlib_encodes_like_requests(self):
+        self.assertEqual(
+            JsonCodec("json").dumps(self.data), json.dumps(self.data).encode()
+        )
+
+    def test_unknown_library(self):
+        with self.assertRaises(IllegalArgumentError):
+            JsonCodec("simplejson")
+
+    def test_pickle(self):
+        codec = pickle.loads(pickle.dumps(JsonCodec("json")))
+        self.assertEqual(codec.library, "json")
+        self.assertEqual(codec.loads("[1]"), [1])
+
+
+class TestClientJsonCodec(TestStubServer):
+    def setUp(self):
+        super().setUp()
+        self.codec = CountingCodec()
+        self.client.json_codec = self.codec
+
+    def test_request_and_response_bodies(self):
+        widget_id = str(uuid.uuid4())
+        self.server.add_json_route("PUT", "api/widgets/bulk_update", dict(results=[]))
+        self.server.add_list_route(
+            "api/v3/parts.json", [dict(id=widget_id, name="Bike")]
+        )
+
+        self.client._request(
+            "PUT",
+            self.client._build_url("widgets_bulk_update"),
+            json=[dict(id=widget_id)],
+        )
+        (part,) = self.client.parts()
+
+        (request,) = self.server.requests_to("api/widgets/bulk_update", "PUT")
+        self.assertEqual(request.json, [dict(id=widget_id)])
+        self.assertEqual(request.headers["Content-Type"], "application/json")
+        self.assertEqual(self.codec.encoded, 1)
+        self.assertEqual(part.name, "Bike")
+
+    @skipUnless(HAS_ORJSON, "orjson is not installed")
+    def test_decode(self):
+        self.client.json_codec = CountingCodec("orjson")
+        self.server.add_json_route("GET", "api/versions.json", dict(results=[]))
+
+        self.assertEqual(self.client.app_versions, [])
+        self.assertEqual(self.client.json_codec.decoded, 1)
+
+    @skipUnless(HAS_ORJSON, "orjson is not installed")
+    def test_decode_invalid_json(self):
+        self.server.add_route("GET", "empty", lambda request: (200, None, None))
+        response = self.client.session.get(self.server.url + "/empty")
+
+        with self.assertRaises(json.JSONDecodeError):
+            JsonCodec("orjson").decode(response)
+
+    def test_api_error(self):
+        self.server.add_route(
+            "GET",
+            "invalid",
+            lambda request: (400, dict(msg="Invalid", detail="Too long"), None),
+        )
+        response = self.client.session.get(self.server.url + "/invalid")
+
+        for codec in [self.codec, None]:
+            with self.subTest(codec):
+                decoder = codec or default_json_codec()
+                with mock.patch.object(
+                    decoder, "decode", wraps=decoder.decode
+                ) as decode:
+                    error = APIError(
+                        "Could not update", response=response, json_codec=codec
+                    )
+
+                decode.assert_called_once_with(response)
+                self.assertEqual(error.msg, "Invalid")
+                self.assertEqual(error.detail, "Too long")
+
+    def test_api_errors_of_the_client_and_models(self):
+        part = Part(part_json("Bike"), client=self.client)
+
+        def invalid(request):
+            return 400, dict(msg="Invalid"), None
+
+        self.server.add_route("GET", "api/v3/parts.json", invalid)
+        self.server.add_route("DELETE", f"api/v3/parts/{part.id}.json", invalid)
+
+        for method in [self.client.parts, part.delete]:
+            with self.subTest(method.__name__):
+                with mock.patch.object(
+                    self.codec, "decode", wraps=self.codec.decode
+                ) as decode:
+                    with self.assertRaises(APIError) as context:
+                        method()
+
+                decode.assert_called_once_with(context.exception.response)
+                self.assertEqual(context.exception.msg, "Invalid")
+
+    def test_api_error_without_json(self):
+        self.server.add_route("GET", "empty", lambda request: (500, None, None))
+        response = self.client.session.get(self.server.url + "/empty")
+
+        error = APIError("Could not update", response=response)
+
+        self.assertIsNone(error.detail)
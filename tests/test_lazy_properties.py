@@ -0,0 +1,57 @@
+from unittest import TestCase, mock
+
+from pykechain import Client
+from pykechain.models import Part, Property
+from tests.classes import part_json, property_json
+
+
+class TestLazyProperties(TestCase):
+    def setUp(self):
+        self.client = Client()
+        # the properties are listed in another order than their `order`
+        self.json = part_json(
+            "Bike",
+            properties=[
+                property_json("Gears", order=2),
+                property_json("Color", order=1),
+            ],
+        )
+
+    def tearDown(self):
+        Part.set_lazy_properties(True)
+
+    def test_properties_are_created_on_first_access(self):
+        with mock.patch.object(Property, "create", wraps=Property.create) as create:
+            part = Part(self.json, client=self.client)
+            self.assertEqual(create.call_count, 0)
+
+            self.assertEqual([p.name for p in part.properties], ["Color", "Gears"])
+            self.assertIs(part.property("Gears"), part.properties[1])
+            self.assertEqual(create.call_count, 2)
+
+    def test_opt_out(self):
+        Part.set_lazy_properties(False)
+
+        with mock.patch.object(Property, "create", wraps=Property.create) as create:
+            Part(self.json, client=self.client)
+
+        self.assertEqual(create.call_count, 2)
+
+    def test_part_without_properties(self):
+        json = self.json
+        del json["properties"]
+
+        self.assertEqual(Part(json, client=self.client).properties, [])
+
+    def test_refresh_keeps_the_created_properties(self):
+        json = self.json
+        part = Part(json, client=self.client)
+        gears = part.property("Gears")
+
+        json = dict(json, name="Racing bike")
+        json["properties"][0] = dict(json["properties"][0], value="11")
+        part.refresh(json=json)
+
+        self.assertEqual(part.name, "Racing bike")
+        self.assertIs(part.property("Gears"), gears)
+        self.assertEqual(gears.value, "11")
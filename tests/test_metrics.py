@@ -0,0 +1,115 @@
+import uuid
+from unittest import TestCase
+
+from pykechain.metrics import EndpointStats, RequestMetrics
+from tests.classes import TestStubServer
+
+
+class TestRequestMetrics(TestCase):
+    def test_endpoint(self):
+        self.assertEqual(
+            RequestMetrics.endpoint("https://ke-chain.com/api/v3/parts.json?limit=100"),
+            "parts",
+        )
+        self.assertEqual(
+            RequestMetrics.endpoint(
+                f"https://ke-chain.com/api/v3/parts/{uuid.uuid4()}.json"
+            ),
+            "part",
+        )
+        self.assertEqual(
+            RequestMetrics.endpoint("/api/v3/parts/bulk_create_part_instances"),
+            "parts_bulk_create",
+        )
+        self.assertEqual(
+            RequestMetrics.endpoint("https://ke-chain.com/api/v3/forms/bulk_delete"),
+            "forms_bulk_delete",
+        )
+        self.assertEqual(RequestMetrics.endpoint("https://ke-chain.com/foo"), "other")
+
+    def test_percentiles(self):
+        stats = EndpointStats()
+        stats.latencies.extend(i / 100 for i in range(1, 101))
+
+        self.assertEqual(stats.percentile(50), 0.5)
+        self.assertEqual(stats.percentile(90), 0.9)
+        self.assertEqual(stats.percentile(100), 1.0)
+        self.assertIsNone(EndpointStats().percentile(50))
+
+    def test_percentiles_nearest_rank(self):
+        stats = EndpointStats()
+        stats.latencies.extend(range(1, 11))
+
+        self.assertEqual(stats.percentile(0), 1)
+        self.assertEqual(stats.percentile(10), 1)
+        self.assertEqual(stats.percentile(15), 2)
+        self.assertEqual(stats.percentile(50), 5)
+        self.assertEqual(stats.percentile(90), 9)
+        self.assertEqual(stats.percentile(99), 10)
+
+        stats = EndpointStats()
+        stats.latencies.extend([1, 2])
+        self.assertEqual(stats.percentile(50), 1)
+        self.assertEqual(stats.percentile(51), 2)
+
+
+class TestClientMetrics(TestStubServer):
+    def setUp(self):
+        super().setUp()
+        self.server.add_list_route("api/v3/scopes.json", [])
+
+    def test_stats(self):
+        self.client.scopes()
+        self.client.scopes()
+
+        stats = self.client.stats()["scopes"]
+
+        self.assertEqual(stats["count"], 2)
+        self.assertEqual(stats["status_codes"], {200: 2})
+        self.assertGreater(stats["bytes_received"], 0)
+        self.assertGreater(stats["latency"]["p50"], 0)
+
+    def test_measure(self):
+        self.client.scopes()
+
+        with self.client.measure() as metrics:
+            self.client.scopes()
+            self.client.part  # no request
+
+        self.client.scopes()
+
+        self.assertEqual(metrics.snapshot()["scopes"]["count"], 1)
+        self.assertEqual(self.client.stats()["scopes"]["count"], 3)
+
+    def test_hooks(self):
+        calls = []
+
+        def pre_request(method, url, kwargs):
+            kwargs["headers"] = {"X-Trace": "abc"}
+            calls.append(("pre", method))
+
+        def post_request(method, url, response, elapsed):
+            calls.append(("post", response.status_code))
+
+        self.client.add_request_hook(pre_request=pre_request, post_request=post_request)
+        self.client.scopes()
+
+        self.assertEqual(calls, [("pre", "GET"), ("post", 200)])
+        self.assertEqual(self.server.requests[-1].headers["X-Trace"], "abc")
+
+    def test_retries_are_counted(self):
+        retry = self.client.session.get_adapter(self.server.url).max_retries
+
+        retry.new().increment(method="GET", url="/api/v3/scopes.json", error=OSError())
+
+        self.assertEqual(self.client.stats()["scopes"]["retries"], 1)
+
+    def test_connection_errors_are_counted(self):
+        self.server.stop()
+        retry = self.client.session.get_adapter(self.server.url).max_retries
+        retry.total = 0
+
+        with self.assertRaises(Exception):
+            self.client.scopes()
+
+        self.assertEqual(self.client.stats()["scopes"]["errors"], 1)
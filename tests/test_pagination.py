@@ -0,0 +1,205 @@
+import threading
+import types
+import uuid
+
+from pykechain.exceptions import MultipleFoundError
+from pykechain.models import PartSet
+from tests.classes import TestStubServer, part_json
+
+
+class TestPartsConcurrentPagination(TestStubServer):
+    def setUp(self):
+        super().setUp()
+        self.all_parts = [part_json(f"Part {i}") for i in range(250)]
+        self.server.add_list_route("api/v3/parts.json", self.all_parts)
+
+    def test_sequential_pagination(self):
+        parts = self.client.parts()
+
+        self.assertIsInstance(parts, PartSet)
+        self.assertEqual([p.id for p in parts], [p["id"] for p in self.all_parts])
+        self.assertEqual(len(self.server.requests_to("api/v3/parts.json")), 3)
+
+    def test_concurrent_pagination_preserves_order(self):
+        parts = self.client.parts(concurrency=4)
+
+        self.assertEqual([p.id for p in parts], [p["id"] for p in self.all_parts])
+        offsets = sorted(
+            int(r.params.get("offset", 0))
+            for r in self.server.requests_to("api/v3/parts.json")
+        )
+        self.assertEqual(offsets, [0, 100, 200])
+
+    def test_concurrent_pagination_honors_limit(self):
+        parts = self.client.parts(limit=150, batch=50, concurrency=4)
+
+        self.assertEqual([p.id for p in parts], [p["id"] for p in self.all_parts[:150]])
+        self.assertEqual(len(self.server.requests_to("api/v3/parts.json")), 3)
+
+    def test_concurrent_pagination_with_offset(self):
+        parts = self.client.parts(offset=50, concurrency=4)
+
+        self.assertEqual([p.id for p in parts], [p["id"] for p in self.all_parts[50:]])
+        offsets = sorted(
+            int(r.params["offset"])
+            for r in self.server.requests_to("api/v3/parts.json")
+        )
+        self.assertEqual(offsets, [50, 150])
+
+    def test_concurrent_pagination_with_offset_and_limit(self):
+        parts = self.client.parts(offset=50, limit=120, batch=50, concurrency=4)
+
+        self.assertEqual(
+            [p.id for p in parts], [p["id"] for p in self.all_parts[50:170]]
+        )
+        self.assertEqual(len(self.server.requests_to("api/v3/parts.json")), 3)
+
+    def test_concurrent_pagination_overlaps_requests(self):
+        barrier = threading.Barrier(2, timeout=5)
+        list_handler = self.server.routes[("GET", "/api/v3/parts.json")]
+
+        def handler(request):
+            if "offset" in request.params:
+                barrier.wait()  # both remaining batches must be in flight together
+            return list_handler(request)
+
+        self.server.add_route("GET", "api/v3/parts.json", handler)
+
+        parts = self.client.parts(concurrency=2)
+
+        self.assertEqual(len(parts), 250)
+
+    def test_concurrent_pagination_with_empty_first_batch(self):
+        list_handler = self.server.routes[("GET", "/api/v3/parts.json")]
+
+        def handler(request):
+            status, data, headers = list_handler(request)
+            if "offset" not in request.params:
+                data = dict(data, results=[])  # eg. deleted since the count
+            return status, data, headers
+
+        self.server.add_route("GET", "api/v3/parts.json", handler)
+
+        parts = self.client.parts(concurrency=4)
+
+        self.assertEqual([p.id for p in parts], [p["id"] for p in self.all_parts[100:]])
+
+
+class TestIterParts(TestStubServer):
+    def setUp(self):
+        super().setUp()
+        self.all_parts = [part_json(f"Part {i}") for i in range(250)]
+        self.server.add_list_route("api/v3/parts.json", self.all_parts)
+
+    def test_iter_parts(self):
+        parts = self.client.iter_parts()
+
+        self.assertIsInstance(parts, types.GeneratorType)
+        self.assertEqual([p.id for p in parts], [p["id"] for p in self.all_parts])
+        self.assertEqual(len(self.server.requests_to("api/v3/parts.json")), 3)
+
+    def test_iter_parts_yields_after_first_batch(self):
+        parts = self.client.iter_parts(prefetch=False)
+
+        first = next(parts)
+
+        self.assertEqual(first.id, self.all_parts[0]["id"])
+        self.assertEqual(len(self.server.requests_to("api/v3/parts.json")), 1)
+        parts.close()
+
+    def test_iter_parts_prefetches_next_batch(self):
+        parts = self.client.iter_parts(batch=50)
+
+        for _ in range(50):
+            next(parts)
+        parts.close()
+
+        self.assertEqual(len(self.server.requests_to("api/v3/parts.json")), 2)
+
+    def test_iter_parts_honors_limit(self):
+        parts = list(self.client.iter_parts(limit=120, batch=50))
+
+        self.assertEqual([p.id for p in parts], [p["id"] for p in self.all_parts[:120]])
+        self.assertEqual(len(self.server.requests_to("api/v3/parts.json")), 3)
+
+
+class TestListEndpointsPagination(TestStubServer):
+    def setUp(self):
+        super().setUp()
+        self.all_activities = [
+            dict(id=str(uuid.uuid4()), name=f"Activity {i}") for i in range(250)
+        ]
+        self.server.add_list_route("api/activities.json", self.all_activities)
+
+    def test_follows_next_links(self):
+        activities = self.client.activities()
+
+        self.assertEqual(
+            [a.id for a in activities], [a["id"] for a in self.all_activities]
+        )
+        self.assertEqual(len(self.server.requests_to("api/activities.json")), 3)
+
+    def test_limit_and_batch(self):
+        activities = self.client.activities(limit=120, batch=50)
+
+        self.assertEqual(
+            [a.id for a in activities], [a["id"] for a in self.all_activities[:120]]
+        )
+        requests = self.server.requests_to("api/activities.json")
+        self.assertEqual(len(requests), 3)
+        self.assertTrue(all(r.params["limit"] == "50" for r in requests))
+        self.assertNotIn("batch", requests[0].params)
+
+    def test_single_object_retrieves_a_single_batch(self):
+        with self.assertRaises(MultipleFoundError):
+            self.client.activity(limit=100, concurrency=4)
+
+        requests = self.server.requests_to("api/activities.json")
+        self.assertEqual(len(requests), 1)
+        self.assertEqual(requests[0].params["limit"], "2")
+
+    def test_limit_smaller_than_a_batch(self):
+        activities = self.client.activities(limit=5)
+
+        self.assertEqual(len(activities), 5)
+        requests = self.server.requests_to("api/activities.json")
+        self.assertEqual(len(requests), 1)
+        self.assertEqual(requests[0].params["limit"], "5")
+
+    def test_concurrency(self):
+        activities = self.client.activities(concurrency=3)
+
+        self.assertEqual(
+            [a.id for a in activities], [a["id"] for a in self.all_activities]
+        )
+        self.assertNotIn(
+            "concurrency", self.server.requests_to("api/activities.json")[0].params
+        )
+
+    def test_crud_list_follows_next_links(self):
+        forms = [
+            dict(id=str(uuid.uuid4()), name=f"Form {i}", form_model_root=None)
+            for i in range(150)
+        ]
+        self.server.add_list_route("api/v3/forms", forms)
+
+        self.assertEqual(len(self.client.forms()), 150)
+        self.assertEqual(len(self.server.requests_to("api/v3/forms")), 2)
+
+    def test_iter_activities(self):
+        activities = list(self.client.iter_activities(batch=100))
+
+        self.assertEqual(
+            [a.id for a in activities], [a["id"] for a in self.all_activities]
+        )
+
+    def test_iter_properties(self):
+        properties = [
+            dict(id=str(uuid.uuid4()), name=f"Property {i}", property_type="CHAR_VALUE")
+            for i in range(150)
+        ]
+        self.server.add_list_route("api/v3/properties.json", properties)
+
+        result = list(self.client.iter_properties())
+
+        self.assertEqual([p.id for p in result], [p["id"] for p in properties])
@@ -0,0 +1,122 @@
+import uuid
+from unittest import TestCase
+
+from pykechain import Client
+from pykechain.exceptions import MultipleFoundError, NotFoundError
+from pykechain.extra_utils import get_mapping_dictionary, map_property_instances
+from pykechain.models import Part, Property
+from tests.classes import part_json, property_json
+
+
+class TestPropertyIndex(TestCase):
+    def setUp(self):
+        self.client = Client()
+        self.json = part_json(
+            "Bike", properties=["Gears", "Frame color", "Wheel size", "Wheel Size"]
+        )
+        self.part = Part(self.json, client=self.client)
+
+    def test_property(self):
+        gears = self.part.properties[0]
+
+        self.assertIs(self.part.property("Gears"), gears)
+        self.assertIs(self.part.property("gEARS"), gears)
+        self.assertIs(self.part.property(gears.id), gears)
+        self.assertIs(self.part.property("frame-color"), self.part.properties[1])
+
+        with self.assertRaises(MultipleFoundError):
+            self.part.property("wheel size")
+        with self.assertRaises(NotFoundError):
+            self.part.property("Saddle")
+        with self.assertRaises(NotFoundError):
+            self.part.property(str(uuid.uuid4()))
+
+    def test_added_and_removed_properties(self):
+        self.part.property("Gears")
+
+        saddle = Property.create(property_json("Saddle"), client=self.client)
+        self.part.properties.append(saddle)
+        self.assertIs(self.part.property("Saddle"), saddle)
+
+        self.part.properties.remove(saddle)
+        with self.assertRaises(NotFoundError):
+            self.part.property("Saddle")
+
+        self.part.properties = [saddle]
+        self.assertIs(self.part.property(saddle.id), saddle)
+
+    def test_replaced_property(self):
+        gears = self.part.property("Gears")
+
+        saddle = Property.create(property_json("Saddle"), client=self.client)
+        self.part.properties[0] = saddle
+
+        with self.assertRaises(NotFoundError):
+            self.part.property("Gears")
+        with self.assertRaises(NotFoundError):
+            self.part.property(gears.id)
+        self.assertIs(self.part.property("Saddle"), saddle)
+        self.assertIs(self.part.property(saddle.id), saddle)
+
+        color = self.part.properties[1]
+        self.part.properties[1] = Property.create(
+            property_json("Frame color"), client=self.client
+        )
+        self.assertIsNot(self.part.property("Frame color"), color)
+
+    def test_refresh(self):
+        gears = self.part.property("Gears")
+
+        json = dict(self.json, properties=self.json["properties"][:2])
+        json["properties"][0] = dict(json["properties"][0], name="Speeds")
+        self.part.refresh(json=json)
+
+        self.assertIs(self.part.property("Speeds"), gears)
+        with self.assertRaises(NotFoundError):
+            self.part.property("Gears")
+        with self.assertRaises(NotFoundError):
+            self.part.property("Wheel size")
+
+    def test_renamed_property(self):
+        gears = self.part.property("Gears")
+
+        gears.refresh(json=dict(gears._json_data, name="Speeds"))
+
+        self.assertIs(self.part.property("Speeds"), gears)
+        with self.assertRaises(NotFoundError):
+            self.part.property("Gears")
+
+    def test_parse_update_dict(self):
+        gears, color = self.part.properties[:2]
+
+        properties_fvalues, _, parsed = Part._parse_update_dict(
+            self.part, None, {"gears": "11", color.id: "Red"}
+        )
+
+        self.assertEqual(
+            properties_fvalues,
+            [dict(value="11", id=gears.id), dict(value="Red", id=color.id)],
+        )
+        self.assertEqual(parsed, {gears.id: "11", color.id: "Red"})
+
+    def test_map_property_instances(self):
+        names = ["Gears", "Frame color"]
+        model, new_model, original, new = [
+            Part(
+                part_json("Bike", properties=names, category=category),
+                client=self.client,
+            )
+            for category in ["MODEL", "MODEL", "INSTANCE", "INSTANCE"]
+        ]
+        for part, model_part in [(original, model), (new, new_model)]:
+            for prop, prop_model in zip(part.properties, model_part.properties):
+                prop._json_data["model_id"] = prop_model.id
+
+        mapping = get_mapping_dictionary()
+        for prop_model, new_prop_model in zip(model.properties, new_model.properties):
+            mapping[prop_model.id] = new_prop_model
+
+        map_property_instances(original, new)
+
+        self.assertIs(mapping[original.id], new)
+        self.assertIs(mapping[original.properties[1].id], new.properties[1])
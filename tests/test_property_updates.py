@@ -0,0 +1,204 @@
+import threading
+from unittest import mock
+
+import requests
+
+from pykechain import Client
+from pykechain.exceptions import APIError, PropertiesUpdateError
+from pykechain.models import Property
+from tests.classes import TestStubServer, property_json
+
+
+class PropertiesStubServer(TestStubServer):
+    def setUp(self):
+        super().setUp()
+        self.properties = {p["id"]: p for p in (property_json(f"Property {i}") for i in range(25))}
+        self.server.add_route(
+            "POST", "api/v3/properties/bulk_update", self.properties_handler
+        )
+
+    def tearDown(self):
+        Property.set_bulk_update(False)
+        super().tearDown()
+
+    def properties_handler(self, request):
+        results = [dict(self.properties[u["id"]], **u) for u in request.json]
+        return 200, dict(results=results), None
+
+    def property_objects(self, client=None):
+        return [
+            Property.create(json=p, client=client or self.client)
+            for p in self.properties.values()
+        ]
+
+    def sent_updates(self):
+        return [
+            r.json
+            for r in self.server.requests_to("api/v3/properties/bulk_update", "POST")
+        ]
+
+
+class TestPropertyUpdateBuffer(PropertiesStubServer):
+    def test_updates_are_sent_in_chunks_at_the_end(self):
+        props = self.property_objects()
+
+        with self.client.bulk_update_properties(flush_size=None, chunk_size=10):
+            for prop in props:
+                prop.value = "new"
+            props[0].value = "newer"
+            self.assertEqual(len(self.server.requests), 0)
+
+        self.assertEqual([len(updates) for updates in self.sent_updates()], [10, 10, 5])
+        self.assertEqual(self.sent_updates()[0][0], dict(id=props[0].id, value="newer"))
+
+    def test_updates_are_sent_when_the_buffer_is_full(self):
+        props = self.property_objects()
+
+        with self.client.bulk_update_properties(flush_size=10) as buffer:
+            for prop in props[:15]:
+                prop.value = "new"
+            self.assertEqual(len(self.sent_updates()), 1)
+            self.assertEqual(len(buffer), 5)
+
+        self.assertEqual([len(updates) for updates in self.sent_updates()], [10, 5])
+
+    def test_nothing_is_sent_on_an_exception(self):
+        prop = self.property_objects()[0]
+
+        with self.assertRaises(ValueError):
+            with self.client.bulk_update_properties():
+                prop.value = "new"
+                raise ValueError
+
+        self.assertEqual(self.sent_updates(), [])
+
+    def test_buffers_of_worker_threads_are_separate(self):
+        props = self.property_objects()
+        barrier = threading.Barrier(2, timeout=5)
+
+        def job(job_props):
+            with self.client.bulk_update_properties(flush_size=None):
+                for prop in job_props:
+                    prop.value = "new"
+                barrier.wait()  # both buffers are filled at the same time
+
+        workers = [
+            threading.Thread(target=job, args=(props[:10],)),
+            threading.Thread(target=job, args=(props[10:],)),
+        ]
+        for worker in workers:
+            worker.start()
+        for worker in workers:
+            worker.join()
+
+        self.assertEqual(
+            sorted(len(updates) for updates in self.sent_updates()), [10, 15]
+        )
+        self.assertIsNone(self.client._pending_property_updates())
+
+    def test_buffer_is_shared_safely_by_threads(self):
+        props = self.property_objects()
+        buffer = self.client.bulk_update_properties(flush_size=None)
+
+        def job():
+            for prop in props:
+                buffer.add(prop, value=threading.current_thread().name)
+
+        workers = [threading.Thread(target=job) for _ in range(4)]
+        for worker in workers:
+            worker.start()
+        for worker in workers:
+            worker.join()
+
+        self.assertEqual(len(buffer), 25)
+        buffer.flush()
+        self.assertEqual(len(self.sent_updates()[0]), 25)
+
+    def test_set_bulk_update_keeps_the_updates_per_client(self):
+        other_client = Client(url=self.server.url)
+        props = self.property_objects()
+        other_props = self.property_objects(client=other_client)
+
+        Property.set_bulk_update(True)
+        props[0].value = "mine"
+        other_props[1].value = "theirs"
+        Property.update_values(client=self.client)
+
+        self.assertEqual(self.sent_updates(), [[dict(id=props[0].id, value="mine")]])
+        self.assertEqual(len(other_client._property_updates), 1)
+
+
+class TestUpdateProperties(PropertiesStubServer):
+    def setUp(self):
+        super().setUp()
+        self.updates = [dict(id=pk, value="new") for pk in self.properties]
+
+    def test_chunks(self):
+        properties = self.client.update_properties(self.updates, chunk_size=10)
+
+        self.assertEqual([len(updates) for updates in self.sent_updates()], [10, 10, 5])
+        self.assertEqual([p.id for p in properties], list(self.properties))
+        self.assertTrue(all(p.value == "new" for p in properties))
+
+    def test_concurrent_chunks(self):
+        barrier = threading.Barrier(3, timeout=5)
+
+        def handler(request):
+            barrier.wait()  # all chunks must be in flight together
+            return self.properties_handler(request)
+
+        self.server.add_route("POST", "api/v3/properties/bulk_update", handler)
+
+        properties = self.client.update_properties(
+            self.updates, chunk_size=10, concurrency=3
+        )
+
+        self.assertEqual([p.id for p in properties], list(self.properties))
+
+    def test_without_objects(self):
+        result = self.client.update_properties(self.updates, return_objects=False)
+
+        self.assertIsNone(result)
+        self.assertEqual(len(self.sent_updates()), 1)
+
+    def test_failed_chunks_are_reported(self):
+        refused_id = self.updates[12]["id"]
+
+        def handler(request):
+            if any(update["id"] == refused_id for update in request.json):
+                return 400, dict(msg="Invalid value"), None
+            return self.properties_handler(request)
+
+        self.server.add_route("POST", "api/v3/properties/bulk_update", handler)
+
+        with self.assertRaisesRegex(
+            APIError, f"(?s)1 out of 3 chunk.*chunk 1 .*{refused_id}.*Invalid value"
+        ) as context:
+            self.client.update_properties(self.updates, chunk_size=10)
+
+        self.assertEqual(len(self.sent_updates()), 3)
+        error = context.exception
+        self.assertIsInstance(error, PropertiesUpdateError)
+        updated_ids = [u["id"] for u in self.updates[:10] + self.updates[20:]]
+        self.assertEqual([p.id for p in error.updated], updated_ids)
+        self.assertEqual(error.updated_ids, updated_ids)
+        self.assertEqual(error.failed_ids, [u["id"] for u in self.updates[10:20]])
+
+    def test_chunk_without_response(self):
+        request = self.client._request
+
+        def failing_request(method, url, **kwargs):
+            if any(u["id"] == self.updates[0]["id"] for u in kwargs["json"]):
+                raise requests.ConnectionError("Connection refused")
+            return request(method, url, **kwargs)
+
+        with mock.patch.object(self.client, "_request", side_effect=failing_request):
+            with self.assertRaisesRegex(
+                PropertiesUpdateError, "chunk 0 .*Connection refused"
+            ) as context:
+                self.client.update_properties(
+                    self.updates, chunk_size=10, return_objects=False
+                )
+
+        self.assertEqual(context.exception.updated, [])
+        self.assertEqual(len(context.exception.updated_ids), 15)
@@ -0,0 +1,73 @@
+from unittest.mock import patch
+
+from pykechain.models import Part
+from tests.classes import TestStubServer, part_json, property_json
+
+
+class TestConditionalReload(TestStubServer):
+    def setUp(self):
+        super().setUp()
+        self.part_json = part_json(
+            "Bike",
+            updated_at="2024-07-02T10:20:30.123456+00:00",
+            properties=[property_json("Gears", property_type="INT_VALUE", value=6)],
+        )
+        self.part_id = self.part_json["id"]
+        self.path = f"api/v3/parts/{self.part_id}.json"
+        self.etag = '"v1"'
+
+        def handler(request):
+            if request.headers.get("If-None-Match") == self.etag:
+                return 304, None, dict(ETag=self.etag)
+            return 200, dict(results=[self.part_json]), dict(ETag=self.etag)
+
+        self.server.add_route("GET", self.path, handler)
+        self.part = Part(self.part_json, client=self.client)
+
+    def test_updated_at_used_without_validators(self):
+        self.part.refresh()
+
+        self.assertEqual(
+            self.server.requests_to(self.path)[0].headers["If-Modified-Since"],
+            "Tue, 02 Jul 2024 10:20:30 GMT",
+        )
+        self.assertEqual(self.part._etag, self.etag)
+
+    def test_not_modified_keeps_the_object_untouched(self):
+        self.part.refresh()
+        gears = self.part.property("Gears")
+        json_data = self.part._json_data
+
+        with patch.object(Part, "__init__") as init:
+            self.part.refresh()
+
+        init.assert_not_called()
+        self.assertEqual(
+            self.server.requests_to(self.path)[-1].headers["If-None-Match"], self.etag
+        )
+        self.assertIs(self.part._json_data, json_data)
+        self.assertIs(self.part.property("Gears"), gears)
+        self.assertIs(self.client.reload(self.part), self.part)
+
+    def test_modified_object_is_refreshed(self):
+        self.part.refresh()
+        gears = self.part.property("Gears")
+
+        self.etag = '"v2"'
+        self.part_json = dict(self.part_json, name="Racing bike")
+        self.part.refresh()
+
+        self.assertEqual(self.part.name, "Racing bike")
+        self.assertEqual(self.part._etag, '"v2"')
+        self.assertIs(self.part.property("Gears"), gears)
+
+    def test_refresh_with_json_resets_validators(self):
+        self.part.refresh()
+
+        self.part.refresh(json=dict(self.part_json, updated_at=None))
+
+        self.assertIsNone(self.part._etag)
+        self.part.refresh()
+        self.assertNotIn(
+            "If-None-Match", self.server.requests_to(self.path)[-1].headers
+        )
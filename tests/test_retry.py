@@ -1,16 +1,24 @@
+import threading
+import time
+import uuid
+from email.utils import formatdate
 from ssl import SSLError
 
 from unittest import TestCase
 
-from pykechain.client_utils import PykeRetry
+from pykechain.client_utils import AdaptiveRateLimiter, PykeRetry, parse_retry_after
 from pykechain.defaults import (
     RETRY_BACKOFF_FACTOR,
     RETRY_ON_CONNECTION_ERRORS,
     RETRY_ON_READ_ERRORS,
     RETRY_ON_REDIRECT_ERRORS,
+    RETRY_ON_STATUS_CODES,
+    RETRY_ON_STATUS_ERRORS,
     RETRY_TOTAL,
 )
+from pykechain.exceptions import APIError, NotFoundError
 from urllib3.exceptions import MaxRetryError
+from tests.classes import TestStubServer
 
 
 class TestPykeRetry(TestCase):
@@ -31,3 +39,118 @@ class TestPykeRetry(TestCase):
                     " certificate"
                 )
             )
+
+    def test_retry_any_method_when_throttled(self):
+        retry = PykeRetry(total=RETRY_TOTAL, status_forcelist=RETRY_ON_STATUS_CODES)
+
+        self.assertTrue(retry.is_retry("POST", 429))
+        self.assertTrue(retry.is_retry("PUT", 503))
+        self.assertTrue(retry.is_retry("POST", 503, has_retry_after=True))
+        self.assertFalse(retry.is_retry("POST", 503))
+        self.assertFalse(retry.is_retry("POST", 500))
+
+    def test_parse_retry_after(self):
+        self.assertEqual(parse_retry_after("3"), 3.0)
+        self.assertAlmostEqual(
+            parse_retry_after(formatdate(time.time() + 30, usegmt=True)), 30, delta=2
+        )
+        self.assertIsNone(parse_retry_after(None))
+        self.assertIsNone(parse_retry_after("soon"))
+
+
+class TestAdaptiveRateLimiter(TestCase):
+    def test_additive_increase(self):
+        limiter = AdaptiveRateLimiter(initial_concurrency=2, max_concurrency=3)
+
+        for _ in range(10):
+            with limiter:
+                pass
+
+        self.assertEqual(limiter.concurrency, 3)
+
+    def test_multiplicative_decrease(self):
+        limiter = AdaptiveRateLimiter(initial_concurrency=8)
+
+        limiter.acquire()
+        limiter.release(throttled=True)
+
+        self.assertEqual(limiter.concurrency, 4)
+        self.assertEqual(limiter.throttled, 1)
+
+    def test_limits_requests_in_flight(self):
+        limiter = AdaptiveRateLimiter(initial_concurrency=1)
+        limiter.acquire()
+        acquired = threading.Event()
+
+        def acquire():
+            limiter.acquire()
+            acquired.set()
+
+        thread = threading.Thread(target=acquire)
+        thread.start()
+        self.assertFalse(acquired.wait(0.1))
+
+        limiter.release()
+        self.assertTrue(acquired.wait(5))
+        thread.join()
+
+    def test_retry_after_blocks_new_requests(self):
+        limiter = AdaptiveRateLimiter()
+
+        limiter.throttle(retry_after=0.2)
+        start = time.monotonic()
+        limiter.acquire()
+
+        self.assertGreaterEqual(time.monotonic() - start, 0.15)
+
+
+class TestThrottledRequests(TestStubServer):
+    def test_throttled_request_is_retried(self):
+        responses = [(429, dict(detail="slow down"), {"Retry-After": "0"})]
+
+        def handler(request):
+            if responses:
+                return responses.pop()
+            return 200, dict(results=[], next=None), None
+
+        self.server.add_route("POST", "api/v3/properties/bulk_update", handler)
+        limiter = self.client.enable_rate_limiter(initial_concurrency=4)
+
+        self.client.update_properties([dict(id=str(uuid.uuid4()), value=1)])
+
+        self.assertEqual(
+            len(self.server.requests_to("api/v3/properties/bulk_update", "POST")), 2
+        )
+        self.assertEqual(limiter.throttled, 1)
+        self.assertEqual(limiter.in_flight, 0)
+        self.assertEqual(self.client.stats()["properties_bulk_update"]["retries"], 1)
+
+    def test_persistently_throttled_request(self):
+        self.server.add_route(
+            "GET",
+            "api/v3/scopes.json",
+            lambda request: (429, dict(detail="slow down"), {"Retry-After": "0"}),
+        )
+        limiter = self.client.enable_rate_limiter(initial_concurrency=16)
+
+        with self.assertRaises(NotFoundError):
+            self.client.scopes()
+
+        requests = self.server.requests_to("api/v3/scopes.json")
+        self.assertEqual(len(requests), 1 + RETRY_ON_STATUS_ERRORS)
+        self.assertEqual(limiter.throttled, len(requests))
+        self.assertEqual(limiter.concurrency, 16 * 0.5 ** len(requests))
+
+    def test_unavailable_post_is_not_sent_again(self):
+        self.server.add_route(
+            "POST",
+            "api/v3/properties/bulk_update",
+            lambda request: (503, dict(detail="unavailable"), None),
+        )
+
+        with self.assertRaises(APIError):
+            self.client.update_properties([dict(id=str(uuid.uuid4()), value=1)])
+
+        self.assertEqual(
+            len(self.server.requests_to("api/v3/properties/bulk_update", "POST")), 1
+        )
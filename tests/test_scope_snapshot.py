@@ -0,0 +1,377 @@
+import uuid
+
+from pykechain.exceptions import IllegalArgumentError, MultipleFoundError, NotFoundError
+from pykechain.models import Scope
+from pykechain.utils import parse_datetime
+from tests.classes import TestStubServer, part_json, property_json
+
+
+class TestScopeSnapshot(TestStubServer):
+    def setUp(self):
+        super().setUp()
+        self.scope = Scope(
+            dict(id=str(uuid.uuid4()), name="Bike project"), client=self.client
+        )
+
+        product_model = part_json("Product", category="MODEL")
+        bike_model = part_json(
+            "Bike",
+            parent_id=product_model["id"],
+            properties=["Gears"],
+            category="MODEL",
+        )
+        wheel_model = part_json(
+            "Wheel",
+            parent_id=bike_model["id"],
+            properties=["Diameter", "Spokes"],
+            category="MODEL",
+        )
+        product = part_json("Product", model_id=product_model["id"])
+        bike = part_json(
+            "Bike",
+            parent_id=product["id"],
+            model_id=bike_model["id"],
+            properties=["Gears"],
+        )
+        front_wheel = part_json(
+            "Wheel",
+            parent_id=bike["id"],
+            model_id=wheel_model["id"],
+            properties=["Diameter"],
+        )
+        rear_wheel = part_json(
+            "Wheel",
+            parent_id=bike["id"],
+            model_id=wheel_model["id"],
+            properties=["Diameter"],
+        )
+        self.models = [product_model, bike_model, wheel_model]
+        self.instances = [product, bike, front_wheel, rear_wheel]
+
+        root = dict(
+            id=str(uuid.uuid4()),
+            name="WORKFLOW_ROOT",
+            ref="workflow-root",
+            parent_id=None,
+        )
+        task = dict(
+            id=str(uuid.uuid4()), name="Specify", ref="specify", parent_id=root["id"]
+        )
+        self.activities = [root, task]
+
+        self.server.add_route("GET", "api/v3/parts.json", self.parts_handler)
+        self.server.add_list_route("api/activities.json", self.activities)
+
+        self.snapshot = self.scope.snapshot()
+
+    def parts_handler(self, request):
+        results = (
+            self.models if request.params["category"] == "MODEL" else self.instances
+        )
+        return 200, dict(count=len(results), next=None, results=results), None
+
+    def test_retrieval(self):
+        requests = self.server.requests
+        self.assertEqual(len(requests), 3)
+        self.assertTrue(all(r.params["scope_id"] == self.scope.id for r in requests))
+        self.assertEqual(len(self.snapshot), 7 + 6 + 2)
+
+    def test_parts(self):
+        bike = self.snapshot.part(name="Bike")
+
+        self.assertEqual(bike.id, self.instances[1]["id"])
+        self.assertEqual(self.snapshot.model(ref="bike").id, self.models[1]["id"])
+        self.assertIs(self.snapshot.part(pk=bike.id), bike)
+        self.assertIs(self.snapshot.get(bike.id), bike)
+        self.assertIn(bike, self.snapshot)
+        self.assertEqual(len(self.snapshot.parts(name="Wheel")), 2)
+        self.assertEqual(len(self.snapshot.parts(name="Wheel", category=None)), 3)
+        self.assertEqual(len(self.snapshot.parts(category="MODEL")), 3)
+        self.assertEqual(
+            self.snapshot.parts(name="Wheel", parent=bike), bike.children()
+        )
+
+        with self.assertRaises(MultipleFoundError):
+            self.snapshot.part(name="Wheel")
+        with self.assertRaises(NotFoundError):
+            self.snapshot.part(name="Saddle")
+        with self.assertRaises(NotFoundError):
+            self.snapshot.get(str(uuid.uuid4()))
+        with self.assertRaises(IllegalArgumentError):
+            self.snapshot.parts(category="ASSEMBLY")
+
+    def test_path(self):
+        wheel_model = self.snapshot.model(path="Product/Bike/Wheel")
+
+        self.assertEqual(wheel_model.id, self.models[2]["id"])
+        self.assertEqual(len(self.snapshot.parts(path=["Product", "Bike", "Wheel"])), 2)
+        self.assertEqual(self.snapshot.parts(path="Bike/Wheel"), [])
+
+    def test_tree(self):
+        bike = self.snapshot.part(name="Bike")
+
+        self.assertEqual(
+            [c.id for c in bike.children()], [p["id"] for p in self.instances[2:]]
+        )
+        self.assertIs(bike.children()[0].parent(), bike)
+        self.assertIs(
+            self.snapshot.child(bike, pk=self.instances[2]["id"]), bike.children()[0]
+        )
+        self.assertIs(self.snapshot.children(bike.id), bike.children())
+        with self.assertRaises(MultipleFoundError):
+            self.snapshot.child(bike, name="Wheel")
+        with self.assertRaises(IllegalArgumentError):
+            self.snapshot.child(bike)
+        self.assertEqual(len(self.server.requests), 3)
+
+    def test_instances(self):
+        wheel_model = self.snapshot.model(name="Wheel")
+
+        self.assertEqual(
+            [p.id for p in self.snapshot.instances(wheel_model)],
+            [p["id"] for p in self.instances[2:]],
+        )
+        self.assertEqual(
+            self.snapshot.parts(model=wheel_model.id),
+            self.snapshot.instances(wheel_model),
+        )
+
+    def test_properties(self):
+        wheel_model = self.snapshot.model(name="Wheel")
+        spokes = self.snapshot.property("spokes", part=wheel_model)
+
+        self.assertIs(spokes, wheel_model.property("Spokes"))
+        self.assertIs(self.snapshot.property(spokes.id), spokes)
+        self.assertIs(
+            self.snapshot.property("Diameter", part=wheel_model.id),
+            wheel_model.properties[0],
+        )
+
+        with self.assertRaises(NotFoundError):
+            self.snapshot.property(spokes.id, part=self.snapshot.part(name="Bike"))
+        with self.assertRaises(NotFoundError):
+            self.snapshot.property(wheel_model.id)
+        with self.assertRaises(IllegalArgumentError):
+            self.snapshot.property("Spokes")
+
+    def test_unnamed_property(self):
+        bike = self.instances[1]
+        unnamed = dict(property_json("Unnamed", part_id=bike["id"], order=1), name=None)
+        bike["properties"].append(unnamed)
+
+        self.snapshot.refresh()
+
+        prop = self.snapshot.property("unnamed", part=bike["id"])
+        self.assertEqual(prop.id, unnamed["id"])
+        self.assertIsNone(prop.name)
+        self.assertIs(self.snapshot.property(unnamed["id"]), prop)
+        self.assertEqual(self.snapshot.property("Gears", part=bike["id"]).name, "Gears")
+
+    def test_activities(self):
+        task = self.snapshot.activity(name="Specify")
+
+        self.assertEqual(self.snapshot.activity(ref="specify"), task)
+        self.assertIs(self.snapshot.activity(pk=task.id), task)
+        self.assertEqual(task.parent().name, "WORKFLOW_ROOT")
+        self.assertEqual(len(self.snapshot.activities()), 2)
+
+    def test_refresh(self):
+        self.instances[1]["name"] = "Racing bike"
+
+        self.snapshot.refresh()
+
+        self.assertEqual(len(self.server.requests), 6)
+        self.assertEqual(
+            self.snapshot.part(name="Racing bike").id, self.instances[1]["id"]
+        )
+        self.assertEqual(self.snapshot.parts(name="Bike"), [])
+        self.assertEqual(len(self.snapshot.parts(path="Product/Racing bike/Wheel")), 2)
+
+    def test_without_activities(self):
+        snapshot = self.scope.snapshot(activities=False)
+
+        self.assertEqual(snapshot.activities(), [])
+        self.assertEqual(len(self.server.requests_to("api/activities.json")), 1)
+
+
+class TestScopeSnapshotSync(TestStubServer):
+    def setUp(self):
+        super().setUp()
+        self.scope = Scope(
+            dict(id=str(uuid.uuid4()), name="Bike project"), client=self.client
+        )
+        bike = part_json("Bike")
+        front_wheel = part_json("Wheel", parent_id=bike["id"], properties=["Diameter"])
+        rear_wheel = part_json("Wheel", parent_id=bike["id"], properties=["Diameter"])
+        self.parts = [bike, front_wheel, rear_wheel]
+        self.default_category = None
+        self.activities = [
+            dict(id=str(uuid.uuid4()), name=name, ref=name.lower(), parent_id=None)
+            for name in ["Specify", "Design"]
+        ]
+        for obj in self.all_objects():
+            obj["updated_at"] = "2024-07-01T10:00:00Z"
+
+        self.add_route("api/v3/parts.json", lambda: self.parts)
+        self.add_route(
+            "api/v3/properties.json",
+            lambda: [prop for part in self.parts for prop in part["properties"]],
+        )
+        self.add_route("api/activities.json", lambda: self.activities)
+
+        self.snapshot = self.scope.snapshot()
+        self.server.requests.clear()
+
+    def all_objects(self):
+        properties = [prop for part in self.parts for prop in part["properties"]]
+        return self.parts + properties + self.activities
+
+    def add_route(self, path, objects):
+        def handler(request):
+            results = objects()
+            category = request.params.get("category")
+            if category is None and path != "api/activities.json":
+                category = self.default_category
+            if category:
+                results = [r for r in results if r["category"] == category]
+            if "updated_at__gte" in request.params:
+                since = parse_datetime(request.params["updated_at__gte"])
+                results = [
+                    r for r in results if parse_datetime(r["updated_at"]) >= since
+                ]
+            if request.params.get("fields") == "id":
+                results = [dict(id=r["id"]) for r in results]
+            return 200, dict(count=len(results), next=None, results=results), None
+
+        self.server.add_route("GET", path, handler)
+
+    def test_sync(self):
+        bike, front_wheel = (
+            self.snapshot.parts(name="Bike")
+            + self.snapshot.parts(path="Bike/Wheel")[:1]
+        )
+        diameter = front_wheel.property("Diameter")
+        self.assertEqual(
+            self.snapshot.watermark, parse_datetime("2024-07-01T10:00:00Z")
+        )
+
+        updated_at = "2024-07-02T10:00:00Z"
+        self.parts[0].update(name="Racing bike", updated_at=updated_at)
+        self.parts[1]["properties"][0].update(value=28, updated_at=updated_at)
+        del self.parts[2]
+        saddle = part_json(
+            "Saddle", parent_id=self.parts[0]["id"], properties=["Height"]
+        )
+        saddle["updated_at"] = saddle["properties"][0]["updated_at"] = updated_at
+        self.parts.append(saddle)
+        del self.activities[1]
+
+        result = self.snapshot.sync()
+
+        changed_requests = [
+            r for r in self.server.requests if "updated_at__gte" in r.params
+        ]
+        self.assertEqual(len(changed_requests), 5)
+        self.assertTrue(
+            all(
+                r.params["updated_at__gte"] == "2024-07-01T10:00:00+00:00"
+                for r in changed_requests
+            )
+        )
+        self.assertEqual(
+            len([r for r in self.server.requests if r.params.get("fields") == "id"]), 5
+        )
+
+        self.assertIs(self.snapshot.part(name="Racing bike"), bike)
+        self.assertIs(self.snapshot.property("Diameter", part=front_wheel), diameter)
+        self.assertEqual(diameter.value, 28)
+        self.assertEqual([c.name for c in bike.children()], ["Wheel", "Saddle"])
+        self.assertIs(self.snapshot.part(path="Racing bike/Saddle").parent(), bike)
+        self.assertEqual(len(self.snapshot.activities()), 1)
+        self.assertEqual(len(self.snapshot), 3 + 2 + 1)
+
+        self.assertEqual(sorted(o.name for o in result.created), ["Height", "Saddle"])
+        self.assertEqual(
+            sorted(o.name for o in result.updated), ["Diameter", "Racing bike"]
+        )
+        self.assertEqual(
+            sorted(o.name for o in result.deleted), ["Design", "Diameter", "Wheel"]
+        )
+        self.assertEqual(self.snapshot.watermark, parse_datetime(updated_at))
+
+        self.assertFalse(self.snapshot.sync())
+
+    def test_deleted_property(self):
+        front_wheel = self.snapshot.parts(path="Bike/Wheel")[0]
+        del self.parts[1]["properties"][0]
+
+        result = self.snapshot.sync()
+
+        self.assertEqual([p.name for p in result.deleted], ["Diameter"])
+        self.assertEqual(result.updated, [])
+        self.assertEqual(front_wheel.properties, [])
+
+    def test_deletions_with_the_filters_of_the_snapshot(self):
+        bike_model = part_json("Bike", properties=["Gears"], category="MODEL")
+        bike_model["updated_at"] = "2024-07-01T10:00:00Z"
+        bike_model["properties"][0]["updated_at"] = "2024-07-01T10:00:00Z"
+        self.parts.append(bike_model)
+        self.snapshot.refresh()
+        # the server filters on the category of the parts and properties when none is requested
+        self.default_category = "INSTANCE"
+
+        self.assertFalse(self.snapshot.sync())
+        self.assertEqual(self.snapshot.model(name="Bike").id, bike_model["id"])
+        self.assertEqual(
+            sorted(
+                r.params["category"]
+                for r in self.server.requests
+                if r.params.get("fields") == "id" and "category" in r.params
+            ),
+            ["INSTANCE", "INSTANCE", "MODEL", "MODEL"],
+        )
+
+    def test_unchanged_objects_at_the_watermark(self):
+        # the properties are retrieved with a field that the properties of the parts do not have
+        self.add_route(
+            "api/v3/properties.json",
+            lambda: [
+                dict(prop, unit="mm")
+                for part in self.parts
+                for prop in part["properties"]
+            ],
+        )
+        diameter = self.snapshot.parts(path="Bike/Wheel")[0].property("Diameter")
+
+        self.assertFalse(self.snapshot.sync())
+        self.assertNotIn("unit", diameter._json_data)
+
+    def test_sync_with_identity_map(self):
+        self.client.enable_identity_map()
+        self.addCleanup(self.client.disable_identity_map)
+        snapshot = self.scope.snapshot()
+        bike = snapshot.part(name="Bike")
+
+        self.parts[0].update(name="Racing bike", updated_at="2024-07-02T10:00:00Z")
+        result = snapshot.sync()
+
+        self.assertEqual(result.updated, [bike])
+        self.assertEqual(bike.name, "Racing bike")
+
+    def test_without_deletions(self):
+        del self.parts[2]
+
+        self.assertFalse(self.snapshot.sync(deletions=False))
+        self.assertEqual(len(self.server.requests), 5)
+        self.assertEqual(len(self.snapshot.parts(name="Wheel")), 2)
+
+    def test_without_watermark(self):
+        self.parts, self.activities = [], []
+        snapshot = self.scope.snapshot()
+        self.assertIsNone(snapshot.watermark)
+
+        self.parts.append(part_json("Bike"))
+        result = snapshot.sync()
+
+        self.assertEqual([p.name for p in result.created], ["Bike"])
+        self.assertEqual(len(snapshot), 1)
@@ -18,10 +18,26 @@ from pykechain.exceptions import (
 
 # new in 1.13
 from pykechain.models import Service
+from pykechain.models.base import JsonAttribute
 from pykechain.utils import temp_chdir
 from tests.classes import TestBetamax
 
 
+def public_attributes(obj):
+    """Return the public attributes of a model, including the ones read from its json data."""
+    names = [
+        name
+        for name in dir(type(obj))
+        if isinstance(getattr(type(obj), name), JsonAttribute)
+    ]
+    names += [name for name in vars(obj) if name not in names]
+    return {
+        name: getattr(obj, name)
+        for name in names
+        if not name.startswith("_") and hasattr(obj, name)
+    }
+
+
 class TestServiceSetup(TestBetamax):
     """Only for test setup, will create a service with a debug script
 
@@ -126,7 +142,7 @@ class TestServices(TestBetamax):
         service_name = "Service Gears - Successful with Package"
         service = self.project.service(name=service_name)
 
-        for key, value in service.__dict__.items():
+        for key, value in public_attributes(service).items():
             if str(key).startswith("_"):
                 continue
 
@@ -424,7 +440,7 @@ class TestServiceExecutions(TestServiceSetup):
         self.assertIsInstance(service_execution.started_at, datetime)
         self.assertIsInstance(service_execution.finished_at, datetime)
 
-        for key, value in service_execution.__dict__.items():
+        for key, value in public_attributes(service_execution).items():
             if str(key).startswith("_"):
                 continue
 
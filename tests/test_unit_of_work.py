@@ -0,0 +1,163 @@
+import uuid
+
+from pykechain.exceptions import APIError
+from pykechain.models import Activity, Part, Property
+from pykechain.models.widgets import Widget
+from tests.classes import TestStubServer, part_json, property_json
+
+
+class TestUnitOfWork(TestStubServer):
+    def setUp(self):
+        super().setUp()
+        self.properties = {
+            p["id"]: p for p in (property_json(f"Property {i}") for i in range(250))
+        }
+        self.refused_ids = set()
+        self.server.add_route(
+            "POST", "api/v3/properties/bulk_update", self.properties_handler
+        )
+
+    def properties_handler(self, request):
+        if any(update["id"] in self.refused_ids for update in request.json):
+            return 400, dict(msg="Invalid value"), None
+        results = [dict(self.properties[u["id"]], **u) for u in request.json]
+        return 200, dict(results=results), None
+
+    def property_objects(self):
+        return [
+            Property.create(json=p, client=self.client)
+            for p in self.properties.values()
+        ]
+
+    def test_property_values_are_sent_in_chunks(self):
+        props = self.property_objects()
+
+        with self.client.unit_of_work() as uow:
+            for prop in props:
+                prop.value = f"{prop.name} value"
+            self.assertEqual(len(uow), 250)
+            self.assertEqual(len(self.server.requests), 0)
+
+        requests = self.server.requests_to("api/v3/properties/bulk_update", "POST")
+        self.assertEqual([len(r.json) for r in requests], [100, 100, 50])
+        self.assertEqual(len(self.server.requests), 3)
+        self.assertEqual(props[0].value, "Property 0 value")
+        self.assertIsNone(self.client._active_unit_of_work())
+
+    def test_updates_of_the_same_property_are_merged(self):
+        prop = self.property_objects()[0]
+
+        with self.client.unit_of_work(chunk_size=10) as uow:
+            prop.value = "first"
+            prop.value = "second"
+            result = uow.update_property(prop.id, description="merged")
+
+        (request,) = self.server.requests
+        self.assertEqual(
+            request.json, [dict(id=prop.id, value="second", description="merged")]
+        )
+        self.assertIs(result.result(), prop)
+
+    def test_refused_chunk_is_written_one_by_one(self):
+        props = self.property_objects()[:5]
+        self.refused_ids.add(props[2].id)
+
+        with self.assertRaisesRegex(APIError, props[2].id):
+            with self.client.unit_of_work(chunk_size=5) as uow:
+                results = [uow.update_property(p, value="new") for p in props]
+
+        self.assertEqual(len(self.server.requests), 6)
+        self.assertEqual(uow.failures, [results[2]])
+        with self.assertRaises(APIError):
+            results[2].result()
+        self.assertEqual(results[3].result().value, "new")
+
+    def test_failures_without_raising(self):
+        prop = self.property_objects()[0]
+        self.refused_ids.add(prop.id)
+
+        with self.client.unit_of_work(raise_on_failure=False) as uow:
+            uow.update_property(prop, value="new")
+
+        self.assertEqual(len(uow.failures), 1)
+        self.assertEqual(uow.failures[0].kind, "update property")
+
+    def test_nothing_is_sent_on_an_exception(self):
+        prop = self.property_objects()[0]
+
+        with self.assertRaises(ValueError):
+            with self.client.unit_of_work():
+                prop.value = "new"
+                raise ValueError
+
+        self.assertEqual(len(self.server.requests), 0)
+
+    def test_creates_are_sent_before_updates(self):
+        model = Part(
+            dict(
+                id=str(uuid.uuid4()),
+                name="Wheel",
+                category="MODEL",
+                properties=[property_json("Property 0", category="MODEL")],
+            ),
+            client=self.client,
+        )
+        bike = Part(part_json("Bike"), client=self.client)
+        wheel_json = part_json("Front wheel")
+        activity = Activity(
+            dict(id=str(uuid.uuid4()), name="Design", status="OPEN"),
+            client=self.client,
+        )
+        self.client._widget_schemas = [dict(widget_type="HTML", schema=dict())]
+        widget = Widget(
+            dict(id=str(uuid.uuid4()), widget_type="HTML", meta=dict()),
+            client=self.client,
+        )
+        self.server.add_json_route(
+            "POST",
+            "api/v3/parts/bulk_create_part_instances",
+            dict(results=[dict(parts_created=[wheel_json["id"]])]),
+            status=201,
+        )
+        self.server.add_list_route("api/v3/parts.json", [wheel_json])
+        self.server.add_route(
+            "PUT",
+            "api/widgets/bulk_update",
+            lambda request: (
+                200,
+                dict(results=[dict(widget._json_data, **request.json[0])]),
+                None,
+            ),
+        )
+        self.server.add_json_route(
+            "PUT", "api/activities/bulk_update", dict(results=[])
+        )
+
+        with self.client.unit_of_work() as uow:
+            activity.edit(name="Engineering")
+            widget.edit(meta=dict(html="<p>bike</p>"))
+            self.property_objects()[0].value = "new"
+            wheel = uow.add_part(
+                parent=bike,
+                model=model,
+                name="Front wheel",
+                update_dict={"Property 0": "steel"},
+            )
+
+        writes = [r for r in self.server.requests if r.path != "/api/versions.json"]
+        self.assertEqual(
+            [r.path for r in writes],
+            [
+                "/api/v3/parts/bulk_create_part_instances",
+                "/api/v3/parts.json",
+                "/api/v3/properties/bulk_update",
+                "/api/widgets/bulk_update",
+                "/api/activities/bulk_update",
+            ],
+        )
+        created = writes[0].json["parts"][0]
+        self.assertEqual(created["parent_id"], bike.id)
+        self.assertEqual(created["properties"][0]["value"], "steel")
+        self.assertEqual(wheel.result().id, wheel_json["id"])
+        self.assertEqual(writes[-1].json, [dict(id=activity.id, name="Engineering")])
+        self.assertEqual(widget.meta["html"], "<p>bike</p>")
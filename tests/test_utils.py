@@ -1,14 +1,25 @@
-from unittest import TestCase
+import re
+import timeit
+from datetime import datetime, timedelta, timezone
+from unittest import TestCase, mock, skipUnless
 
+import pytz
+
+from pykechain import Client
+from pykechain.models import Scope
+from pykechain.models.service import ServiceExecution
 from pykechain.utils import (
+    DATETIME_REGEX,
     Empty,
     get_in_chunks,
     get_offset_from_user_timezone,
     get_timezone_from_user,
     is_url,
-    is_valid_email
+    is_valid_email,
+    parse_datetime,
 )
 from tests.classes import TestBetamax
+from tests.utils import TEST_BENCHMARKS
 
 
 class TestIsURL(TestCase):
@@ -193,6 +204,136 @@ class TestChunks(TestCase):
         self.assertEqual(9, len(chunks_list))
 
 
+class TestParseDatetime(TestCase):
+    def test_formats(self):
+        values = {
+            "2024-07-02T10:20:30.123456Z": datetime(2024, 7, 2, 10, 20, 30, 123456, pytz.UTC),
+            "2024-07-02T10:20:30+02:00": datetime(2024, 7, 2, 8, 20, 30, tzinfo=pytz.UTC),
+            "2024-07-02 10:20:30.5-0130": datetime(2024, 7, 2, 11, 50, 30, 500000, pytz.UTC),
+            "2024-7-2T10:20+02": datetime(2024, 7, 2, 8, 20, tzinfo=pytz.UTC),
+            "2024-07-02T10:20:30": datetime(2024, 7, 2, 10, 20, 30),
+        }
+        for value, expected in values.items():
+            with self.subTest(value):
+                self.assertEqual(parse_datetime(value), expected)
+                self.assertEqual(parse_datetime(value).tzinfo is None, expected.tzinfo is None)
+
+    def test_timezones(self):
+        self.assertIs(parse_datetime("2024-07-02T10:20:30Z").tzinfo, pytz.UTC)
+
+        with_offset = parse_datetime("2024-07-02T10:20:30+02:00")
+        self.assertEqual(with_offset.tzname(), "+0200")
+        self.assertIs(with_offset.tzinfo, parse_datetime("2024-01-01T00:00+0200").tzinfo)
+
+    def test_invalid_values(self):
+        for value in [None, "", "2024-07-02", "20240702T102030", "2024-07-02T10:20:30,5"]:
+            with self.subTest(value):
+                self.assertIsNone(parse_datetime(value))
+
+        with self.assertRaises(ValueError):
+            parse_datetime("2024-02-30T10:20:30Z")
+
+    def test_fast_path_matches_regular_expression(self):
+        values = [
+            "2024-07-02T10:20:30Z",
+            "2024-07-02T10:20:30.1Z",
+            "2024-07-02T10:20:30.123Z",
+            "2024-07-02T10:20:30.123456Z",
+            "2024-07-02T10:20:30.1234567Z",
+            "2024-07-02T10:20:30.1234567890123Z",
+            "2024-07-02T10:20:30+00:00",
+            "2024-07-02T10:20:30.5+02:00",
+            "2024-07-02T10:20:30-01:30",
+            "2024-07-02T10:20:30+0530",
+            "2024-07-02T10:20:30+02",
+            "2024-07-02T10:20:30+02:00:30",
+            "2024-07-02T10:20:30+02:00:00",
+            "2024-07-02T10:20:30-02:00:00.5",
+            "2024-07-02T10:20:30+02:00Z",
+            "2024-07-02 10:20:30.123456-05:00",
+            "2024-07-02T10:20:30",
+            "2024-07-02T10:20",
+            "2024-7-2T10:20:30Z",
+            "2024-07-02T10:20:30,5Z",
+            "2024-07-02T10:20:30Zulu",
+            "2024-07-02T24:00:00Z",
+            "2024-13-02T10:20:30Z",
+            "2024-02-30T10:20:30Z",
+            "2024-07-02",
+            "",
+        ]
+
+        def outcome(value):
+            try:
+                result = parse_datetime(value)
+            except ValueError:
+                return ValueError
+            return result, result and result.utcoffset(), result and result.tzname()
+
+        for value in values:
+            with self.subTest(value):
+                fast = outcome(value)
+                with mock.patch("pykechain.utils._parse_isoformat", return_value=None):
+                    regex = outcome(value)
+                self.assertEqual(fast, regex)
+
+    @skipUnless(TEST_BENCHMARKS, "set TEST_BENCHMARKS=1 to run the benchmarks")
+    def test_benchmark(self):
+        value = "2024-07-02T10:20:30.123456+00:00"
+
+        def regex_parse():
+            # the parser of pykechain 4.12
+            kw = re.compile(DATETIME_REGEX.pattern).match(value).groupdict()
+            kw["microsecond"] = kw["microsecond"].ljust(6, "0")
+            tzinfo = kw.pop("tzinfo")
+            offset = 60 * int(tzinfo[1:3]) + int(tzinfo[-2:])
+            tzinfo = timezone(timedelta(minutes=offset), "%+03d%02d" % divmod(offset, 60))
+            return datetime(**{k: int(v) for k, v in kw.items()}, tzinfo=tzinfo)
+
+        self.assertEqual(parse_datetime(value), regex_parse())
+
+        fast = min(timeit.repeat(lambda: parse_datetime(value), number=2000, repeat=5))
+        regex = min(timeit.repeat(regex_parse, number=2000, repeat=5))
+        print(f"parse_datetime: {fast / 2 * 1e3:.2f} us, 4.12: {regex / 2 * 1e3:.2f} us")
+
+        self.assertLess(fast, regex)
+
+
+class TestLazyTimestamps(TestCase):
+    def setUp(self):
+        self.json = dict(
+            id="eeb0937b-da50-4eb2-8d74-f36259cca96e",
+            name="Bike project",
+            created_at="2024-07-02T10:20:30Z",
+            updated_at="2024-07-03T10:20:30Z",
+            start_date=None,
+        )
+
+    def test_parsed_on_first_access(self):
+        with mock.patch("pykechain.models.base.parse_datetime", wraps=parse_datetime) as parse:
+            scope = Scope(self.json, client=Client())
+            self.assertEqual(parse.call_count, 0)
+
+            self.assertEqual(scope.created_at, datetime(2024, 7, 2, 10, 20, 30, tzinfo=pytz.UTC))
+            self.assertEqual(scope.created_at.day, 2)
+            self.assertIsNone(scope.start_date)
+            self.assertEqual(parse.call_count, 2)
+
+    def test_assign_and_refresh(self):
+        scope = Scope(self.json, client=Client())
+        scope.updated_at += timedelta(days=1)
+        self.assertEqual(scope.updated_at.day, 4)
+
+        scope.refresh(json=dict(self.json, updated_at="2024-07-05T10:20:30Z"))
+        self.assertEqual(scope.updated_at.day, 5)
+
+    def test_delete(self):
+        execution = ServiceExecution(self.json, client=Client())
+
+        self.assertFalse(hasattr(execution, "updated_at"))
+        self.assertIsNone(getattr(execution, "created_at", None))
+
+
 class TestTimezoneHelperFunctions(TestBetamax):
     def setUp(self):
         super().setUp()
@@ -11,3 +11,4 @@ TEST_TOKEN = env("TEST_TOKEN", default="")
 TEST_SCOPE_ID = env("TEST_SCOPE_ID", default="bd5dceaa-a35e-47b0-9fc5-875410f4a56f")
 TEST_SCOPE_NAME = env("TEST_SCOPE_NAME", default="Bike Project")
 TEST_RECORD_CASSETTES = env.bool("TEST_RECORD_CASSETTES", default=True)
+TEST_BENCHMARKS = env.bool("TEST_BENCHMARKS", default=False)